@@ -0,0 +1,32 @@
+"""Microbenchmark of the per-call overhead of `bm.xxx(...)` against calling
+the NumPy functions directly."""
+import timeit
+
+import numpy as np
+from fealpy.backend import backend_manager as bm
+
+bm.set_backend('numpy')
+
+NUMBER = 200000
+a = np.ones(3)
+b = np.ones(3)
+index = np.array([0, 2])
+
+
+def per_call(stmt, **kwargs) -> float:
+    """Average time of a statement in nanoseconds."""
+    return timeit.timeit(stmt, number=NUMBER, globals=kwargs) / NUMBER * 1e9
+
+
+cases = [
+    ('add', 'np.add(a, b)', 'bm.add(a, b)'),
+    ('index_add', 'np.add.at(a, index, 1.0)', 'bm.index_add(a, index, 1.0)'),
+    ('pi (attribute)', 'np.pi', 'bm.pi'),
+]
+env = dict(np=np, bm=bm, a=a, b=b, index=index)
+
+print(f"{'case':<16}{'numpy (ns)':>12}{'bm (ns)':>12}{'overhead (ns)':>16}")
+for name, numpy_stmt, bm_stmt in cases:
+    t_np = per_call(numpy_stmt, **env)
+    t_bm = per_call(bm_stmt, **env)
+    print(f"{name:<16}{t_np:>12.0f}{t_bm:>12.0f}{t_bm - t_np:>16.0f}")
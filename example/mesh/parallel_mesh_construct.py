@@ -114,3 +114,22 @@ if RANK == 0:
 
     integral_on_nodes_expected = integral_on_mesh_cells_to_nodes(full_mesh, func_example)
     print("Test passed: ", bm.allclose(integral_on_all_nodes, integral_on_nodes_expected))
+
+
+##################################################
+# Example: the same with precomputed halo exchange
+# 例子：使用预先计算的通信模式完成上述求和，并更新虚点上的值
+##################################################
+
+integral_on_node = integral_on_mesh_cells_to_nodes(pmesh, func_example)
+integral_on_node = pmesh.Accumulate_ghost('node', integral_on_node) # 虚点的值加到实点上
+integral_on_node = pmesh.Update_ghost('node', integral_on_node) # 实点的值发送到虚点
+
+int_on_node_collected = COMM.gather((integral_on_node, pmesh.global_indices('node')), root=0)
+
+if RANK == 0:
+    passed = all(
+        bm.allclose(data, integral_on_nodes_expected[indices])
+        for data, indices in int_on_node_collected
+    )
+    print("Test passed (halo exchange): ", passed)
@@ -0,0 +1,81 @@
+"""Lazy loading of submodules and optional dependencies (PEP 562).
+
+Only the standard library is imported here, so that packages can use these
+helpers in their `__init__` without importing anything else.
+"""
+import importlib
+import importlib.util
+import sys
+import types
+from typing import Dict, Sequence, Optional, Tuple, Callable, List
+
+__all__ = ['attach', 'lazy_import']
+
+
+def attach(package_name: str, submod_attrs: Dict[str, Sequence[str]],
+           aliases: Optional[Dict[str, str]]=None) -> Tuple[Callable, Callable, List[str]]:
+    """Make the attributes of a package load their submodules on first access.
+
+    Parameters:
+        package_name (str): `__name__` of the package.
+        submod_attrs (Dict[str, Sequence[str]]): Names of the attributes,\
+            keyed by the relative names of the submodules defining them.
+        aliases (Dict[str, str], optional): Other names of the attributes,\
+            mapped to the attribute names. Defaults to None.
+
+    Returns:
+        Tuple[Callable, Callable, List[str]]: `__getattr__`, `__dir__` and\
+            `__all__` of the package.
+
+    Example:
+    ```
+        __getattr__, __dir__, __all__ = attach(__name__, {
+            'triangle_mesh': ['TriangleMesh'],
+        })
+    ```
+    """
+    aliases = {} if aliases is None else dict(aliases)
+    attr_to_module = {attr: mod for mod, attrs in submod_attrs.items() for attr in attrs}
+    __all__ = list(attr_to_module) + list(aliases)
+
+    def __getattr__(name: str):
+        attr = aliases.get(name, name)
+        if attr in attr_to_module:
+            module = importlib.import_module(f'{package_name}.{attr_to_module[attr]}')
+            value = getattr(module, attr)
+        elif importlib.util.find_spec(f'{package_name}.{name}') is not None:
+            # Submodules used as attributes without being imported.
+            value = importlib.import_module(f'{package_name}.{name}')
+        else:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])) | set(__all__))
+
+    return __getattr__, __dir__, __all__
+
+
+class _LazyModule(types.ModuleType):
+    """A placeholder importing the module on the first attribute access."""
+    def __getattr__(self, item):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, item)
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Import a module on the first use of its attributes, for heavy or
+    optional dependencies. ImportError is raised on the first use if the
+    module is not installed.
+
+    Parameters:
+        name (str): Absolute name of the module, e.g. 'sympy' or 'jax.numpy'.
+
+    Returns:
+        ModuleType: The module if already imported, otherwise a placeholder.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return _LazyModule(name)
@@ -0,0 +1,38 @@
+
+from functools import lru_cache
+from typing import Tuple, List, Any
+
+import numpy as np
+
+__all__ = ['einsum_path', 'clear_einsum_cache']
+
+Shape = Tuple[int, ...]
+
+_EINSUM_MAXSIZE = 1024
+
+
+def _dummy_operands(shapes: Tuple[Shape, ...]):
+    # The path search only reads the shapes, so zero-strided views are enough.
+    empty = np.empty((), dtype=np.float64)
+    return [np.broadcast_to(empty, s) for s in shapes]
+
+
+@lru_cache(maxsize=_EINSUM_MAXSIZE)
+def einsum_path(subscripts: str, shapes: Tuple[Shape, ...]) -> List[Any]:
+    """Contraction path of an einsum with the given operand shapes, in the form
+    accepted by the `optimize` argument of `numpy.einsum`.
+
+    Parameters:
+        subscripts (str): The subscripts of the einsum.
+        shapes (tuple): Shapes of the operands.
+
+    Returns:
+        list: The contraction path found by the greedy search.
+    """
+    path, _ = np.einsum_path(subscripts, *_dummy_operands(shapes), optimize='greedy')
+    return path
+
+
+def clear_einsum_cache() -> None:
+    """Clear the cached contraction paths."""
+    einsum_path.cache_clear()
@@ -2,11 +2,16 @@
 from typing import Dict, Optional
 import importlib
 import threading
+from operator import attrgetter
 
 from ..import logger
 from .base import BackendProxy
 
 
+class _BackendLocal(threading.local):
+    backend: Optional[BackendProxy] = None
+
+
 class BackendManager():
     # _instance = None
 
@@ -17,14 +22,14 @@ class BackendManager():
 
     def __init__(self, *, default_backend: Optional[str]=None):
         self._backends: Dict[str, BackendProxy] = {}
-        self._THREAD_LOCAL = threading.local()
+        self._THREAD_LOCAL = _BackendLocal()
         self._default_backend_name = default_backend
 
     def set_backend(self, name: str) -> None:
         """Set the current backend."""
         if name not in self._backends:
             self.load_backend(name)
-        self._THREAD_LOCAL.__dict__['backend'] = self._backends[name]
+        self._THREAD_LOCAL.backend = self._backends[name]
 
     def load_backend(self, name: str) -> None:
         """Load a backend by name."""
@@ -42,12 +47,14 @@ class BackendManager():
             # Backend proxy instances are singletons as there is no need to load twice.
             backend = BackendProxy._available_backends[name]()
             self._backends[name] = backend
+            for item in dir(backend):
+                self._bind_dispatcher(item)
         else:
             raise RuntimeError(f"Failed to load backend '{name}'.")
 
     def get_current_backend(self, logger_msg=None) -> BackendProxy:
         """Get the current backend."""
-        if 'backend' not in self._THREAD_LOCAL.__dict__:
+        if self._THREAD_LOCAL.backend is None:
             if self._default_backend_name is None:
                 raise RuntimeError(
                     f"Backend properties were accessed ({logger_msg}) "
@@ -58,11 +65,24 @@ class BackendManager():
             logger.info(f"Backend auto-setting triggered by {logger_msg}."
                         "To reduce unnecessary backend loading, "
                         "get backend properties and methods after executing set_backend()")
-        return self._THREAD_LOCAL.__dict__['backend']
+        return self._THREAD_LOCAL.backend
+
+    @classmethod
+    def _bind_dispatcher(cls, item: str) -> None:
+        # NOTE: Attributes of backends are dispatched by properties on this class,
+        # reading the backend of the current thread in C (operator.attrgetter).
+        # This avoids the slow path of `__getattr__` for every call of `bm.xxx`.
+        # If the thread has no backend yet, or the backend lacks the attribute,
+        # the AttributeError raised by the property falls back to `__getattr__`.
+        if item.startswith('_') or hasattr(cls, item):
+            return
+        setattr(cls, item, property(attrgetter('_THREAD_LOCAL.backend.' + item)))
 
     def __getattr__(self, item):
         """Redirct attribute access to the current backend."""
-        return getattr(self.get_current_backend("GET_ATTR: " + item), item)
+        value = getattr(self.get_current_backend(f"GET_ATTR: {item}"), item)
+        self._bind_dispatcher(item)
+        return value
 
     def __setattr__(self, key, value):
         """Redirct attribute access to the current backend."""
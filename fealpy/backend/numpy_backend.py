@@ -7,7 +7,6 @@ from itertools import combinations_with_replacement
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.spatial import KDTree
 from numpy.linalg import det
 from scipy.sparse._sparsetools import coo_matvec, csr_matvec, csr_matvecs, coo_tocsr
 
@@ -15,6 +14,7 @@ from .base import (
     ModuleProxy, BackendProxy,
     ATTRIBUTE_MAPPING, FUNCTION_MAPPING
 )
+from .einsum_cache import einsum_path
 
 
 def _remove_device(func):
@@ -93,7 +93,14 @@ class NumPyBackend(BackendProxy, backend_name='numpy'):
     # non-standard
     @staticmethod
     def einsum(*args, **kwargs):
-        return np.einsum(*args, **kwargs, optimize=True)
+        if 'optimize' in kwargs:
+            return np.einsum(*args, **kwargs)
+        subscripts, *operands = args
+        if (not isinstance(subscripts, str)) or len(operands) < 3:
+            return np.einsum(*args, **kwargs, optimize=True)
+        # Reuse the contraction path found for the same subscripts and shapes.
+        path = einsum_path(subscripts, tuple(np.shape(x) for x in operands))
+        return np.einsum(*args, **kwargs, optimize=path)
 
     ### Manipulation Functions ###
     # python array API standard v2023.12
@@ -176,8 +183,8 @@ class NumPyBackend(BackendProxy, backend_name='numpy'):
             else:
                 raise ValueError("`other` must be a 1-D or 2-D array.")
         else:
-            raise NotImplementedError("Batch sparse matrix multiplication has "
-                                      "not been supported yet.")
+            crow, order = NumPyBackend._coo_row_order(row, shape[0])
+            return NumPyBackend._batched_csr_spmm(crow, col[order], values[..., order], shape, other)
 
     @staticmethod
     def csr_spmm(crow, col, values, shape, other):
@@ -197,8 +204,43 @@ class NumPyBackend(BackendProxy, backend_name='numpy'):
             else:
                 raise ValueError("`other` must be a 1-D or 2-D array.")
         else:
-            raise NotImplementedError("Batch sparse matrix multiplication has "
-                                      "not been supported yet.")
+            return NumPyBackend._batched_csr_spmm(crow, col, values, shape, other)
+
+    @staticmethod
+    def _coo_row_order(row, nrow):
+        """Sort the entries by rows, returning crow and the order of entries."""
+        order = np.argsort(row, kind='stable')
+        crow = np.zeros(nrow + 1, dtype=row.dtype)
+        np.cumsum(np.bincount(row, minlength=nrow), out=crow[1:])
+        return crow, order
+
+    @staticmethod
+    def _batched_csr_spmm(crow, col, values, shape, other):
+        """Multiply matrices sharing one CSR pattern, with values shaped
+        (*batch, nnz), in a single pass over the pattern."""
+        M = shape[0]
+        nnz = values.shape[-1]
+
+        if other.ndim == 1:
+            prod = values * other[col] # (*batch, nnz)
+            axis = prod.ndim - 1
+        else:
+            prod = values[..., None] * other[..., col, :] # (*batch, nnz, k)
+            axis = prod.ndim - 2
+
+        if nnz == 0:
+            result_shape = prod.shape[:axis] + (M, ) + prod.shape[axis+1:]
+            return np.zeros(result_shape, dtype=prod.dtype)
+
+        # reduceat sums prod[crow[i]:crow[i+1]], but returns prod[crow[i]]
+        # for empty rows, which are reset to zero afterwards.
+        result = np.add.reduceat(prod, np.minimum(crow[:-1], nnz - 1), axis=axis)
+        empty = (crow[1:] == crow[:-1])
+        if np.any(empty):
+            indexing = [slice(None)] * result.ndim
+            indexing[axis] = empty
+            result[tuple(indexing)] = 0
+        return result
 
     @staticmethod
     def csr_spspmm(crow1, col1, values1, shape1, crow2, col2, values2, shape2):
@@ -213,6 +255,12 @@ class NumPyBackend(BackendProxy, backend_name='numpy'):
         M, N = shape
         idx_dtype = indices.dtype
         major, minor = indices
+
+        if values.ndim > 1:
+            # Sort the shared pattern once for all batches.
+            crow, order = NumPyBackend._coo_row_order(major, M)
+            return crow, minor[order], values[..., order]
+
         nnz = len(values)
         crow = np.empty(M+1, dtype=idx_dtype)
         col = np.empty_like(minor, dtype=idx_dtype)
@@ -299,6 +347,7 @@ class NumPyBackend(BackendProxy, backend_name='numpy'):
         if all(periodic):
             map_x, map_idx_x, map_bool_x = map_points(box_size[0], box_size[1], h, x)
             map_y , map_idx_y, map_bool_y= map_points(box_size[0], box_size[1], h, y)
+            from scipy.spatial import KDTree
             tree = KDTree(map_x)
             neighbors = tree.query_ball_point(map_y, h)
             lengths = np.array([len(sublist) for sublist in neighbors]) 
@@ -315,6 +364,7 @@ class NumPyBackend(BackendProxy, backend_name='numpy'):
                 neighbors = neighbors[~mask]
 
         elif not any(periodic):
+            from scipy.spatial import KDTree
             tree = KDTree(x)
             neighbors = tree.query_ball_point(y, h)
             lengths = np.array([len(sublist) for sublist in neighbors])  
@@ -3,7 +3,6 @@ from typing import Union, Optional, Tuple, Any
 from itertools import combinations_with_replacement
 from functools import reduce, partial
 from math import factorial, prod
-from scipy.spatial import KDTree
 
 try:
     import torch
@@ -614,6 +613,7 @@ class PyTorchBackend(BackendProxy, backend_name='pytorch'):
         if all(periodic):
             map_x, map_idx_x, map_bool_x = map_points(box_size[0], box_size[1], h, x)
             map_y , map_idx_y, map_bool_y= map_points(box_size[0], box_size[1], h, y)
+            from scipy.spatial import KDTree
             tree = KDTree(map_x)
             neighbors = tree.query_ball_point(map_y, h)
             lengths = torch.tensor([len(sublist) for sublist in neighbors]) 
@@ -630,6 +630,7 @@ class PyTorchBackend(BackendProxy, backend_name='pytorch'):
                 neighbors = neighbors[~mask]
             
         elif not any(periodic):
+            from scipy.spatial import KDTree
             tree = KDTree(x)
             neighbors = tree.query_ball_point(y, h)
             lengths = torch.tensor([len(sublist) for sublist in neighbors]) 
@@ -2,56 +2,64 @@
 
 ### Forms and bases
 from .integrator import *
-from .bilinear_form import BilinearForm
-from .linear_form import LinearForm
-from .nonlinear_form import NonlinearForm
-from .block_form import BlockForm
-from .linear_block_form import LinearBlockForm
-
-### Cell Operator
-from .scalar_diffusion_integrator import ScalarDiffusionIntegrator
-from .scalar_nonlinear_diffusion_integrator import ScalarNonlinearDiffusionIntegrator
-from .scalar_mass_integrator import ScalarMassIntegrator
-from .scalar_nonlinear_mass_integrator import ScalarNonlinearMassIntegrator
-from .scalar_convection_integrator import ScalarConvectionIntegrator
-from .linear_elastic_integrator import LinearElasticIntegrator
-from .press_work_integrator import PressWorkIntegrator, PressWorkIntegratorX, PressWorkIntegratorY
-from .vector_mass_integrator import VectorMassIntegrator
-from .curlcurl_integrator import CurlCurlIntegrator
-from .nonlinear_elastic_integrator import NonlinearElasticIntegrator
-from .div_integrator import DivIntegrator
-from .viscous_work_integrator import ViscousWorkIntegrator
-from .scalar_biharmonic_integrator import ScalarBiharmonicIntegrator
-
-### Cell Source
-from .cell_source_integrator import CellSourceIntegrator
-SourceIntegrator = CellSourceIntegrator
-
-from .grad_source_integrator import GradSourceIntegrator
-from .scalar_source_integrator import ScalarSourceIntegrator
-from .vector_source_integrator import VectorSourceIntegrator
-
-### Face Operator
-from .scalar_robin_bc_integrator import ScalarRobinBCIntegrator
-from .face_mass_integrator import BoundaryFaceMassIntegrator, InterFaceMassIntegrator
-from .fluid_boundary_friction_integrator import FluidBoundaryFrictionIntegrator
-from .scalar_interior_penalty_integrator import ScalarInteriorPenaltyIntegrator
-
-### Face Source
-from .scalar_neumann_bc_integrator import ScalarNeumannBCIntegrator, ScalarRobinSourceIntegrator
-from .face_source_integrator import BoundaryFaceSourceIntegrator, InterFaceSourceIntegrator
-
-### Dirichlet BC
-from .dirichlet_bc import DirichletBC
-from .dirichlet_bc_operator import DirichletBCOperator
-
-### recovery estimate
-from .recovery_alg import RecoveryAlg
-
-### Other
-from .nonlinear_wrapper import NonlinearWrapperInt
-
-
-### solver
-from .poisson_lfem_solver import PoissonLFEMSolver
-from .linear_elasticity_lfem_solver import LinearElasticityLFEMSolver
+
+# NOTE: Forms and integrators are imported on first access (PEP 562), so that
+# importing this package does not load every integrator and their dependencies.
+from .._lazy import attach
+from .integrator import __all__ as _integrator_all
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'bilinear_form': ['BilinearForm'],
+    'linear_form': ['LinearForm'],
+    'nonlinear_form': ['NonlinearForm'],
+    'block_form': ['BlockForm'],
+    'linear_block_form': ['LinearBlockForm'],
+
+    ### Cell Operator
+    'scalar_diffusion_integrator': ['ScalarDiffusionIntegrator'],
+    'scalar_nonlinear_diffusion_integrator': ['ScalarNonlinearDiffusionIntegrator'],
+    'scalar_mass_integrator': ['ScalarMassIntegrator'],
+    'scalar_nonlinear_mass_integrator': ['ScalarNonlinearMassIntegrator'],
+    'scalar_convection_integrator': ['ScalarConvectionIntegrator'],
+    'linear_elastic_integrator': ['LinearElasticIntegrator'],
+    'press_work_integrator': ['PressWorkIntegrator', 'PressWorkIntegratorX', 'PressWorkIntegratorY'],
+    'vector_mass_integrator': ['VectorMassIntegrator'],
+    'curlcurl_integrator': ['CurlCurlIntegrator'],
+    'nonlinear_elastic_integrator': ['NonlinearElasticIntegrator'],
+    'div_integrator': ['DivIntegrator'],
+    'viscous_work_integrator': ['ViscousWorkIntegrator'],
+    'scalar_biharmonic_integrator': ['ScalarBiharmonicIntegrator'],
+
+    ### Cell Source
+    'cell_source_integrator': ['CellSourceIntegrator'],
+
+    'grad_source_integrator': ['GradSourceIntegrator'],
+    'scalar_source_integrator': ['ScalarSourceIntegrator'],
+    'vector_source_integrator': ['VectorSourceIntegrator'],
+
+    ### Face Operator
+    'scalar_robin_bc_integrator': ['ScalarRobinBCIntegrator'],
+    'face_mass_integrator': ['BoundaryFaceMassIntegrator', 'InterFaceMassIntegrator'],
+    'fluid_boundary_friction_integrator': ['FluidBoundaryFrictionIntegrator'],
+    'scalar_interior_penalty_integrator': ['ScalarInteriorPenaltyIntegrator'],
+
+    ### Face Source
+    'scalar_neumann_bc_integrator': ['ScalarNeumannBCIntegrator', 'ScalarRobinSourceIntegrator'],
+    'face_source_integrator': ['BoundaryFaceSourceIntegrator', 'InterFaceSourceIntegrator'],
+
+    ### Dirichlet BC
+    'dirichlet_bc': ['DirichletBC'],
+    'dirichlet_bc_operator': ['DirichletBCOperator'],
+
+    ### recovery estimate
+    'recovery_alg': ['RecoveryAlg'],
+
+    ### Other
+    'nonlinear_wrapper': ['NonlinearWrapperInt'],
+    'sum_factorization': ['SumFactorizedOperator', 'SumFactorizedMass', 'SumFactorizedDiffusion'],
+
+    ### solver
+    'poisson_lfem_solver': ['PoissonLFEMSolver'],
+    'linear_elasticity_lfem_solver': ['LinearElasticityLFEMSolver'],
+}, aliases={'SourceIntegrator': 'CellSourceIntegrator'})
+__all__ = list(_integrator_all) + __all__
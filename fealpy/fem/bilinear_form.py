@@ -4,13 +4,17 @@ from typing import Optional, Literal, overload
 from .. import logger
 from ..typing import TensorLike
 from ..backend import backend_manager as bm
-from ..sparse import COOTensor, CSRTensor
+from ..sparse import COOTensor, CSRTensor, MemmapCSRBuilder
 from .form import Form
 from .integrator import LinearInt
+from .sum_factorization import SumFactorizedOperator
 
 
 class BilinearForm(Form[LinearInt]):
     _M = None
+    _keep_pattern = False
+    _pattern = None
+    _local = None
 
     def _get_sparse_shape(self):
         spaces = self._spaces
@@ -43,78 +47,353 @@ class BilinearForm(Form[LinearInt]):
                 raise ValueError("Spaces should have the same dtype, "
                                 f"but got {s0.ftype} and {s1.ftype}.")
 
-    def _scalar_assembly(self):
+    def _count_local_entries(self) -> int:
+        """Count the number of local entries of all groups from the shape of
+        entity-to-global relationships, without evaluating the integrators.
+        Only shapes are used; the full maps are served from the dof cache of
+        the spaces (and from the integrator cache with keep_data)."""
+        nnz = 0
+        for integrator in self.integrators.values():
+            etg = integrator.to_global_dof(self.space)
+            if not isinstance(etg, (tuple, list)):
+                etg = (etg, )
+            ue2dof = etg[0]
+            ve2dof = etg[1] if (len(etg) > 1) else ue2dof
+            nnz += ue2dof.shape[0] * ve2dof.shape[1] * ue2dof.shape[1]
+        return nnz
+
+    def _scalar_assembly(self, workers: Optional[int]=None):
         self.check_space()
         space = self._spaces
         batch_size = self.batch_size
         ugdof = space[0].number_of_global_dofs()
         vgdof = space[1].number_of_global_dofs() if (len(space) > 1) else ugdof
-        init_value_shape = (0,) if (batch_size == 0) else (batch_size, 0)
         sparse_shape = (vgdof, ugdof)
+        device = bm.get_device(space[0])
+
+        # Triplets of all groups and chunks are written into one buffer,
+        # avoiding concatenations of the indices and values for each chunk.
+        nnz = self._count_local_entries()
+        value_shape = (nnz, ) if (batch_size == 0) else (batch_size, nnz)
+        indices = bm.empty((2, nnz), dtype=space[0].itype, device=device)
+        values = None
+        cursor = 0
 
-        M = COOTensor(
-            indices = bm.empty((2, 0), dtype=space[0].itype, device=bm.get_device(space[0])),
-            values = bm.empty(init_value_shape, dtype=space[0].ftype, device=bm.get_device(space[0])),
-            spshape = sparse_shape
-        )
-        # for group in self.integrators.keys():
-            # group_tensor, e2dofs = self._assembly_group(group, retain_ints)
-        for group_tensor, e2dofs_tuple in self.assembly_local_iterative():
+        for group_tensor, e2dofs_tuple in self.assembly_local_iterative(workers=workers):
             ue2dof = e2dofs_tuple[0]
             ve2dof = e2dofs_tuple[1] if (len(e2dofs_tuple) > 1) else ue2dof
             local_shape = group_tensor.shape[-3:] # (NC, vldof, uldof)
+            size = local_shape[0] * local_shape[1] * local_shape[2]
 
-            if (batch_size > 0) and (group_tensor.ndim == 3): # Case: no batch dimension
-                group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
+            if cursor + size > nnz:
+                raise RuntimeError("Local tensors of integrators have more entries "
+                                   "than their entity-to-global relationships.")
+            if values is None:
+                values = bm.empty(value_shape, **bm.context(group_tensor))
+
+            chunk = slice(cursor, cursor + size)
             I = bm.broadcast_to(ve2dof[:, :, None], local_shape)
             J = bm.broadcast_to(ue2dof[:, None, :], local_shape)
-            indices = bm.stack([I.ravel(), J.ravel()], axis=0)
+            indices = bm.set_at(indices, (0, chunk), I.ravel())
+            indices = bm.set_at(indices, (1, chunk), J.ravel())
+            # NOTE: Local tensors without the batch dimension are broadcasted.
+            group_tensor = bm.reshape(group_tensor, group_tensor.shape[:-3] + (size, ))
+            values = bm.set_at(values, (..., chunk), group_tensor)
+            cursor += size
+
+        if cursor != nnz:
+            raise RuntimeError("Local tensors of integrators have fewer entries "
+                               "than their entity-to-global relationships.")
+        if values is None:
+            values = bm.empty(value_shape, dtype=space[0].ftype, device=device)
+
+        return COOTensor(indices, values, sparse_shape)
+
+    def _add_integrator_impl(self, I, group=None, splitter=None):
+        self._pattern = None
+        self._local = None
+        return super()._add_integrator_impl(I, group, splitter)
+
+    ### START: Pattern Reuse ###
+    def keep_pattern(self, status_on=True, /):
+        """Set whether to keep the sparsity pattern of the global matrix.
+
+        When enabled, the next `assembly()` records the coalesced pattern and
+        the slot of every local entry in the values of the global matrix.
+        Later assemblies only evaluate the integrators and scatter-add the local
+        tensors into the recorded slots, skipping index generation and sorting.
+
+        Calling this method always drops the recorded pattern. Call it again
+        if the mesh, the spaces or the regions of integrators are changed.
+        """
+        self._keep_pattern = status_on
+        self._pattern = None
+        return self
+
+    def _record_pattern(self, M: COOTensor):
+        """Coalesce the COO tensor, recording the pattern for later assembly.
+        Returns values of the coalesced tensor."""
+        indices = M.indices
+        order = bm.lexsort(tuple(reversed(indices)))
+        sorted_indices = indices[:, order]
+        unique_mask = bm.concat([
+            bm.ones((1, ), dtype=bm.bool, device=bm.get_device(sorted_indices)),
+            bm.any(sorted_indices[:, 1:] - sorted_indices[:, :-1], axis=0)
+        ], axis=0)
+        new_indices = bm.copy(sorted_indices[..., unique_mask])
+        add_index = bm.cumsum(unique_mask, axis=0) - 1
+        slot = bm.set_at(bm.empty_like(order), order, add_index)
+        kwargs = bm.context(new_indices)
+        crow = bm.zeros((M.sparse_shape[0] + 1, ), **kwargs)
+        crow = bm.index_add(crow, new_indices[0] + 1, bm.ones((new_indices.shape[1], ), **kwargs))
+        crow = bm.astype(bm.cumsum(crow, axis=0), new_indices.dtype)
+        self._pattern = (new_indices, crow, slot, M.sparse_shape)
+
+        values = bm.zeros(M.dense_shape + (new_indices.shape[1], ), **M.values_context())
+        return bm.index_add(values, slot, M.values, axis=-1)
+
+    def _pattern_assembly(self, workers: Optional[int]=None):
+        """Assembly values of the global matrix on the recorded pattern."""
+        slot = self._pattern[2]
+        batch_size = self.batch_size
+        nnz = self._pattern[0].shape[1]
+        values = None
+        cursor = 0
+
+        for group_tensor, _ in self.assembly_local_iterative(with_etg=False, workers=workers):
+            if (batch_size > 0) and (group_tensor.ndim == 3): # Case: no batch dimension
+                group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
             group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
-            M = M.add(COOTensor(indices, group_tensor, sparse_shape))
+            size = group_tensor.shape[-1]
+            if values is None:
+                values = bm.zeros(group_tensor.shape[:-1] + (nnz, ), **bm.context(group_tensor))
+            values = bm.index_add(values, slot[cursor:cursor+size], group_tensor, axis=-1)
+            cursor += size
+
+        if cursor != slot.shape[0]:
+            raise RuntimeError("The number of local entries does not match the recorded "
+                               "sparsity pattern. Call keep_pattern() to rebuild it.")
 
-        return M
+        return values
+
+    def _from_pattern(self, values: TensorLike, format: str):
+        indices, crow, _, spshape = self._pattern
+        if format == 'csr':
+            return CSRTensor(crow, indices[1], values, spshape)
+        return COOTensor(indices, values, spshape, is_coalesced=True)
+    ### END: Pattern Reuse ###
 
     @overload
-    def assembly(self) -> CSRTensor: ...
+    def assembly(self, *, workers: Optional[int]=None) -> CSRTensor: ...
     @overload
-    def assembly(self, *, format: Literal['coo']) -> COOTensor: ...
+    def assembly(self, *, format: Literal['coo'], workers: Optional[int]=None) -> COOTensor: ...
     @overload
-    def assembly(self, *, format: Literal['csr']) -> CSRTensor: ...
-    def assembly(self, *, format='csr'):
+    def assembly(self, *, format: Literal['csr'], workers: Optional[int]=None) -> CSRTensor: ...
+    def assembly(self, *, format='csr', workers: Optional[int]=None):
         """Assembly the bilinear form matrix.
 
         Parameters:
             format (str, optional): Layout of the output ('csr' | 'coo'). Defaults to 'csr'.\n
-            retain_ints (bool, optional): Whether to retain the integrator cache.csr
+            workers (int | None, optional): Number of threads evaluating integrators
+                on groups and splitter chunks concurrently. Defaults to None (serial).
 
         Returns:
             global_matrix (CSRTensor | COOTensor): Global sparse matrix shaped ([batch, ]gdof, gdof).
         """
-        M = self._scalar_assembly()
+        if format not in {'csr', 'coo'}:
+            raise ValueError(f"Unsupported format {format}.")
+
+        if self._pattern is not None:
+            self._M = self._from_pattern(self._pattern_assembly(workers), format)
+            logger.info(f"Bilinear form matrix constructed on the recorded pattern, "
+                        f"with shape {list(self._M.shape)}.")
+            return self._M
+
+        M = self._scalar_assembly(workers)
         if getattr(self, '_transposed', False):
             M = M.T
 
-        if format == 'csr':
+        if self._keep_pattern and (M.nnz > 0):
+            self._M = self._from_pattern(self._record_pattern(M), format)
+        elif format == 'csr':
             self._M = M.coalesce().tocsr()
-        elif format == 'coo':
-            self._M = M.coalesce()
         else:
-            raise ValueError(f"Unsupported format {format}.")
+            self._M = M.coalesce()
         logger.info(f"Bilinear form matrix constructed, with shape {list(self._M.shape)}.")
 
         return self._M
 
+    def assembly_out_of_core(self, directory: str, *, block_size: int=2**24,
+                             workers: Optional[int]=None) -> CSRTensor:
+        """Assembly the bilinear form matrix into memory-mapped files, for
+        matrices larger than the memory. Only supported by the NumPy backend.
+
+        Local tensors of each group or splitter chunk are coalesced and written
+        to disk at once, and merged into the CSR matrix at the end, see
+        `fealpy.sparse.MemmapCSRBuilder`. Use splitters of integrators to bound
+        the size of local tensors in memory.
+
+        Parameters:
+            directory (str): Directory of the files.\n
+            block_size (int, optional): Number of entries merged in memory at a time.
+                Defaults to 2**24.\n
+            workers (int | None, optional): Number of threads evaluating integrators
+                on groups and splitter chunks concurrently. Defaults to None (serial).
+
+        Returns:
+            global_matrix (CSRTensor): Global sparse matrix shaped (gdof, gdof),\
+            whose crow, col and values are read-only memory maps.
+        """
+        if bm.backend_name != 'numpy':
+            raise RuntimeError("Out-of-core assembly is only supported by the NumPy "
+                               f"backend, but the current backend is {bm.backend_name}.")
+        if self.batch_size > 0:
+            raise NotImplementedError("Out-of-core assembly does not support batches.")
+        self.check_space()
+        transposed = getattr(self, '_transposed', False)
+        builder = MemmapCSRBuilder(directory, self.sparse_shape,
+                                   itype=self._spaces[0].itype, block_size=block_size)
+
+        for group_tensor, e2dofs_tuple in self.assembly_local_iterative(workers=workers):
+            ue2dof = e2dofs_tuple[0]
+            ve2dof = e2dofs_tuple[1] if (len(e2dofs_tuple) > 1) else ue2dof
+            local_shape = group_tensor.shape[-3:]
+            I = bm.broadcast_to(ve2dof[:, :, None], local_shape)
+            J = bm.broadcast_to(ue2dof[:, None, :], local_shape)
+            if transposed:
+                I, J = J, I
+            builder.add(I, J, group_tensor)
+
+        self._M = builder.finalize()
+        logger.info(f"Bilinear form matrix constructed out of core in {directory}, "
+                    f"with shape {list(self._M.shape)}.")
+        return self._M
+
+    ### START: Matrix-free Operator ###
+    def clear(self):
+        """Clear the assembled matrix and the cached local tensors.
+        Call this after coefficients of integrators are changed."""
+        self._M = None
+        self._local = None
+        return self
+
+    def local_tensors(self):
+        """Fetch the local tensors and entity-to-global relationships of all
+        groups and splitter chunks. They are evaluated once and cached until
+        `clear()` is called or integrators are added.
+
+        Integrators with the 'sumfac' method provide local operators applied by
+        sum factorization instead of local tensors, if supported.
+
+        Returns:
+            List[Tuple[TensorLike | SumFactorizedOperator, TensorLike, TensorLike]]: A list of\
+            (local_tensor, ue2dof, ve2dof) for each group or chunk.
+        """
+        if self._local is None:
+            local = []
+            for key, indices in self._assembly_tasks():
+                op = self._local_operator(key, indices)
+                if op is None:
+                    group_tensor, e2dofs_tuple = self._assembly_kernel(key, indices)
+                else:
+                    integrator = self.integrators[key]
+                    if indices is None:
+                        e2dofs_tuple = integrator.to_global_dof(self.space)
+                    else:
+                        e2dofs_tuple = integrator.to_global_dof(self.space, indices=indices)
+                    if not isinstance(e2dofs_tuple, (tuple, list)):
+                        e2dofs_tuple = (e2dofs_tuple, )
+                    group_tensor = op
+                ue2dof = e2dofs_tuple[0]
+                ve2dof = e2dofs_tuple[1] if (len(e2dofs_tuple) > 1) else ue2dof
+                local.append((group_tensor, ue2dof, ve2dof))
+            self._local = local
+        return self._local
+
+    def _local_operator(self, group: str, indices=None):
+        integrator = self.integrators[group]
+        if (getattr(integrator, '_method', None) != 'sumfac') or \
+                (not hasattr(integrator, 'local_operator')):
+            return None
+        if indices is None:
+            return integrator.local_operator(self.space)
+        return integrator.local_operator(self.space, indices=indices)
+
+    def diagonal(self) -> TensorLike:
+        """Main diagonal of the matrix, for example for Jacobi preconditioners.
+        Evaluated from the local tensors or operators if not assembled.
+
+        Returns:
+            TensorLike: The diagonal shaped ([batch, ]gdof, ).
+        """
+        if self._M is not None:
+            return self._M.tocsr().diagonal()
+        if len(self._spaces) > 1:
+            raise ValueError("Diagonal of a matrix-free bilinear form requires one space.")
+
+        batch_shape = (self.batch_size, ) if (self.batch_size > 0) else ()
+        diag = None
+        for group_tensor, ue2dof, _ in self.local_tensors():
+            if isinstance(group_tensor, SumFactorizedOperator):
+                local_diag = group_tensor.diagonal()
+            else:
+                local_diag = bm.einsum('...ii -> ...i', group_tensor)
+            if diag is None:
+                diag = bm.zeros(batch_shape + (self.sparse_shape[0], ), **bm.context(local_diag))
+            local_diag = bm.reshape(local_diag, local_diag.shape[:-2] + (-1, ))
+            local_diag = bm.broadcast_to(local_diag, batch_shape + local_diag.shape[-1:])
+            diag = bm.index_add(diag, ue2dof.reshape(-1), local_diag, axis=-1)
+
+        if diag is None:
+            diag = bm.zeros(batch_shape + (self.sparse_shape[0], ), dtype=self.space.ftype,
+                            device=bm.get_device(self.space))
+        return diag
+
     def mult(self, x: TensorLike, out: Optional[TensorLike]=None) -> TensorLike:
         """Maxtrix vector multiplication.
 
         Parameters:
-            x (TensorLike): Vector, accepts batch on the first dimension.\n
+            x (TensorLike): Vector shaped (gdof, ) or (gdof, n) for n vectors.\n
             out (TensorLike, optional): Output vector. Defaults to None.
 
         Returns:
-            TensorLike: self @ x
+            TensorLike: self @ x, shaped ([batch, ]gdof, ) or ([batch, ]gdof, n).
         """
-        raise NotImplementedError
+        if self._M is not None:
+            result = self._M @ x
+        else:
+            result = self._matrix_free_mult(x)
+
+        if out is None:
+            return result
+        return bm.set_at(out, ..., result)
+
+    def _matrix_free_mult(self, u: TensorLike):
+        # Gather the local vectors, apply local tensors and scatter to the output.
+        transposed = getattr(self, '_transposed', False)
+        nrow = self.sparse_shape[0]
+        u2d = bm.reshape(u, (u.shape[0], -1)) # (gdof, n)
+        batch_shape = (self.batch_size, ) if (self.batch_size > 0) else ()
+        v = bm.zeros(batch_shape + (nrow, u2d.shape[-1]), **bm.context(u))
+
+        for group_tensor, ue2dof, ve2dof in self.local_tensors():
+            if transposed:
+                ue2dof, ve2dof = ve2dof, ue2dof
+                gt_subs = '...cji'
+            else:
+                gt_subs = '...cij'
+            gu = u2d[ue2dof] # (NC, uldof, n)
+            if isinstance(group_tensor, SumFactorizedOperator):
+                # NOTE: Sum-factorized operators are symmetric.
+                gv = group_tensor(gu)
+            else:
+                gv = bm.einsum(f'{gt_subs}, cjk -> ...cik', group_tensor, gu)
+            gv = bm.reshape(gv, gv.shape[:-3] + (-1, gv.shape[-1]))
+            gv = bm.broadcast_to(gv, v.shape[:-2] + gv.shape[-2:])
+            v = bm.index_add(v, ve2dof.reshape(-1), gv, axis=-2)
+
+        return bm.reshape(v, batch_shape + (nrow, ) + tuple(u.shape[1:]))
+    ### END: Matrix-free Operator ###
 
     @property
     def T(self):
@@ -124,38 +403,4 @@ class BilinearForm(Form[LinearInt]):
         return transposed
 
     def __matmul__(self, u: TensorLike):
-        if self._M is not None:
-            return self._M @ u
-
-        nrow = self.shape[-2]
-        kwargs = bm.context(u)
-
-        if self.batch_size > 0:
-            shape = (self.batch_size, nrow)
-            out_subs = 'bci'
-            gv_reshape = (self.batch_size, -1)
-        else:
-            if u.ndim >= 2:
-                shape = (u.shape[0], nrow)
-                out_subs = 'bci'
-                gv_reshape = (u.shape[0], -1)
-            else:
-                shape = (nrow,)
-                out_subs = 'ci'
-                gv_reshape = (-1,)
-
-        v = bm.zeros(shape, **kwargs)
-        gt_subs = 'bcij' if (self.batch_size > 0) else 'cij'
-        gu_subs = 'bcj' if (u.ndim >= 2) else 'cj'
-
-        for group in self.integrators.keys():
-            group_tensor, e2dofs = self._assembly_group(group, True)
-            ue2dof = e2dofs[0]
-            ve2dof = e2dofs[1] if (len(e2dofs) > 1) else ue2dof
-            gu = u[..., ue2dof] # (..., NC, uldof)
-            gv = bm.einsum(f'{gt_subs}, {gu_subs} -> {out_subs}', group_tensor, gu)
-            v = bm.index_add(v, ve2dof.reshape(-1), gv.reshape(gv_reshape))
-
-        return v
-
-
+        return self.mult(u)
@@ -132,15 +132,32 @@ class DirichletBC():
             SparseTensor: New adjusted left-hand-size matrix.
         """
         A = self.check_matrix(matrix) if check else matrix
-        isDDof = self.is_boundary_dof
+        isDDof = self.boundary_dof_flag()
+        values = _eliminate_values(A, isDDof)
+
+        if values is not None:
+            if isinstance(A, CSRTensor):
+                return CSRTensor(A.crow, A.col, values, A.sparse_shape)
+            return COOTensor(A.indices, values, A.sparse_shape, is_coalesced=A.is_coalesced)
+
+        # Some boundary rows miss the diagonal entry in the pattern.
         kwargs = A.values_context()
-        bdIdx = bm.zeros(A.shape[0], **kwargs)
-        bdIdx[isDDof.reshape(-1)] = 1
+        bdIdx = bm.astype(isDDof, kwargs['dtype'])
         D0 = spdiags(1-bdIdx, 0, A.shape[0], A.shape[0])
         D1 = spdiags(bdIdx, 0, A.shape[0], A.shape[0])
+        if isinstance(A, COOTensor):
+            return (D0@A.tocsr()@D0 + D1).tocoo()
         A = D0@A@D0 + D1
         return A
 
+    def boundary_dof_flag(self) -> TensorLike:
+        """Return the boolean flag of the Dirichlet DoFs, shaped (gdof, )."""
+        isDDof = self.is_boundary_dof.reshape(-1)
+        if isDDof.dtype == bm.bool:
+            return isDDof
+        flag = bm.zeros((int(self.gdof), ), dtype=bm.bool, device=bm.get_device(isDDof))
+        return bm.set_at(flag, isDDof, True)
+
     def apply_vector(self, vector: TensorLike, matrix: SparseTensor,
                      uh: Optional[TensorLike]=None,
                      gd: Optional[CoefLike]=None, *, check=True) -> TensorLike:
@@ -217,6 +234,42 @@ class DirichletBC():
     #     return A, f
 
 
+def _eliminate_values(A: Union[COOTensor, CSRTensor], isDDof: TensorLike) -> Optional[TensorLike]:
+    """Zero the values in the rows and columns of Dirichlet DoFs and set the
+    diagonal to one, keeping the sparsity pattern.
+
+    Returns None if any Dirichlet row has no diagonal entry in the pattern.
+    For duplicated diagonal entries, one of them is set to one and the others
+    to zero.
+    """
+    N = isDDof.shape[0]
+    device = bm.get_device(isDDof)
+    row, col = A.row, A.col
+    if isinstance(A, CSRTensor):
+        is_bd = bm.repeat(isDDof, A.crow[1:] - A.crow[:-1])
+    else:
+        is_bd = isDDof[row]
+    is_bd = is_bd | isDDof[col]
+    bd_diag = bm.nonzero(is_bd & (row == col))[0]
+    bd_diag = bm.astype(bd_diag, row.dtype)
+
+    # Pick one diagonal entry for each Dirichlet row.
+    loc = bm.full((N, ), -1, dtype=row.dtype, device=device)
+    loc = bm.set_at(loc, row[bd_diag], bd_diag)
+    loc = loc[isDDof]
+    if bm.any(loc < 0):
+        return None
+
+    is_one = bm.zeros(is_bd.shape, dtype=bm.bool, device=device)
+    is_one = bm.set_at(is_one, loc, True)
+
+    values = A.values
+    if values is None:
+        values = bm.ones(is_bd.shape, dtype=bm.float64, device=device)
+    values = bm.where(is_bd, 0, values)
+    return bm.where(is_one, 1, values)
+
+
 # backup
 def apply_csr_matrix(A: CSRTensor, isDDof: TensorLike):
     isIDof = bm.logical_not(isDDof)
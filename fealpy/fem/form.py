@@ -3,6 +3,8 @@ from typing import (
     Sequence, overload, Iterable, Dict, Tuple, Optional, Union, TypeVar, Generic,
     Callable
 )
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from ..typing import TensorLike, Size, Index
 from ..backend import backend_manager as bm
@@ -20,6 +22,10 @@ Self = TypeVar('Self')
 # (2) slice: Slice of entities.
 _SplitterInterface = Callable[[_FS, Integrator], Iterable[_IT]]
 _Splitter = Union[_SplitterInterface[TensorLike], _SplitterInterface[slice]]
+# NOTE: Backends whose kernels can be called from multiple threads at the same time.
+# The forward-mode AD used by the PyTorch backend (e.g. gradients of shape functions)
+# keeps global states and is not thread-safe.
+_THREAD_SAFE_BACKENDS = {'numpy', 'jax'}
 
 
 class Form(Generic[_I], ABC):
@@ -143,30 +149,65 @@ class Form(Generic[_I], ABC):
 
         return self
 
-    def _assembly_kernel(self, group: str, /, indices=None):
+    def _assembly_kernel(self, group: str, /, indices=None, *, with_etg=True):
         integrator = self.integrators[group]
         if indices is None:
             value = integrator(self.space)
-            etg = integrator.to_global_dof(self.space)
+            etg = integrator.to_global_dof(self.space) if with_etg else None
         else:
             value = integrator(self.space, indices=indices)
-            etg = integrator.to_global_dof(self.space, indices=indices)
-        if not isinstance(etg, (tuple, list)):
+            etg = integrator.to_global_dof(self.space, indices=indices) if with_etg else None
+        if with_etg and (not isinstance(etg, (tuple, list))):
             etg = (etg, )
         return value, etg
 
-    def assembly_local_iterative(self):
-        """Assembly local matrix considering chunk size.
-        Yields local matrix and to_global_dof tuple."""
+    def _assembly_tasks(self):
+        """Yields the group name and the indices (None for the full region)
+        of every independent piece of the local assembly."""
         for key, int_ in self.integrators.items():
             splitter = self.splitters[key]
             if splitter is None:
                 logger.debug(f"(ASSEMBLY LOCAL FULL) {key}")
-                yield self._assembly_kernel(key)
+                yield key, None
             else:
                 logger.debug(f"(ASSEMBLY LOCAL ITER) {key}")
                 for indices in splitter(self.space, int_):
-                    yield self._assembly_kernel(key, indices)
+                    yield key, indices
+
+    def assembly_local_iterative(self, *, with_etg=True, workers: Optional[int]=None):
+        """Assembly local matrix considering chunk size.
+        Yields local matrix and to_global_dof tuple.
+
+        Parameters:
+            with_etg (bool, optional): Whether to fetch the to_global_dof of
+                integrators. Yields None instead of the tuple if False. Defaults to True.
+            workers (int | None, optional): Number of threads evaluating the
+                groups and chunks concurrently. Outputs are yielded in the same
+                order as the serial assembly. Run serially if None or less than 2,
+                or the current backend is not thread-safe. Defaults to None.
+        """
+        if (workers is not None) and (workers >= 2) and (bm.backend_name not in _THREAD_SAFE_BACKENDS):
+            logger.warning(f"Threaded assembly is not supported by the {bm.backend_name} "
+                           "backend. Run serially instead.")
+            workers = None
+
+        if (workers is None) or (workers < 2):
+            for key, indices in self._assembly_tasks():
+                yield self._assembly_kernel(key, indices, with_etg=with_etg)
+            return
+
+        # NOTE: The backend is thread-local, so it is set again in each worker.
+        # Only a bounded number of chunks are in flight to limit the memory.
+        with ThreadPoolExecutor(workers, initializer=bm.set_backend,
+                                initargs=(bm.backend_name,)) as executor:
+            pending = deque()
+            for key, indices in self._assembly_tasks():
+                pending.append(executor.submit(self._assembly_kernel, key, indices,
+                                               with_etg=with_etg))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
 
 
 class UniformSplitter():
@@ -11,7 +11,7 @@ from .integrator import (
     enable_cache,
     assemblymethod
 )
-from fealpy.fem.utils import SymbolicIntegration
+from fealpy.fem.utils import reference_integral
 
 class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
     """
@@ -211,10 +211,11 @@ class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
         cm = mesh.entity_measure('cell', index=index)
         glambda_x = mesh.grad_lambda()  # (NC, LDOF, GD)
         
-        symbolic_int = SymbolicIntegration(scalar_space)
-        M = bm.tensor(symbolic_int.gphi_gphi_matrix()) # (LDOF1, LDOF1, GD+1, GD+1)
+        # 参考单元上的积分表，进程内缓存，不再每次调用 sympy
+        TD = mesh.top_dimension()
+        M = reference_integral('gphi_gphi', scalar_space.p, TD=TD) # (LDOF1, LDOF1, GD+1, GD+1)
 
-        return cm, mesh, glambda_x, bm.asarray(M, dtype=bm.float64)
+        return cm, mesh, glambda_x, bm.tensor(M, dtype=bm.float64)
     
 # ABAQUS 中使用的组装方法的缓存
     @enable_cache
@@ -6,11 +6,15 @@ from ..typing import TensorLike
 from ..backend import backend_manager as bm 
 from ..sparse import COOTensor
 from .form import Form
-from .integrator import LinearInt
+from .integrator import LinearInt, GroupIntegrator
 
+_SCATTER_MISMATCH = ("The number of local vectors does not match the kept "
+                     "entity-to-global relationships. Call keep_data() to rebuild them.")
 
 class LinearForm(Form[LinearInt]):
     _V = None
+    _keep_data = False
+    _scatter = None
 
     def _get_sparse_shape(self):
         spaces = self._spaces
@@ -33,54 +37,115 @@ class LinearForm(Form[LinearInt]):
         if len(self._spaces) != 1:
             raise ValueError("LinearForm should have only one space.")
 
-    def _scalar_assembly(self):
+    def _scalar_assembly(self, workers: Optional[int]=None):
         self.check_space()
         space = self._spaces[0]
         batch_size = self.batch_size
         gdof = space.number_of_global_dofs()
         init_value_shape = (0,) if (batch_size == 0) else (batch_size, 0)
         sparse_shape = (gdof, )
+        indices_list = [bm.empty((1, 0), dtype=space.itype, device=bm.get_device(space))]
+        values_list = [bm.empty(init_value_shape, dtype=space.ftype, device=bm.get_device(space))]
 
-        M = COOTensor(
-            indices = bm.empty((1, 0), dtype=space.itype, device=bm.get_device(space)),
-            values = bm.empty(init_value_shape, dtype=space.ftype, device=bm.get_device(space)),
-            spshape = sparse_shape
-        )
-
-        for group_tensor, e2dofs_tuple in self.assembly_local_iterative():
+        for group_tensor, e2dofs_tuple in self.assembly_local_iterative(workers=workers):
             if (batch_size > 0) and (group_tensor.ndim == 2):
                 group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
 
-            indices = e2dofs_tuple[0].reshape(1, -1)
-            group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
-            M = M.add(COOTensor(indices, group_tensor, sparse_shape))
+            indices_list.append(e2dofs_tuple[0].reshape(1, -1))
+            values_list.append(bm.reshape(group_tensor, self._values_ravel_shape))
+
+        indices = bm.concat(indices_list, axis=1)
+        values = bm.concat(values_list, axis=-1)
+        return COOTensor(indices, values, sparse_shape)
+
+    def _add_integrator_impl(self, I, group=None, splitter=None):
+        self._scatter = None
+        if self._keep_data:
+            _keep_integrator_data(I, True)
+        return super()._add_integrator_impl(I, group, splitter)
 
-        return M
+    def keep_data(self, status_on=True, /):
+        """Set whether to keep the data unchanged between assemblies.
+
+        When enabled, integrators keep their materials decorated by
+        `enable_cache` (such as quadrature points, basis values and measures),
+        and the form keeps the entity-to-global DoF indices of all groups and
+        splitter chunks after the next dense assembly. Later assemblies only
+        evaluate the sources and scatter the local vectors.
+        This is useful for time-dependent sources.
+
+        Calling this method always drops the kept data. Call it again if the
+        mesh, the spaces or the regions of integrators are changed.
+        """
+        self._keep_data = status_on
+        self._scatter = None
+        for integrator in self.integrators.values():
+            _keep_integrator_data(integrator, status_on)
+        return self
+
+    def _dense_assembly(self, workers: Optional[int]=None):
+        """Scatter-add local vectors into the global vector directly."""
+        self.check_space()
+        space = self._spaces[0]
+        scatter = self._scatter
+        new_scatter = []
+        count = 0
+        V = None
+
+        for group_tensor, e2dofs_tuple in self.assembly_local_iterative(
+                with_etg=(scatter is None), workers=workers):
+            if scatter is None:
+                index = e2dofs_tuple[0].reshape(-1)
+                new_scatter.append(index)
+            elif count < len(scatter):
+                index = scatter[count]
+            else:
+                raise RuntimeError(_SCATTER_MISMATCH)
+            count += 1
+            # NOTE: Local tensors without the batch dimension are broadcasted.
+            group_tensor = bm.reshape(group_tensor, group_tensor.shape[:-2] + (-1, ))
+            if V is None:
+                V = bm.zeros(self.shape, **bm.context(group_tensor))
+            V = bm.index_add(V, index, group_tensor, axis=-1)
+
+        if (scatter is not None) and (len(scatter) != count):
+            raise RuntimeError(_SCATTER_MISMATCH)
+        if self._keep_data and (scatter is None):
+            self._scatter = new_scatter
+        if V is None:
+            V = bm.zeros(self.shape, dtype=space.ftype, device=bm.get_device(space))
+        return V
 
     @overload
-    def assembly(self) -> TensorLike: ...
+    def assembly(self, *, workers: Optional[int]=None) -> TensorLike: ...
     @overload
-    def assembly(self, *, format: Literal['coo']) -> COOTensor: ...
+    def assembly(self, *, format: Literal['coo'], workers: Optional[int]=None) -> COOTensor: ...
     @overload
-    def assembly(self, *, format: Literal['dense']) -> TensorLike: ...
-    def assembly(self, *, format='dense'):
+    def assembly(self, *, format: Literal['dense'], workers: Optional[int]=None) -> TensorLike: ...
+    def assembly(self, *, format='dense', workers: Optional[int]=None):
         """Assembly the linear form vector.
 
         Parameters:
             format (str, optional): Layout of the output ('dense', 'coo'). Defaults to 'dense'.\n
-            retain_ints (bool, optional): Whether to retain the integrator cache.
+            workers (int | None, optional): Number of threads evaluating integrators
+                on groups and splitter chunks concurrently. Defaults to None (serial).
 
         Returns:
             global_vector (COOTensor | TensorLike): Global sparse vector shaped ([batch, ]gdof).
         """
-        V = self._scalar_assembly()
-
         if format == 'dense':
-            self._V = V.to_dense()
+            self._V = self._dense_assembly(workers)
         elif format == 'coo':
-            self._V = V.coalesce()
+            self._V = self._scalar_assembly(workers).coalesce()
         else:
             raise ValueError(f"Unsupported format {format}.")
-        logger.info(f"Linear form vector constructed, with shape {list(V.shape)}.")
+        logger.info(f"Linear form vector constructed, with shape {list(self._V.shape)}.")
 
         return self._V
+
+
+def _keep_integrator_data(integrator: LinearInt, status_on: bool):
+    if isinstance(integrator, GroupIntegrator):
+        for sub in integrator:
+            sub.keep_data(status_on)
+    integrator.keep_data(status_on)
@@ -6,8 +6,16 @@ from ..typing import TensorLike, Index, _S
 
 from ..mesh import HomogeneousMesh
 from ..functionspace.space import FunctionSpace as _FS
-from ..utils import process_coef_func
+from ..utils import process_coef_func, is_tensor
 from ..functional import bilinear_integral, linear_integral, get_semilinear_coef
+from ..functional import reference_bilinear_integral, affine_diffusion_integral
+from .sum_factorization import (
+    SumFactorizedDiffusion,
+    is_sum_factorizable,
+    tensor_tabulation,
+    tensor_geometry,
+    quadrature_factor
+)
 from .integrator import (
     LinearInt, OpInt, CellInt,
     enable_cache,
@@ -21,7 +29,7 @@ class ScalarDiffusionIntegrator(LinearInt, OpInt, CellInt):
     def __init__(self, coef: Optional[CoefLike] = None, q: Optional[int] = None, *,
                  region: Optional[TensorLike] = None,
                  batched: bool = False,
-                 method: Literal['fast', 'nonlinear', 'isopara', None] = None) -> None:
+                 method: Literal['fast', 'nonlinear', 'isopara', 'sumfac', None] = None) -> None:
         super().__init__(method=method if method else 'assembly')
         self.coef = coef
         self.q = q
@@ -68,18 +76,21 @@ class ScalarDiffusionIntegrator(LinearInt, OpInt, CellInt):
     @assemblymethod('fast')
     def fast_assembly(self, space: _FS, /, indices=None) -> TensorLike:
         """
-        限制：常系数、单纯形网格
-        TODO: 加入 assert
+        限制：单元上的分片常系数、单纯形网格，否则退回到一般的组装
         """
         mesh = space.mesh
         if isinstance(mesh, SimplexMesh):
+            bcs, ws = self.fetch_qf(space)
+            index = self.entity_selection(indices)
+            coef = process_coef_func(self.coef, bcs=bcs, mesh=mesh, etype='cell', index=index)
+            if is_tensor(coef) and (coef.ndim - int(self.batched) > 1):
+                return self.assembly(space, indices)
 
-            _, ws = self.fetch_qf(space)
             gphi = self.fetch_gphiu(space, indices)
-            M = bm.einsum('q, qik, qjl -> ijkl', ws, gphi, gphi)
+            M = reference_bilinear_integral(gphi, gphi, ws)
             cm = self.fetch_measure(space, indices)
-            glambda = mesh.grad_lambda(index=self.entity_selection(indices))
-            result = bm.einsum('ijkl, ckm, clm, c -> cij', M, glambda, glambda, cm)
+            glambda = mesh.grad_lambda(index=index)
+            result = affine_diffusion_integral(M, glambda, cm, coef, batched=self.batched)
         else:
             coef = self.coef
             mesh = space.mesh    
@@ -97,6 +108,38 @@ class ScalarDiffusionIntegrator(LinearInt, OpInt, CellInt):
             result = bm.einsum('cqkn, qijmn, cqkm, c -> cij', JG, M, JG, cm) # (NC, NQ, ldof, GD)
         return result
 
+    def local_operator(self, space: _FS, /, indices=None) -> Optional[SumFactorizedDiffusion]:
+        """Sum-factorized local diffusion operator of Lagrange spaces on tensor-product
+        meshes. Returns None if the space, the coefficient or the batch is not
+        supported, where the element matrices should be used instead."""
+        if self.batched or (not is_sum_factorizable(space)):
+            return None
+        mesh = space.mesh
+        index = self.entity_selection(indices)
+        q = space.p+3 if self.q is None else self.q
+        qf = mesh.quadrature_formula(q, 'cell')
+        bcs, ws = qf.get_factor_quadrature_points_and_weights()
+        coef = process_coef_func(self.coef, bcs=bcs, mesh=mesh, etype='cell', index=index)
+        detJ, invJ = tensor_geometry(mesh, bcs, index=index)
+        factor = quadrature_factor(ws, detJ, coef)
+        if factor is None:
+            return None
+        G = bm.einsum('cqmk, cqnk -> cqmn', invJ, invJ)
+        G = bm.reshape(G, factor.shape + G.shape[-2:]) * factor[..., None, None]
+        phi, dphi = tensor_tabulation(bcs, space.p)
+        return SumFactorizedDiffusion(phi, dphi, G)
+
+    @assemblymethod('sumfac')
+    def sumfac_assembly(self, space: _FS, /, indices=None) -> TensorLike:
+        """
+        张量积网格上的和因子分解组装，其他情况退回到一般的组装。
+        在矩阵自由的双线性型中，直接以和因子分解的方式作用局部算子。
+        """
+        op = self.local_operator(space, indices)
+        if op is None:
+            return self.assembly(space, indices)
+        return op.matrix()
+
     @assemblymethod('nonlinear')
     def nonlinear_assembly(self, space: _FS, /, indices=None) -> TensorLike:
         uh = self.uh
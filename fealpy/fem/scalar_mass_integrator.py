@@ -3,10 +3,18 @@ from typing import Optional
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 
-from ..mesh import HomogeneousMesh
+from ..mesh import HomogeneousMesh, SimplexMesh
 from ..functionspace.space import FunctionSpace as _FS
-from ..utils import process_coef_func
+from ..utils import process_coef_func, is_tensor
 from ..functional import bilinear_integral, linear_integral, get_semilinear_coef
+from ..functional import reference_bilinear_integral, affine_mass_integral
+from .sum_factorization import (
+    SumFactorizedMass,
+    is_sum_factorizable,
+    tensor_tabulation,
+    tensor_geometry,
+    quadrature_factor
+)
 from .integrator import (
     LinearInt, OpInt, CellInt,
     enable_cache,
@@ -57,6 +65,53 @@ class ScalarMassIntegrator(LinearInt, OpInt, CellInt):
 
         return bilinear_integral(phi, phi, ws, cm, val, batched=self.batched)
 
+    @assemblymethod('fast')
+    def fast_assembly(self, space: _FS) -> TensorLike:
+        """
+        限制：单元上的分片常系数、单纯形网格，否则退回到一般的组装
+        """
+        coef = self.coef
+        mesh = getattr(space, 'mesh', None)
+        bcs, ws, phi, cm, index = self.fetch(space)
+        val = process_coef_func(coef, bcs=bcs, mesh=mesh, etype='cell', index=index)
+
+        if (not isinstance(mesh, SimplexMesh)) or (phi.shape[0] != 1) or \
+                (is_tensor(val) and (val.ndim - int(self.batched) > 1)):
+            return bilinear_integral(phi, phi, ws, cm, val, batched=self.batched)
+
+        M = reference_bilinear_integral(phi[0], phi[0], ws)
+        return affine_mass_integral(M, cm, val, batched=self.batched)
+
+    def local_operator(self, space: _FS) -> Optional[SumFactorizedMass]:
+        """Sum-factorized local mass operator of Lagrange spaces on tensor-product
+        meshes. Returns None if the space, the coefficient or the batch is not
+        supported, where the element matrices should be used instead."""
+        if self.batched or (not is_sum_factorizable(space)):
+            return None
+        mesh = space.mesh
+        index = self.index
+        q = space.p+3 if self.q is None else self.q
+        qf = mesh.quadrature_formula(q, 'cell')
+        bcs, ws = qf.get_factor_quadrature_points_and_weights()
+        coef = process_coef_func(self.coef, bcs=bcs, mesh=mesh, etype='cell', index=index)
+        detJ, _ = tensor_geometry(mesh, bcs, index=index)
+        factor = quadrature_factor(ws, detJ, coef)
+        if factor is None:
+            return None
+        phi, _ = tensor_tabulation(bcs, space.p)
+        return SumFactorizedMass(phi, factor)
+
+    @assemblymethod('sumfac')
+    def sumfac_assembly(self, space: _FS) -> TensorLike:
+        """
+        张量积网格上的和因子分解组装，其他情况退回到一般的组装。
+        在矩阵自由的双线性型中，直接以和因子分解的方式作用局部算子。
+        """
+        op = self.local_operator(space)
+        if op is None:
+            return self.assembly(space)
+        return op.matrix()
+
     @assemblymethod('semilinear')
     def semilinear_assembly(self, space: _FS) -> TensorLike:
         uh = self.uh
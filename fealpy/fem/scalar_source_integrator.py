@@ -47,11 +47,19 @@ class ScalarSourceIntegrator(LinearInt, SrcInt, CellInt):
 
         return bcs, ws, phi, cm, index
 
+    @enable_cache
+    def fetch_points(self, space: _FS, /, indices=None):
+        bcs = self.fetch(space, indices)[0]
+        return space.mesh.bc_to_point(bcs, index=self.entity_selection(indices))
+
     def assembly(self, space: _FS, indices=None) -> TensorLike:
         f = self.source
         mesh = getattr(space, 'mesh', None)
         bcs, ws, phi, cm, index = self.fetch(space, indices)
-        val = process_coef_func(f, bcs=bcs, mesh=mesh, etype='cell', index=index)
+        ps = None
+        if callable(f) and getattr(f, 'coordtype', 'barycentric') != 'barycentric':
+            ps = self.fetch_points(space, indices)
+        val = process_coef_func(f, bcs=bcs, mesh=mesh, etype='cell', index=index, ps=ps)
   
         return linear_integral(phi, ws, cm, val, batched=self.batched)
 
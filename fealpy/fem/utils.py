@@ -1,13 +1,18 @@
 
-import sympy as sp
+from typing import Optional, Dict, Tuple
+import hashlib
+import os
+import threading
+from math import factorial
 
-from typing import Optional
+import numpy as np
 
 from fealpy.backend import backend_manager as bm
 from fealpy.typing import TensorLike
-from fealpy.functionspace import LagrangeFESpace
-from fealpy.fem import ScalarMassIntegrator, ScalarDiffusionIntegrator
-from fealpy.mesh import TriangleMesh
+from fealpy._lazy import lazy_import
+
+# NOTE: sympy is slow to import and only used by the symbolic integration.
+sp = lazy_import('sympy')
 
 class SymbolicIntegration:
     def __init__(self, space1, space2=None):
@@ -160,6 +165,188 @@ class SymbolicIntegration:
                     
         return S
 
+    def gphi_phi_matrix(self):
+        gphi1 = self.grad_basis(self.p1, self.mi1)
+        phi2 = self.basis(self.p2, self.mi2)
+
+        S = sp.tensor.array.MutableDenseNDimArray(
+            sp.zeros(self.ldof1 * self.ldof2 * (self.GD+1)),
+            (self.ldof1, self.ldof2, self.GD+1)
+            )
+
+        for i in range(self.ldof1):
+            for j in range(self.ldof2):
+                for m in range(self.GD + 1):
+                    S[i, j, m] = self.integrate(gphi1[i][m] * phi2[j])
+
+        return S
+
+
+##################################################
+### Cached reference integrals
+##################################################
+
+_REFERENCE_KINDS = {
+    'phi_phi': 'phi_phi_matrix',
+    'gphi_phi': 'gphi_phi_matrix',
+    'gphi_gphi': 'gphi_gphi_matrix',
+}
+# Bump to invalidate the tables cached on disk.
+_REFERENCE_VERSION = 1
+_reference: Dict[Tuple, np.ndarray] = {}
+_reference_lock = threading.Lock()
+
+
+def reference_cache_dir() -> Optional[str]:
+    """Directory of the on-disk cache of exact reference integrals, given by
+    the environment variable FEALPY_CACHE_DIR and defaulting to ~/.cache/fealpy.
+    Returns None if FEALPY_CACHE_DIR is set to an empty string."""
+    path = os.environ.get('FEALPY_CACHE_DIR', None)
+    if path is None:
+        path = os.path.join(os.path.expanduser('~'), '.cache', 'fealpy')
+    return path or None
+
+
+def simplex_gauss_quadrature(TD: int, order: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Collapsed Gauss-Legendre quadrature on the reference simplex, exact for
+    polynomials of any given degree.
+
+    Parameters:
+        TD (int): Dimension of the simplex.
+        order (int): Degree of polynomials to be integrated exactly.
+
+    Returns:
+        ndarray: Barycentric coordinates of the points shaped (NQ, TD+1).
+        ndarray: Weights shaped (NQ, ), summing to 1.
+    """
+    # The Duffy map x_k = u_k * prod_{l<k} (1 - u_l) has the Jacobian
+    # prod_k (1 - u_k)^(TD-1-k), adding at most TD-1 degrees in each u_k.
+    n = (order + TD) // 2 + 1
+    t, w = np.polynomial.legendre.leggauss(n)
+    t, w = (t + 1) / 2, w / 2
+    u = np.stack(np.meshgrid(*([t]*TD), indexing='ij'), axis=-1).reshape(-1, TD)
+    ws = np.prod(np.stack(np.meshgrid(*([w]*TD), indexing='ij'), axis=-1).reshape(-1, TD), axis=-1)
+
+    x = np.zeros_like(u)
+    rest = np.ones(u.shape[0])
+    for k in range(TD):
+        x[:, k] = u[:, k] * rest
+        ws = ws * (1 - u[:, k])**(TD-1-k)
+        rest = rest * (1 - u[:, k])
+    bcs = np.concatenate([1 - np.sum(x, axis=-1, keepdims=True), x], axis=-1)
+    return bcs, ws * factorial(TD)
+
+
+def _quadrature_integral(kind: str, p1: int, p2: int, TD: int) -> np.ndarray:
+    from fealpy.backend.numpy_backend import NumPyBackend as nb
+    order = p1 + p2 - kind.count('g')
+    bcs, ws = simplex_gauss_quadrature(TD, max(order, 0))
+    if kind == 'phi_phi':
+        phi1 = nb.simplex_shape_function(bcs, p1)
+        phi2 = nb.simplex_shape_function(bcs, p2)
+        return np.einsum('q, qi, qj -> ij', ws, phi1, phi2)[None, ...]
+    gphi1 = nb.simplex_grad_shape_function(bcs, p1)
+    if kind == 'gphi_phi':
+        phi2 = nb.simplex_shape_function(bcs, p2)
+        return np.einsum('q, qim, qj -> ijm', ws, gphi1, phi2)
+    gphi2 = nb.simplex_grad_shape_function(bcs, p2)
+    return np.einsum('q, qim, qjn -> ijmn', ws, gphi1, gphi2)
+
+
+def _symbolic_integral(kind: str, p1: int, p2: int, TD: int) -> np.ndarray:
+    key = f'{_REFERENCE_VERSION}-{kind}-{p1}-{p2}-{TD}'
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    cache_dir = reference_cache_dir()
+    fname = None if cache_dir is None else \
+            os.path.join(cache_dir, f'{kind}-p{p1}-p{p2}-d{TD}-{digest}.npy')
+
+    if (fname is not None) and os.path.exists(fname):
+        try:
+            return np.load(fname)
+        except (OSError, ValueError): # broken file, computed again below
+            pass
+
+    from fealpy.mesh import IntervalMesh, TriangleMesh, TetrahedronMesh
+    from fealpy.functionspace import LagrangeFESpace
+    if TD == 1:
+        mesh = IntervalMesh.from_interval_domain([0, 1], nx=1)
+    elif TD == 2:
+        mesh = TriangleMesh.from_one_triangle()
+    elif TD == 3:
+        mesh = TetrahedronMesh.from_one_tetrahedron()
+    else:
+        raise ValueError(f"Unsupported dimension {TD} of simplices.")
+    space1 = LagrangeFESpace(mesh, p=p1)
+    space2 = LagrangeFESpace(mesh, p=p2)
+    data = getattr(SymbolicIntegration(space1, space2), _REFERENCE_KINDS[kind])()
+    value = np.array(data.tolist(), dtype=np.float64)
+
+    if fname is not None:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp = f'{fname}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp, 'wb') as f:
+                np.save(f, value)
+            os.replace(tmp, fname) # atomic for concurrent jobs
+        except OSError: # read-only file systems
+            pass
+    return value
+
+
+def reference_integral(kind: str, p1: int, p2: Optional[int]=None, TD: int=2, *,
+                       exact: bool=False) -> np.ndarray:
+    """Integrals of products of Lagrange shape functions on the reference simplex,
+    divided by its measure, with derivatives taken with respect to barycentric
+    coordinates.
+
+    By default the integrals are computed by Gauss quadrature exact for the
+    polynomial integrands, hence accurate to round-off. With `exact=True` they are
+    integrated symbolically by sympy, and the results are cached on disk (see
+    `reference_cache_dir`) so that sympy runs once per table and machine.
+    In both cases the tables are cached in the process, and are read-only.
+
+    Parameters:
+        kind (str): 'phi_phi' for (1, ldof1, ldof2), 'gphi_phi' for\
+            (ldof1, ldof2, TD+1) and 'gphi_gphi' for (ldof1, ldof2, TD+1, TD+1).
+        p1 (int): Degree of the first shape functions.
+        p2 (int, optional): Degree of the second shape functions. Defaults to p1.
+        TD (int, optional): Dimension of the simplex. Defaults to 2.
+        exact (bool, optional): Whether to integrate symbolically. Defaults to False.
+
+    Returns:
+        ndarray: The reference integrals in float64.
+    """
+    if kind not in _REFERENCE_KINDS:
+        raise ValueError(f"Unknown kind of reference integrals '{kind}', "
+                         f"expected one of {tuple(_REFERENCE_KINDS)}.")
+    p2 = p1 if p2 is None else p2
+    key = (kind, p1, p2, TD, exact)
+
+    with _reference_lock:
+        value = _reference.get(key, None)
+    if value is None:
+        if exact:
+            value = _symbolic_integral(kind, p1, p2, TD)
+        else:
+            value = _quadrature_integral(kind, p1, p2, TD)
+        value.flags.writeable = False
+        with _reference_lock:
+            value = _reference.setdefault(key, value)
+    return value
+
+
+def clear_reference_cache(disk: bool=False) -> None:
+    """Clear the cached reference integrals of the process, and also those
+    on disk if `disk` is True."""
+    with _reference_lock:
+        _reference.clear()
+    cache_dir = reference_cache_dir()
+    if disk and (cache_dir is not None) and os.path.isdir(cache_dir):
+        for kind in _REFERENCE_KINDS:
+            for fname in os.listdir(cache_dir):
+                if fname.startswith(kind + '-p') and fname.endswith('.npy'):
+                    os.remove(os.path.join(cache_dir, fname))
+
 def normal_strain(gphi: TensorLike, indices: TensorLike, *, out:
                   Optional[TensorLike]=None) -> TensorLike:
     """Assembly normal strain tensor.
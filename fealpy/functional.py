@@ -43,11 +43,15 @@ def linear_integral(basis: TensorLike, weights: TensorLike, measure: TensorLike,
             And (C, I, ...) for source (C, ) and (C, Q).
             If `batched` is True, there will be a batch dimension as the first axis.
     """
+    # NOTE: The weights and measure are merged into one factor on the quadrature
+    # points first, leaving a two-operand contraction with the basis.
+    factor = bm.einsum('c, q -> cq', measure, weights)
+
     if source is None:
-        return bm.einsum('c, q, cq... -> c...', measure, weights, basis)
+        return bm.einsum('cq..., cq -> c...', basis, factor)
 
     if is_scalar(source):
-        return bm.einsum('c, q, cq... -> c...', measure, weights, basis) * source
+        return bm.einsum('cq..., cq -> c...', basis, factor) * source
 
     elif is_tensor(source):
         dof_shape = basis.shape[3:]
@@ -55,11 +59,11 @@ def linear_integral(basis: TensorLike, weights: TensorLike, measure: TensorLike,
 
         if source.ndim <= 2 + int(batched):
             source = fill_axis(source, 3 if batched else 2)
-            r = bm.einsum(f'c, q, cqid, ...cq -> ...cid', measure, weights, basis, source)
+            r = bm.einsum(f'cqid, ...cq -> ...cid', basis, factor * source)
             return bm.reshape(r, r.shape[:-1] + dof_shape)
         else:
             source = fill_axis(source, 4 if batched else 3)
-            return bm.einsum(f'c, q, cqid, ...cqd -> ...ci', measure, weights, basis, source)
+            return bm.einsum(f'cqid, ...cqd -> ...ci', basis, factor[..., None] * source)
 
     else:
         raise TypeError(f"source should be int, float or TensorLike, but got {type(source)}.")
@@ -84,15 +88,22 @@ def bilinear_integral(basis1: TensorLike, basis2: TensorLike, weights: TensorLik
     Returns:
         TensorLike: The result of the integration shaped (C, I, J).
             If `batched` is True, the shape of the output is (B, C, I, J).
+
+    Note:
+        Except for the matrix coefficients, the weights, measure and coef are
+        merged into one factor on the quadrature points, and the integration
+        is a batched matrix product. When `basis1 is basis2`, the transposed
+        basis is shared by both sides of the product.
     """
+    symmetric = basis1 is basis2
     basis1 = basis1.reshape(*basis1.shape[:3], -1) # (C, Q, I, dof_numel)
-    basis2 = basis2.reshape(*basis2.shape[:3], -1) # (C, Q, J, dof_numel)
+    basis2 = basis1 if symmetric else basis2.reshape(*basis2.shape[:3], -1) # (C, Q, J, dof_numel)
 
     if coef is None:
-        return bm.einsum(f'q, c, cqid, cqjd -> cij', weights, measure, basis1, basis2)
+        return _weighted_product(basis1, basis2, bm.einsum('q, c -> cq', weights, measure)[..., None])
 
     if is_scalar(coef):
-        return bm.einsum(f'q, c, cqid, cqjd -> cij', weights, measure, basis1, basis2) * coef
+        return _weighted_product(basis1, basis2, bm.einsum('q, c -> cq', weights, measure)[..., None]) * coef
 
     elif is_tensor(coef):
         ndim = coef.ndim - int(batched)
@@ -100,11 +111,112 @@ def bilinear_integral(basis1: TensorLike, basis2: TensorLike, weights: TensorLik
             return  bm.einsum(f'q, c, cqid, cqjn, ...cqdn -> ...cij', weights, measure, basis1, basis2, coef)
         else:
             coef = fill_axis(coef, 4 if batched else 3)
-            return bm.einsum(f'q, c, cqid, cqjd, ...cqd -> ...cij', weights, measure, basis1, basis2, coef)
-        
+            factor = bm.einsum('q, c -> cq', weights, measure)[..., None] * coef
+            return _weighted_product(basis1, basis2, factor)
+
+    else:
+        raise TypeError(f"coef should be int, float or TensorLike, but got {type(coef)}.")
+
+
+def _weighted_product(basis1: TensorLike, basis2: TensorLike, factor: TensorLike) -> TensorLike:
+    # basis1 (C, Q, I, D), basis2 (C, Q, J, D), factor (..., C, Q, D) -> (..., C, I, J)
+    t1 = bm.swapaxes(basis1, 1, 2) # (C, I, Q, D)
+    t2 = t1 if basis2 is basis1 else bm.swapaxes(basis2, 1, 2)
+    NC, NJ = t2.shape[0], t2.shape[1]
+    wt1 = t1 * factor[..., None, :, :]
+    wt1 = bm.reshape(wt1, wt1.shape[:-2] + (-1, ))
+    t2 = bm.reshape(t2, (NC, NJ, -1))
+    return bm.matmul(wt1, bm.swapaxes(t2, -1, -2))
+
+
+def reference_bilinear_integral(basis1: TensorLike, basis2: TensorLike,
+                                weights: TensorLike) -> TensorLike:
+    """Integration of basis products on the reference entity.
+
+    Parameters:
+        basis1 (TensorLike[Q, I] | TensorLike[Q, I, K]): The basis values, or gradients\
+            with respect to the barycentric coordinates, on the quadrature points.
+        basis2 (TensorLike[Q, J] | TensorLike[Q, J, L]): Same as `basis1`.
+        weights (TensorLike[Q,]): The weights of the quadrature points.
+
+    Returns:
+        TensorLike: The result shaped (I, J) for values, or (I, J, K, L) for gradients.
+    """
+    if basis1.ndim == 2:
+        return bm.einsum('q, qi, qj -> ij', weights, basis1, basis2)
+    return bm.einsum('q, qik, qjl -> ijkl', weights, basis1, basis2)
+
+
+def _cellwise_factor(measure: TensorLike, coef: Optional[CoefLike], batched: bool):
+    if (coef is None) or is_scalar(coef):
+        factor = measure
+        return factor if coef is None else factor * coef
+
+    elif is_tensor(coef):
+        if coef.ndim - int(batched) != 1:
+            raise ValueError("Integration on affine entities requires the coef to be "
+                             f"constant on each entity, but got shape {tuple(coef.shape)}.")
+        return measure * coef
+
     else:
         raise TypeError(f"coef should be int, float or TensorLike, but got {type(coef)}.")
 
+
+def affine_mass_integral(ref: TensorLike, measure: TensorLike,
+                         coef: Optional[CoefLike]=None,
+                         batched: bool=False) -> TensorLike:
+    """Mass integration on affine simplex entities with piecewise-constant coef.
+
+    Parameters:
+        ref (TensorLike[I, J]): The integration on the reference entity,\
+            see `reference_bilinear_integral`.
+        measure (TensorLike[C,]): The measure of the mesh entity.
+        coef (Number, TensorLike, optional): The coefficient of the integration, shaped (C,)\
+            or (B, C) if `batched`. Defaults to None.
+        batched (bool, optional): Whether the coef are batched. Defaults to False.
+
+    Returns:
+        TensorLike: The result of the integration shaped (C, I, J).
+            If `batched` is True, the shape of the output is (B, C, I, J).
+    """
+    factor = _cellwise_factor(measure, coef, batched)
+    return factor[..., None, None] * ref
+
+
+def affine_diffusion_integral(ref: TensorLike, glambda: TensorLike, measure: TensorLike,
+                              coef: Optional[CoefLike]=None,
+                              batched: bool=False) -> TensorLike:
+    """Diffusion integration on affine simplex entities with piecewise-constant coef.
+
+    The Gram matrix of the barycentric gradients is symmetric, so only its
+    upper triangle is computed and contracted with the reference integration.
+
+    Parameters:
+        ref (TensorLike[I, J, NV, NV]): The integration of the gradients with respect\
+            to barycentric coordinates on the reference entity, see `reference_bilinear_integral`.
+        glambda (TensorLike[C, NV, GD]): The gradients of barycentric coordinates.
+        measure (TensorLike[C,]): The measure of the mesh entity.
+        coef (Number, TensorLike, optional): The coefficient of the integration, shaped (C,)\
+            or (B, C) if `batched`. Defaults to None.
+        batched (bool, optional): Whether the coef are batched. Defaults to False.
+
+    Returns:
+        TensorLike: The result of the integration shaped (C, I, J).
+            If `batched` is True, the shape of the output is (B, C, I, J).
+    """
+    NI, NJ, NV = ref.shape[:3]
+    ikwargs = {'dtype': bm.int64, 'device': bm.get_device(glambda)}
+    k = bm.tensor([i for i in range(NV) for _ in range(i, NV)], **ikwargs)
+    l = bm.tensor([j for i in range(NV) for j in range(i, NV)], **ikwargs)
+    # Fold the lower triangle of the reference tensor into the upper one.
+    ref = bm.where(k == l, ref[..., k, l], ref[..., k, l] + ref[..., l, k])
+    ref = bm.reshape(ref, (NI*NJ, -1))
+    gram = bm.sum(glambda[:, k] * glambda[:, l], axis=-1) # (C, NV*(NV+1)/2)
+    result = bm.reshape(bm.matmul(gram, bm.swapaxes(ref, 0, 1)), (-1, NI, NJ))
+    factor = _cellwise_factor(measure, coef, batched)
+    return factor[..., None, None] * result
+
+
 def get_semilinear_coef(value:TensorLike, coef: Optional[CoefLike]=None, batched: bool=False):
 
     if coef is None:
@@ -1,40 +1,40 @@
 
-from .space import FunctionSpace
-from .function import Function
+# NOTE: Spaces are imported on first access (PEP 562), so that importing
+# this package does not load every space and their dependencies.
+from .._lazy import attach
 
-from .dofs import LinearMeshCFEDof
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'space': ['FunctionSpace'],
+    'function': ['Function'],
 
-from .lagrange_fe_space import LagrangeFESpace
-from .tensor_space import TensorFunctionSpace
-from .cm_conforming_fe_space import CmConformingFESpace2d
-from .cm_conforming_fe_space3d import CmConformingFESpace3d
-from .bernstein_fe_space import BernsteinFESpace
+    'dofs': ['LinearMeshCFEDof'],
 
-from .first_nedelec_fe_space_2d import FirstNedelecFiniteElementSpace2d
-from .first_nedelec_fe_space_3d import FirstNedelecFiniteElementSpace3d
+    'lagrange_fe_space': ['LagrangeFESpace'],
+    'tensor_space': ['TensorFunctionSpace'],
+    'cm_conforming_fe_space': ['CmConformingFESpace2d'],
+    'cm_conforming_fe_space3d': ['CmConformingFESpace3d'],
+    'bernstein_fe_space': ['BernsteinFESpace'],
 
-from .second_nedelec_fe_space_2d import SecondNedelecFiniteElementSpace2d
-from .second_nedelec_fe_space_3d import SecondNedelecFiniteElementSpace3d
+    'first_nedelec_fe_space_2d': ['FirstNedelecFiniteElementSpace2d'],
+    'first_nedelec_fe_space_3d': ['FirstNedelecFiniteElementSpace3d'],
 
-from .RaviartThomasFiniteElementSpace2d import RTFiniteElementSpace2d
-from .RaviartThomasFiniteElementSpace3d import RTFiniteElementSpace3d
-
-from .parametric_lagrange_fe_space import ParametricLagrangeFESpace
-
-from .huzhang_fe_space_2d import HuZhangFESpace2D
-
-from .BrezziDouglasMariniFiniteElementSpace2d import BDMFiniteElementSpace2d
-from .BrezziDouglasMariniFiniteElementSpace3d import BDMFiniteElementSpace3d
-
-from .interior_penalty_fe_space_2d import InteriorPenaltyFESpace2d
-
-## VESpace
-from .scaled_monomial_space_2d import ScaledMonomialSpace2d
-from .conforming_scalar_ve_space_2d import ConformingScalarVESpace2d
-from .non_conforming_scalar_ve_space_2d import NonConformingScalarVESpace2d
+    'second_nedelec_fe_space_2d': ['SecondNedelecFiniteElementSpace2d'],
+    'second_nedelec_fe_space_3d': ['SecondNedelecFiniteElementSpace3d'],
 
+    'RaviartThomasFiniteElementSpace2d': ['RTFiniteElementSpace2d'],
+    'RaviartThomasFiniteElementSpace3d': ['RTFiniteElementSpace3d'],
 
+    'parametric_lagrange_fe_space': ['ParametricLagrangeFESpace'],
 
+    'huzhang_fe_space_2d': ['HuZhangFESpace2D'],
 
+    'BrezziDouglasMariniFiniteElementSpace2d': ['BDMFiniteElementSpace2d'],
+    'BrezziDouglasMariniFiniteElementSpace3d': ['BDMFiniteElementSpace3d'],
 
+    'interior_penalty_fe_space_2d': ['InteriorPenaltyFESpace2d'],
 
+    ## VESpace
+    'scaled_monomial_space_2d': ['ScaledMonomialSpace2d'],
+    'conforming_scalar_ve_space_2d': ['ConformingScalarVESpace2d'],
+    'non_conforming_scalar_ve_space_2d': ['NonConformingScalarVESpace2d'],
+})
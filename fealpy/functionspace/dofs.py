@@ -14,14 +14,49 @@ _S = slice(None)
 
 
 class LinearMeshCFEDof(Generic[_MT]):
+    _topology = None
+
     def __init__(self, mesh: _MT, p: int):
         TD = mesh.top_dimension()
         self.mesh = mesh
         self.p = p
         self.multiIndex = mesh.multi_index_matrix(p, TD)
-   
+
+    def _cache(self) -> dict:
+        """Return the cache of dof maps, which is cleared when the mesh
+        topology is constructed again (e.g. after refinement) or the nodes
+        are replaced."""
+        mesh = self.mesh
+        topology = (mesh.entity('cell'), getattr(mesh, 'face2cell', None),
+                    mesh.entity('node'))
+        if (self._topology is None) or \
+            any(a is not b for a, b in zip(topology, self._topology)):
+            self._topology = topology
+            self._cached_maps = {}
+        return self._cached_maps
+
+    def _cached_map(self, name: str, index: Index):
+        """Return the cached entity-to-dof map. The full map is shared by all
+        callers and must not be modified in place; it is returned as a
+        read-only view on the numpy backend."""
+        cache = self._cache()
+        if name not in cache:
+            e2d = getattr(self.mesh, name + '_ipoint')(self.p)
+            if bm.backend_name == 'numpy':
+                e2d = e2d.view()
+                e2d.flags.writeable = False
+            cache[name] = e2d
+        if isinstance(index, slice) and (index == _S):
+            return cache[name]
+        return cache[name][index]
+
     def is_boundary_dof(self, threshold=None, method=None):
-        TD = self.mesh.top_dimension()
+        """Return the flag of boundary dofs.
+
+        Only the flags of the whole boundary (threshold=None) are cached, as
+        callable thresholds are usually created on the fly and have no stable
+        identity. A new tensor is returned on every call.
+        """
         gdof = self.number_of_global_dofs()
         if bm.is_tensor(threshold):
             index = threshold
@@ -29,29 +64,41 @@ class LinearMeshCFEDof(Generic[_MT]):
                 return index
             else:
                 raise ValueError(f"Unknown threshold: {threshold}")
+
+        if threshold is not None:
+            return self._boundary_dof_flag(threshold, method)
+
+        cache = self._cache()
+        key = ('is_boundary_dof', method)
+        if key not in cache:
+            cache[key] = self._boundary_dof_flag(threshold, method)
+        return bm.copy(cache[key]) # callers may modify the flag
+
+    def _boundary_dof_flag(self, threshold, method):
+        TD = self.mesh.top_dimension()
+        gdof = self.number_of_global_dofs()
+        if (method == 'centroid') | (method is None):
+            index = self.mesh.boundary_face_index()
+            if callable(threshold):
+                bc = self.mesh.entity_barycenter(TD-1, index=index)
+                flag = threshold(bc)
+                index = index[flag]
+            face2dof = self.face_to_dof(index=index) # 只获取指定的面的自由度信息
+            isBdDof = bm.zeros(gdof, dtype=bm.bool, device=bm.get_device(self.mesh))
+            isBdDof = bm.set_at(isBdDof, face2dof, True)
+        elif method == 'interp':
+            index = self.mesh.boundary_face_index()
+            face2dof = self.face_to_dof(index=index) # 只获取指定的面的自由度信息
+            index_dof = face2dof.flatten()
+            if callable(threshold):
+                ##TODO, index_dof加插值点函数里
+                ipoint = self.mesh.interpolation_points(p=self.p)[index_dof]
+                flag = threshold(ipoint)
+                index_dof = index_dof[flag]
+            isBdDof = bm.zeros(gdof, dtype=bm.bool, device=bm.get_device(self.mesh))
+            isBdDof = bm.set_at(isBdDof, index_dof, True)
         else:
-            if (method == 'centroid') | (method is None):
-                index = self.mesh.boundary_face_index()
-                if callable(threshold):
-                    bc = self.mesh.entity_barycenter(TD-1, index=index)
-                    flag = threshold(bc)
-                    index = index[flag]
-                face2dof = self.face_to_dof(index=index) # 只获取指定的面的自由度信息
-                isBdDof = bm.zeros(gdof, dtype=bm.bool, device=bm.get_device(self.mesh))
-                isBdDof = bm.set_at(isBdDof, face2dof, True)
-            elif method == 'interp':
-                index = self.mesh.boundary_face_index()
-                face2dof = self.face_to_dof(index=index) # 只获取指定的面的自由度信息
-                index_dof = face2dof.flatten()
-                if callable(threshold):
-                    ##TODO, index_dof加插值点函数里
-                    ipoint = self.mesh.interpolation_points(p=self.p)[index_dof]
-                    flag = threshold(ipoint)
-                    index_dof = index_dof[flag]
-                isBdDof = bm.zeros(gdof, dtype=bm.bool, device=bm.get_device(self.mesh))
-                isBdDof = bm.set_at(isBdDof, index_dof, True)
-            else:
-                raise ValueError(f"Unknown method: {method}")
+            raise ValueError(f"Unknown method: {method}")
         return isBdDof
 
     def entity_to_dof(self, etype: int, index: Index=_S):
@@ -66,13 +113,13 @@ class LinearMeshCFEDof(Generic[_MT]):
             raise ValueError(f"Unknown entity type: {etype}")
 
     def edge_to_dof(self, index: Index=_S):
-        return self.mesh.edge_to_ipoint(self.p, index=index)
+        return self._cached_map('edge_to', index)
 
     def face_to_dof(self, index: Index=_S):
-        return self.mesh.face_to_ipoint(self.p, index=index)
+        return self._cached_map('face_to', index)
 
     def cell_to_dof(self, index: Index=_S):
-        return self.mesh.cell_to_ipoint(self.p, index=index)
+        return self._cached_map('cell_to', index)
 
     def interpolation_points(self, index: Index=_S) -> TensorLike:
         return self.mesh.interpolation_points(self.p, index=index)
@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 
 #from .femdof import multi_index_matrix2d, multi_index_matrix1d
 #from .lagrange_fe_space import LagrangeFESpace
@@ -449,6 +448,7 @@ class ScaledMonomialSpace2d(FunctionSpace, Generic[_MT]):
         return self.dof.number_of_global_dofs(p=p)
     def show_function_image(self, u, uh, t=None, plot_solution=True):
         mesh = uh.space.mesh
+        import matplotlib.pyplot as plt
         fig = plt.figure()
         fig.set_facecolor('white')
         axes = plt.axes(projection='3d')
@@ -1,17 +1,23 @@
 
-from .mesh_data_structure import MeshDS
-from .mesh_base import Mesh, HomogeneousMesh, SimplexMesh, TensorMesh, StructuredMesh
+# NOTE: Mesh classes are imported on first access (PEP 562), so that importing
+# this package does not load every mesh and their dependencies.
+from .._lazy import attach
 
-from .interval_mesh import IntervalMesh
-from .triangle_mesh import TriangleMesh
-from .tetrahedron_mesh import TetrahedronMesh
-from .quadrangle_mesh import QuadrangleMesh
-from .hexahedron_mesh import HexahedronMesh
-from .polygon_mesh import PolygonMesh
-from .halfedge_mesh import HalfEdgeMesh2d
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'mesh_data_structure': ['MeshDS'],
+    'mesh_base': ['Mesh', 'HomogeneousMesh', 'SimplexMesh', 'TensorMesh', 'StructuredMesh'],
 
-from .uniform_mesh_2d import UniformMesh2d
-from .uniform_mesh_3d import UniformMesh3d
+    'interval_mesh': ['IntervalMesh'],
+    'triangle_mesh': ['TriangleMesh'],
+    'tetrahedron_mesh': ['TetrahedronMesh'],
+    'quadrangle_mesh': ['QuadrangleMesh'],
+    'hexahedron_mesh': ['HexahedronMesh'],
+    'polygon_mesh': ['PolygonMesh'],
+    'halfedge_mesh': ['HalfEdgeMesh2d'],
 
-from .lagrange_triangle_mesh import LagrangeTriangleMesh
-from .lagrange_quadrangle_mesh import LagrangeQuadrangleMesh
+    'uniform_mesh_2d': ['UniformMesh2d'],
+    'uniform_mesh_3d': ['UniformMesh3d'],
+
+    'lagrange_triangle_mesh': ['LagrangeTriangleMesh'],
+    'lagrange_quadrangle_mesh': ['LagrangeQuadrangleMesh'],
+})
@@ -4,7 +4,7 @@ from ..typing import TensorLike , Index, _S,_int_func
 from .. import logger
 from scipy.sparse import coo_matrix
 from .mesh_data_structure import MeshDS
-from .utils import estr2dim
+from .utils import estr2dim, simplex_tabulation
 from .plot import Plotable
 from .mesh_base import SimplexMesh
 
@@ -418,10 +418,10 @@ class IntervalMesh(SimplexMesh,Plotable):
     # shape function
     def shape_function(self, bcs: TensorLike, p: int=1, *, index: Index=_S,
                        variables: str='u', mi: Optional[TensorLike]=None) -> TensorLike:
-        TD = bcs.shape[-1] - 1
         if mi is None:
-            mi = bm.multi_index_matrix(p, TD, dtype=self.itype)
-        phi = bm.simplex_shape_function(bcs, p, mi)
+            phi = simplex_tabulation(bcs, p)
+        else:
+            phi = bm.simplex_shape_function(bcs, p, mi)
         if variables == 'u':
             return phi
         elif variables == 'x':
@@ -432,10 +432,10 @@ class IntervalMesh(SimplexMesh,Plotable):
 
     def grad_shape_function(self, bcs: TensorLike, p: int=1, *, index: Index=_S,
                             variables: str='u', mi: Optional[TensorLike]=None) -> TensorLike:
-        TD = bcs.shape[-1] - 1
         if mi is None:
-            mi = bm.multi_index_matrix(p, TD, dtype=self.itype)
-        R = bm.simplex_grad_shape_function(bcs, p, mi) # (NQ, ldof, bc)
+            R = simplex_tabulation(bcs, p, order=1) # (NQ, ldof, bc)
+        else:
+            R = bm.simplex_grad_shape_function(bcs, p, mi)
         if variables == 'u':
             return R
         elif variables == 'x':
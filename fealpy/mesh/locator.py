@@ -0,0 +1,166 @@
+
+from typing import Optional, Tuple
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from ..sparse.utils import segment_arange
+
+
+class SimplexLocator():
+    """Point location in simplex meshes with a uniform bucket grid.
+
+    The bounding box of the mesh is divided into buckets of about the size of
+    cells, and each bucket records the cells whose bounding box overlaps it.
+    A query point is then only tested against the cells in its bucket,
+    instead of all cells.
+
+    Parameters:
+        node (Tensor): Nodes of the mesh, shaped (NN, GD).
+        cell (Tensor): Cells of the mesh, shaped (NC, GD+1).
+        cell2cell (Tensor | None, optional): Neighbors of cells, shaped (NC, GD+1),\
+            where the i-th neighbor is opposite to the i-th vertex. Enables the\
+            adjacency walking from given start cells. Defaults to None.
+        eps (float, optional): Tolerance of barycentric coordinates for points\
+            on the boundary of cells. Defaults to 1e-10.
+    """
+    def __init__(self, node: TensorLike, cell: TensorLike,
+                 cell2cell: Optional[TensorLike]=None, *, eps: float=1e-10):
+        NC, NV = cell.shape
+        GD = node.shape[-1]
+        if NV != GD + 1:
+            raise ValueError(f"SimplexLocator requires cells of {GD+1} vertices "
+                             f"in {GD}-d space, but got {NV} vertices.")
+        self.node = node
+        self.cell = cell
+        self.cell2cell = cell2cell
+        self.eps = eps
+        ikwargs = bm.context(cell)
+
+        vertex = node[cell] # (NC, NV, GD)
+        self.x0 = vertex[:, 0, :]
+        J = bm.swapaxes(vertex[:, 1:, :] - self.x0[:, None, :], -1, -2)
+        self.Jinv = bm.linalg.inv(J) # (NC, TD, GD)
+
+        # 1. The bucket grid, with buckets of the averaged cell size.
+        cmin = bm.min(vertex, axis=1)
+        cmax = bm.max(vertex, axis=1)
+        self.origin = bm.min(cmin, axis=0)
+        self.corner = bm.max(cmax, axis=0)
+        extent = self.corner - self.origin
+        h = bm.mean(bm.max(cmax - cmin, axis=1))
+        shape = [max(int(bm.ceil(extent[d] / h)), 1) for d in range(GD)]
+        # Avoid too many empty buckets for thin or sparse domains.
+        factor = (_prod(shape) / (4 * NC)) ** (1 / GD)
+        if factor > 1:
+            shape = [max(int(s / factor), 1) for s in shape]
+        self.shape = shape
+        self.h = extent / bm.tensor(shape, **bm.context(extent))
+        self.h = bm.where(self.h > 0, self.h, 1.0)
+        self.strides = [_prod(shape[d+1:]) for d in range(GD)]
+
+        # 2. Register cells to the buckets overlapped by their bounding boxes.
+        imin = self._bucket_index(cmin)
+        imax = self._bucket_index(cmax)
+        ext = imax - imin + 1 # (NC, GD)
+        counts = bm.prod(ext, axis=1)
+        cid = bm.repeat(bm.arange(NC, **ikwargs), counts)
+        offset = segment_arange(counts)
+        bucket = bm.zeros(cid.shape, **ikwargs)
+        for d in range(GD-1, -1, -1):
+            e = ext[cid, d]
+            bucket = bucket + (imin[cid, d] + offset % e) * self.strides[d]
+            offset = offset // e
+
+        NB = _prod(shape)
+        order = bm.argsort(bucket, stable=True)
+        self.bucket2cell = cid[order]
+        bptr = bm.zeros((NB + 1, ), **ikwargs)
+        bptr = bm.index_add(bptr, bucket + 1, bm.ones(bucket.shape, **ikwargs))
+        self.bptr = bm.cumsum(bptr, axis=0)
+
+    def _bucket_index(self, points: TensorLike) -> TensorLike:
+        i = bm.astype(bm.floor((points - self.origin) / self.h), self.cell.dtype)
+        upper = bm.tensor(self.shape, **bm.context(i)) - 1
+        i = bm.where(i < 0, 0, i)
+        return bm.where(i > upper, upper, i)
+
+    def barycentric(self, points: TensorLike, cells: TensorLike) -> TensorLike:
+        """Barycentric coordinates of points in the given cells, shaped (NP, GD+1)."""
+        lam = bm.einsum('ngd, nd -> ng', self.Jinv[cells], points - self.x0[cells])
+        lam0 = 1 - bm.sum(lam, axis=-1, keepdims=True)
+        return bm.concat([lam0, lam], axis=-1)
+
+    def locate(self, points: TensorLike, start: Optional[TensorLike]=None, *,
+               maxit: int=16) -> Tuple[TensorLike, TensorLike]:
+        """Find the cells containing the points.
+
+        Parameters:
+            points (Tensor): Query points, shaped (NP, GD).
+            start (Tensor | None, optional): Guessed cells of the points, shaped (NP, ).\
+                Points are first located by walking from these cells through\
+                neighbors, and the unresolved points fall back to the bucket grid.\
+                Defaults to None.
+            maxit (int, optional): Maximum steps of the walking. Defaults to 16.
+
+        Returns:
+            Tensor: Indices of cells, shaped (NP, ). -1 for points outside the mesh.
+            Tensor: Barycentric coordinates in the cells, shaped (NP, GD+1).\
+                Zeros for points outside the mesh.
+        """
+        NP, GD = points.shape
+        ikwargs = bm.context(self.cell)
+        cell = bm.full((NP, ), -1, **ikwargs)
+        bc = bm.zeros((NP, GD+1), **bm.context(points))
+        todo = bm.arange(NP, **ikwargs)
+
+        if (start is not None) and (self.cell2cell is not None):
+            cur = start
+            for _ in range(maxit):
+                lam = self.barycentric(points[todo], cur)
+                k = bm.argmin(lam, axis=-1)
+                found = bm.min(lam, axis=-1) >= -self.eps
+                cell = bm.set_at(cell, todo[found], cur[found])
+                bc = bm.set_at(bc, todo[found], lam[found])
+                nxt = self.cell2cell[cur, k]
+                # Stop at the boundary, where the neighbor is the cell itself.
+                moving = (~found) & (nxt != cur)
+                todo, cur = todo[moving], nxt[moving]
+                if todo.shape[0] == 0:
+                    break
+            todo = bm.nonzero(cell < 0)[0]
+
+        if todo.shape[0] == 0:
+            return cell, bc
+
+        # Test the points against all cells in their buckets.
+        p = points[todo]
+        inbox = bm.all((p >= self.origin - self.eps) & (p <= self.corner + self.eps), axis=-1)
+        index = self._bucket_index(p)
+        bucket = bm.zeros((p.shape[0], ), **ikwargs)
+        for d in range(GD):
+            bucket = bucket + index[:, d] * self.strides[d]
+        counts = self.bptr[bucket + 1] - self.bptr[bucket]
+        counts = bm.where(inbox, counts, 0)
+        pid = bm.repeat(bm.arange(p.shape[0], **ikwargs), counts)
+        loc = segment_arange(counts, self.bptr[bucket])
+        cand = self.bucket2cell[loc]
+
+        lam = self.barycentric(p[pid], cand)
+        found = bm.min(lam, axis=-1) >= -self.eps
+        pid, cand, lam = pid[found], cand[found], lam[found]
+        if pid.shape[0] == 0:
+            return cell, bc
+        # Take the first cell found for points on the shared boundary of cells.
+        TRUE = bm.ones((1, ), dtype=bm.bool, device=bm.get_device(pid))
+        first = bm.concat([TRUE, pid[1:] != pid[:-1]])
+        cell = bm.set_at(cell, todo[pid[first]], cand[first])
+        bc = bm.set_at(bc, todo[pid[first]], lam[first])
+
+        return cell, bc
+
+
+def _prod(shape) -> int:
+    p = 1
+    for s in shape:
+        p *= s
+    return p
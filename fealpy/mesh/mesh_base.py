@@ -6,9 +6,12 @@ from ..typing import TensorLike, Index, _S
 from .. import logger
 from ..quadrature import Quadrature
 from .mesh_data_structure import MeshDS
+from .locator import SimplexLocator
 from .utils import (
-    estr2dim, simplex_gdof, simplex_ldof, tensor_gdof, tensor_ldof
+    estr2dim, simplex_gdof, simplex_ldof, tensor_gdof, tensor_ldof,
+    simplex_tabulation
 )
+from . import utils
 
 
 ##################################################
@@ -28,7 +31,7 @@ class Mesh(MeshDS):
     def multi_index_matrix(self, p: int, etype: int, dtype=None, device=None) -> TensorLike:
         dtype = self.itype if dtype is None else dtype
         device = self.device if device is None else device
-        return bm.device_put(bm.multi_index_matrix(p, etype, dtype=dtype), device=device)
+        return utils.multi_index_matrix(p, etype, dtype=dtype, device=device)
 
     def entity_barycenter(self, etype: Union[int, str], index: Optional[Index]=None) -> TensorLike:
         """Get the barycenter of the entity.
@@ -457,6 +460,46 @@ class HomogeneousMesh(Mesh):
 
 
 class SimplexMesh(HomogeneousMesh):
+    _locator = None
+
+    def construct(self, *, workers: Optional[int]=None):
+        super().construct(workers=workers)
+        self._locator = None # topology changed, rebuild the index on demand
+
+    # point location
+    def locator(self) -> SimplexLocator:
+        """Return the point locator of the mesh.
+
+        The locator is built once and kept until the topology is constructed
+        again (e.g. after refinement) or the node tensor is replaced.
+        """
+        node = self.entity('node')
+        locator = self._locator
+        if (locator is None) or (locator.node is not node):
+            cell = self.entity('cell')
+            cell2cell = self.cell_to_cell() if hasattr(self, 'face2cell') else None
+            locator = SimplexLocator(node, cell, cell2cell)
+            self._locator = locator
+        return locator
+
+    def point_to_bc(self, points: TensorLike, start: Optional[TensorLike]=None) -> Tuple[TensorLike, TensorLike]:
+        """Find the cells containing the points, and the barycentric coordinates.
+
+        Parameters:
+            points (Tensor): Query points, shaped (NP, GD).
+            start (Tensor | None, optional): Guessed cells of the points, e.g. the\
+                results of the previous query for moving points. Defaults to None.
+
+        Returns:
+            Tensor: Indices of cells, shaped (NP, ). -1 for points outside the mesh.
+            Tensor: Barycentric coordinates in the cells, shaped (NP, TD+1).
+        """
+        return self.locator().locate(points, start)
+
+    def location(self, points: TensorLike, start: Optional[TensorLike]=None) -> TensorLike:
+        """Find the cells containing the points. -1 for points outside the mesh."""
+        return self.point_to_bc(points, start)[0]
+
     # ipoints
     def number_of_local_ipoints(self, p: int, iptype: Union[int, str]='cell'):
         if isinstance(iptype, str):
@@ -473,9 +516,8 @@ class SimplexMesh(HomogeneousMesh):
 
     def shape_function(self, bcs: TensorLike, p: int=1, *, index: Index=_S,
                        mi: Optional[TensorLike]=None) -> TensorLike:
-        TD = bcs.shape[-1] - 1
         if mi is None:
-            mi = bm.multi_index_matrix(p, TD, dtype=self.itype)
+            return simplex_tabulation(bcs, p)
         phi = bm.simplex_shape_function(bcs, p, mi)
         return phi
     
@@ -486,9 +528,10 @@ class SimplexMesh(HomogeneousMesh):
                             variables: str='u', mi: Optional[TensorLike]=None) -> TensorLike:
         TD = bcs.shape[-1] - 1
         if mi is None:
-            mi = bm.multi_index_matrix(p, TD, dtype=self.itype)
-        R = bm.simplex_grad_shape_function(bcs, p, mi) # (NQ, ldof, bc)
-        
+            R = simplex_tabulation(bcs, p, order=1) # (NQ, ldof, bc)
+        else:
+            R = bm.simplex_grad_shape_function(bcs, p, mi)
+
         if variables == 'u':
             return R
         elif variables == 'x':
@@ -565,8 +608,9 @@ class TensorMesh(HomogeneousMesh):
     def shape_function(self, bcs: Tuple[TensorLike], p: int=1, *, index: Index=_S,
                        variables: str='u', mi: Optional[TensorLike]=None) -> TensorLike:
         if mi is None:
-            mi = bm.multi_index_matrix(p, 1, dtype=self.itype)
-        raw_phi = [bm.simplex_shape_function(bc, p, mi) for bc in bcs]
+            raw_phi = [simplex_tabulation(bc, p) for bc in bcs]
+        else:
+            raw_phi = [bm.simplex_shape_function(bc, p, mi) for bc in bcs]
         phi = bm.tensorprod(*raw_phi)
         if variables == 'u':
             return phi
@@ -584,8 +628,8 @@ class TensorMesh(HomogeneousMesh):
         assert isinstance(bcs, tuple)
         TD = len(bcs)
         Dlambda = bm.array([-1, 1], dtype=self.ftype, device=bm.get_device(bcs[0]))
-        phi = bm.simplex_shape_function(bcs[0], p=p)
-        R = bm.simplex_grad_shape_function(bcs[0], p=p)
+        phi = simplex_tabulation(bcs[0], p)
+        R = simplex_tabulation(bcs[0], p, order=1)
         dphi = bm.einsum('...ij, j->...i', R, Dlambda)
 
         n = phi.shape[0]**TD
@@ -5,7 +5,7 @@ from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, EntityName, _S, _int_func
 from .. import logger
 from ..sparse import COOTensor
-from .utils import estr2dim, edim2entity, MeshMeta, flocc
+from .utils import estr2dim, edim2entity, MeshMeta, flocc, sort_rows
 
 
 ##################################################
@@ -24,6 +24,9 @@ class MeshDS(metaclass=MeshMeta):
     localEdge: TensorLike # only for homogeneous mesh
     localFace: TensorLike # only for homogeneous mesh
     localFace2Edge: TensorLike
+    # NOTE: Number of threads used by `construct` when meshes are created,
+    # e.g. set `TetrahedronMesh.construct_workers = 8` for large meshes.
+    construct_workers: Optional[int] = None
 
     def __init__(self, *, TD: int, itype, ftype) -> None:
         assert hasattr(self, '_entity_dim_method_name_map')
@@ -302,12 +305,20 @@ class MeshDS(metaclass=MeshMeta):
         total_edge = cell[..., local_edge].reshape(-1, NVE)
         return total_edge
 
-    def construct(self):
+    def construct(self, *, workers: Optional[int]=None):
+        """Construct faces, edges and their relations with cells.
+
+        Parameters:
+            workers (int | None, optional): Number of threads deduplicating faces\
+                and edges in the NumPy backend. Defaults to `construct_workers`\
+                of the class, which is None for serial construction.
+        """
         if not self.is_homogeneous():
             raise RuntimeError('Can not construct for a non-homogeneous mesh.')
+        workers = self.construct_workers if workers is None else workers
 
         totalFace = self.total_face()
-        i0, i1, j = flocc(bm.sort(totalFace, axis=1))
+        i0, i1, j = flocc(sort_rows(totalFace), workers=workers)
 
         if self.TD > 1: # Do not add faces for interval mesh
             self.face = totalFace[i0, :] # this also adds the edge in 2-d meshes
@@ -325,7 +336,7 @@ class MeshDS(metaclass=MeshMeta):
             NEC = self.number_of_edges_of_cells()
 
             totalEdge = self.total_edge()
-            i2, _, j = flocc(bm.sort(totalEdge, axis=1))
+            i2, _, j = flocc(sort_rows(totalEdge), workers=workers)
             self.edge = totalEdge[i2, :]
             self.cell2edge = bm.astype(j.reshape(NC, NEC), self.itype)
 
@@ -3,14 +3,12 @@ from typing import Union, Optional, Sequence, Tuple, Any, Dict
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .. import logger
-from fealpy.cfd.sph.particle_solver_new import Space
+from .._lazy import lazy_import
 
 from .mesh_base import MeshDS 
 
-import jax.numpy as jnp
-import jax
-from jax_md import space, partition
-from jax import vmap, lax
+# NOTE: jax is optional and imported on the first use.
+jnp = lazy_import('jax.numpy')
 
 class NodeMesh(MeshDS):
     def __init__(self, node: TensorLike, nodedata: Optional[Dict] = None, itype: str = 'default_itype', ftype: str = 'default_ftype') -> None: 
@@ -3,7 +3,8 @@ from typing import Union, Dict, List, Tuple, Optional
 from typing import TypeVar, Generic
 from enum import IntEnum
 
-from mpi4py.MPI import Comm, COMM_WORLD
+import numpy as np
+from mpi4py.MPI import Comm, COMM_WORLD, Prequest, Request
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike as _DT
@@ -83,6 +84,159 @@ def split_homogeneous_mesh(mesh: _MT, /, masks: Tuple[_DT, ...]):
         yield (local_mesh, global_flags_on_bdry, src_id_on_bdry, local_id_on_bdry, global_indices)
 
 
+### Halo exchange
+
+class HaloExchange():
+    """Precomputed halo exchange of data on entities between processes.
+
+    Each virtual (ghost) entity of this process is real in exactly one other
+    process, its owner. The exchange pattern is fixed, so data are sent and
+    received by persistent requests on contiguous NumPy buffers, packed by
+    process rank.
+
+    - Update: the owners send the values of real entities to their ghosts.
+    - Accumulate: the ghosts send their values to the owners, which add them
+      to the real entities.
+
+    Each operation is split into `*_begin` and `*_end` so that local computation
+    not involving ghosts can be overlapped with the communication. Only one
+    operation of each direction, dtype and item shape can be in progress.
+
+    Parameters:
+        comm (Comm): The MPI communicator.
+        ghost_counts (ndarray): Number of ghost entities owned by each process,\
+            shaped (SIZE, ).
+        ghost_index (Tensor): Local indices of ghost entities, ordered by their\
+            owners' ranks.
+        shared_counts (ndarray): Number of real entities being ghost in each\
+            process, shaped (SIZE, ).
+        shared_index (Tensor): Local indices of real entities being ghost in\
+            other processes, ordered by the ranks. Indices can repeat if an entity\
+            is ghost in several processes.
+    """
+    UPDATE = 0
+    ACCUMULATE = 1
+
+    def __init__(self, comm: Comm, ghost_counts: np.ndarray, ghost_index: _DT,
+                 shared_counts: np.ndarray, shared_index: _DT):
+        self._comm = comm
+        self.ghost_counts = ghost_counts
+        self.ghost_index = ghost_index
+        self.shared_counts = shared_counts
+        self.shared_index = shared_index
+        # (direction, dtype, item shape) -> (send buffer, receive buffer, requests)
+        self._channels: Dict[Tuple, Tuple[np.ndarray, np.ndarray, List[Prequest]]] = {}
+        self._active: Dict[int, Tuple] = {}
+
+    def remap(self, ghost_index: _DT, shared_index: _DT):
+        """Return a halo exchange with the same pattern on other indices of
+        the same entities, e.g. positions in an array on boundary entities."""
+        return HaloExchange(self._comm, self.ghost_counts, ghost_index,
+                            self.shared_counts, shared_index)
+
+    def number_of_ghosts(self) -> int:
+        return int(self.ghost_counts.sum())
+
+    def neighbors(self) -> List[int]:
+        """Ranks of processes exchanging data with this process."""
+        flag = (self.ghost_counts > 0) | (self.shared_counts > 0)
+        return np.nonzero(flag)[0].tolist()
+
+    def _channel(self, direction: int, dtype, item_shape: Tuple[int, ...]):
+        key = (direction, np.dtype(dtype).str, item_shape)
+        if key in self._channels:
+            return key, self._channels[key]
+
+        if direction == self.UPDATE:
+            send_counts, recv_counts = self.shared_counts, self.ghost_counts
+        else:
+            send_counts, recv_counts = self.ghost_counts, self.shared_counts
+        send_buf = np.empty((int(send_counts.sum()), ) + item_shape, dtype=dtype)
+        recv_buf = np.empty((int(recv_counts.sum()), ) + item_shape, dtype=dtype)
+        comm = self._comm
+        requests = []
+        send_start = recv_start = 0
+
+        for rank in range(comm.Get_size()):
+            send_stop = send_start + int(send_counts[rank])
+            recv_stop = recv_start + int(recv_counts[rank])
+            if recv_stop > recv_start:
+                requests.append(comm.Recv_init(recv_buf[recv_start:recv_stop], rank, direction))
+            if send_stop > send_start:
+                requests.append(comm.Send_init(send_buf[send_start:send_stop], rank, direction))
+            send_start, recv_start = send_stop, recv_stop
+
+        self._channels[key] = (send_buf, recv_buf, requests)
+        return key, self._channels[key]
+
+    def _start(self, direction: int, data: _DT, index: _DT) -> None:
+        if direction in self._active:
+            raise RuntimeError("The previous exchange in the same direction "
+                               "has not been finished.")
+        item_shape = tuple(data.shape[1:])
+        key, (send_buf, _, requests) = self._channel(direction, bm.to_numpy(data[:0]).dtype, item_shape)
+        if isinstance(data, np.ndarray):
+            np.take(data, index, axis=0, out=send_buf)
+        else:
+            send_buf[...] = bm.to_numpy(data[index])
+        Prequest.Startall(requests)
+        self._active[direction] = key
+
+    def _finish(self, direction: int) -> np.ndarray:
+        if direction not in self._active:
+            raise RuntimeError("No exchange in this direction has been started.")
+        key = self._active.pop(direction)
+        _, recv_buf, requests = self._channels[key]
+        Request.Waitall(requests)
+        return recv_buf
+
+    def update_begin(self, data: _DT, /) -> None:
+        """Start sending values of real entities to their ghosts.
+
+        Parameters:
+            data (Tensor): Data on all local entities, shaped (N, ...).
+        """
+        self._start(self.UPDATE, data, self.shared_index)
+
+    def update_end(self, data: _DT, /) -> _DT:
+        """Finish the update and write the received values into the ghosts.
+        The data may be modified in-place, and the result is returned."""
+        recv = self._finish(self.UPDATE)
+        return bm.set_at(data, self.ghost_index, bm.astype(bm.from_numpy(recv), data.dtype))
+
+    def update(self, data: _DT, /) -> _DT:
+        """Overwrite values on ghost entities by those of their owners."""
+        self.update_begin(data)
+        return self.update_end(data)
+
+    def accumulate_begin(self, data: _DT, /) -> None:
+        """Start sending values on ghost entities to their owners.
+
+        Parameters:
+            data (Tensor): Data on all local entities, shaped (N, ...).
+        """
+        self._start(self.ACCUMULATE, data, self.ghost_index)
+
+    def accumulate_end(self, data: _DT, /) -> _DT:
+        """Finish the accumulation and add the received values to the real
+        entities. Values on ghosts are not changed. The data may be modified
+        in-place, and the result is returned."""
+        recv = self.accumulate_recv()
+        return bm.index_add(data, self.shared_index, bm.astype(recv, data.dtype))
+
+    def accumulate_recv(self) -> _DT:
+        """Finish the accumulation and return the received values without
+        adding them, shaped (len(shared_index), ...) and ordered as the
+        shared_index. The result may share memory with the receive buffer,
+        which is overwritten by the next accumulation."""
+        return bm.from_numpy(self._finish(self.ACCUMULATE))
+
+    def accumulate(self, data: _DT, /) -> _DT:
+        """Add values on ghost entities to their owners."""
+        self.accumulate_begin(data)
+        return self.accumulate_end(data)
+
+
 ### Genearte Tensor data on a field, such as mesh entities.
 
 class ParallelMesh(Generic[_MT]):
@@ -118,6 +272,7 @@ class ParallelMesh(Generic[_MT]):
 
         self._comm = comm if comm else COMM_WORLD
         self._Make_process_table()
+        self._halo: Dict[Tuple[str, bool], HaloExchange] = {}
 
     def __getattr__(self, name):
         return getattr(self._mesh, name)
@@ -162,6 +317,89 @@ class ParallelMesh(Generic[_MT]):
             par_id = recv_buf[pro_id]
             self._process_table[par_id] = pro_id
 
+    def Make_halo(self, etype: str, /, on_boundary: bool = False) -> HaloExchange:
+        """Return the halo exchange of entities, which is made collectively in
+        the first call for each `etype` and cached.
+
+        Parameters:
+            etype (str): Type of entities, 'node' or 'cell'.
+            on_boundary (bool, optional): Whether the exchanged data are given on\
+                boundary entities of the partition only, like `Converge`, rather\
+                than all local entities. Defaults to False.
+        """
+        key = (etype, on_boundary)
+        if key in self._halo:
+            return self._halo[key]
+
+        if (etype, False) not in self._halo:
+            self._halo[(etype, False)] = self._Make_halo(etype)
+        halo = self._halo[(etype, False)]
+
+        if on_boundary:
+            bdry_indices = bm.nonzero(getattr(self, f"boundary_{etype}_flag")())[0]
+            position = np.full((self.count(etype), ), -1, dtype=np.int64)
+            position[bm.to_numpy(bdry_indices)] = np.arange(bdry_indices.shape[0])
+            ghost_pos = position[bm.to_numpy(halo.ghost_index)]
+            shared_pos = position[bm.to_numpy(halo.shared_index)]
+            if np.any(shared_pos < 0):
+                raise RuntimeError(f"Some shared {etype}s are not on the boundary "
+                                   "of the partition.")
+            halo = halo.remap(self._index_tensor(ghost_pos), self._index_tensor(shared_pos))
+            self._halo[key] = halo
+
+        return halo
+
+    def _index_tensor(self, index: np.ndarray) -> _DT:
+        return bm.tensor(index, dtype=bm.int64, device=self.device)
+
+    def _Make_halo(self, etype: str, /) -> HaloExchange:
+        SIZE = self.mpi_size
+        bdry_indices = bm.nonzero(getattr(self, f"boundary_{etype}_flag")())[0]
+        virtual_flag = self.virtual_flag_on_boundary(etype)
+        ghost_index = bm.to_numpy(bdry_indices[virtual_flag]).astype(np.int64)
+        owner_par = bm.to_numpy(self._src_id_on_bdry[etype][virtual_flag]).astype(np.int64)
+        owner_index = bm.to_numpy(self._virtual_table[etype][virtual_flag]).astype(np.int64)
+
+        # Sort ghosts by their owners' ranks; keep the boundary order for each owner.
+        owner_rank = np.asarray(self._process_table, dtype=np.int64)[owner_par]
+        order = np.argsort(owner_rank, kind='stable')
+        ghost_counts = np.bincount(owner_rank, minlength=SIZE).astype(np.int64)
+
+        # Tell the owners which of their entities are ghosts here.
+        shared_counts = np.empty((SIZE, ), dtype=np.int64)
+        self._comm.Alltoall(ghost_counts, shared_counts)
+        shared_index = np.empty((int(shared_counts.sum()), ), dtype=np.int64)
+        self._comm.Alltoallv([np.ascontiguousarray(owner_index[order]), ghost_counts],
+                             [shared_index, shared_counts])
+
+        return HaloExchange(self._comm, ghost_counts, self._index_tensor(ghost_index[order]),
+                            shared_counts, self._index_tensor(shared_index))
+
+    def Update_ghost(self, etype: str, data: _DT, /) -> _DT:
+        """Overwrite data on virtual entities by those of their reals.
+
+        Parameters:
+            etype (str): Type of entities.
+            data (Tensor): Data on all local entities, shaped (N, ...).
+
+        Returns:
+            Tensor: The updated data. The input may be modified in-place.
+        """
+        return self.Make_halo(etype).update(data)
+
+    def Accumulate_ghost(self, etype: str, data: _DT, /) -> _DT:
+        """Add data on virtual entities to their reals, e.g. after assembling
+        local contributions. Data on virtual entities are not changed.
+
+        Parameters:
+            etype (str): Type of entities.
+            data (Tensor): Data on all local entities, shaped (N, ...).
+
+        Returns:
+            Tensor: The accumulated data. The input may be modified in-place.
+        """
+        return self.Make_halo(etype).accumulate(data)
+
     def Converge(self, etype: str, data_on_bdry: _DT, /) -> List[Union[Tuple[_DT, _DT], None]]:
         """Every virtual entities send data to their reals.
 
@@ -170,29 +408,35 @@ class ParallelMesh(Generic[_MT]):
         gathered data and their local indices in this partition. None for self.
         """
         SIZE = self.mpi_size
-        id_on_bdry = self._src_id_on_bdry[etype]
-        virtual_table = self._virtual_table[etype]
-        send_buf = [None,] * SIZE
+        halo = self.Make_halo(etype, on_boundary=True)
+        shared_index = self.Make_halo(etype).shared_index
+        halo.accumulate_begin(data_on_bdry)
+        recv = bm.astype(halo.accumulate_recv(), data_on_bdry.dtype)
+        offsets = np.concatenate([[0], np.cumsum(halo.shared_counts)])
+        result = []
 
         for par_id in range(SIZE):
             if par_id == self._id:
+                result.append(None)
                 continue
             pro_id = self._process_table[par_id]
-            mask = (id_on_bdry == par_id)
-            send_buf[pro_id] = (data_on_bdry[mask], virtual_table[mask])
+            start, stop = int(offsets[pro_id]), int(offsets[pro_id+1])
+            result.append((bm.copy(recv[start:stop]), shared_index[start:stop]))
 
-        recv_buf = self._comm.alltoall(send_buf)
-        result = []
+        return result
 
-        for par_id in range(SIZE):
-            pro_id = self._process_table[par_id]
-            result.append(recv_buf[pro_id])
+    def Broadcast(self, etype: str, data_on_bdry: _DT, /) -> _DT:
+        """Every virtual entities fetch data from their reals.
 
-        return result
+        Parameters:
+            etype (str): Type of entities.
+            data_on_bdry (Tensor): Data on boundary entities of the partition.
 
-    def Broadcast(self, etype: str, data_on_bdry: _DT, /):
-        """Every virtual entities fetch data from their reals."""
-        pass
+        Returns:
+            Tensor: The data with values on virtual entities updated. The input\
+                may be modified in-place.
+        """
+        return self.Make_halo(etype, on_boundary=True).update(data_on_bdry)
 
     ### Counter
 
@@ -3,7 +3,7 @@ from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .. import logger
 
-from .utils import simplex_gdof, simplex_ldof
+from .utils import simplex_gdof, simplex_ldof, simplex_tabulation
 from .mesh_base import SimplexMesh, estr2dim
 from .plot import Plotable
 from fealpy.sparse import csr_matrix
@@ -135,7 +135,7 @@ class TriangleMesh(SimplexMesh, Plotable):
         @berif 这里调用的是网格空间基函数的梯度
         """
         TD = bc.shape[-1] - 1
-        R = bm.simplex_grad_shape_function(bc, p)
+        R = simplex_tabulation(bc, p, order=1)
         if variables == 'x':
             Dlambda = self.grad_lambda(index=index, TD=TD)
             gphi = bm.einsum('...ij, kjm -> k...im', R, Dlambda)
@@ -352,21 +352,65 @@ class TriangleMesh(SimplexMesh, Plotable):
         """
         @berif 给定一组线段，找到这些线段的一个邻域单元集合, 且这些单元要满足一定的连通
         性
-        """
-        pass
-    
-    def location(self, points):
-        """
-        @breif  给定一组点 p , 找到这些点所在的单元
 
-        这里假设：
+        @param point 线段的端点, 形状为 (NP, 2)
+        @param segment 线段端点的编号, 形状为 (NS, 2)
+        @return 被线段穿过(包括只接触到顶点或边)的单元标记, 形状为 (NC, )
 
-        1. 所有点在网格内部，
-        2. 网格中没有洞
-        3. 区域还要是凸的
+        @note 从线段端点所在的单元出发(由点定位器得到), 沿着单元的邻接关系向外扩展,
+        只保留与线段相交的单元. 经过网格节点的线段会标记该节点周围的所有单元,
+        所以标记出的单元是边连通的. 落在网格之外的端点会被忽略.
         """
-        pass
+        NC = self.number_of_cells()
+        node = self.entity('node')
+        cell = self.entity('cell')
+        cell2cell = self.cell_to_cell()
+        kwargs = bm.context(cell)
+
+        point = bm.astype(point, self.ftype)
+        segment = bm.astype(segment, self.itype)
+        NS = segment.shape[0]
+
+        # 线段端点所在的单元作为出发单元
+        location = self.location(point)
+        sid = bm.repeat(bm.arange(NS, **kwargs), 2)
+        cid = location[segment.reshape(-1)]
+        flag = cid >= 0
+        key = bm.unique(sid[flag]*NC + cid[flag])
+        visited = key
+
+        while key.shape[0] > 0:
+            # 当前单元的边邻居, 边界上的邻居是单元本身
+            sid = bm.repeat(key // NC, 3)
+            cid = cell2cell[key % NC].reshape(-1)
+            key = bm.unique(sid*NC + cid)
+            key = key[~bm.isin(key, visited)]
+            sid, cid = key // NC, key % NC
+            flag = self._is_segment_crossing_cell(
+                    point[segment[sid]], node[cell[cid]])
+            key = key[flag]
+            visited = bm.concat([visited, key])
+
+        isCrossedCell = bm.zeros((NC, ), dtype=bm.bool, device=bm.get_device(cell))
+        isCrossedCell = bm.set_at(isCrossedCell, visited % NC, True)
+        return isCrossedCell
 
+    @staticmethod
+    def _is_segment_crossing_cell(seg, tri, tol=1e-12):
+        """
+        @brief 用分离轴定理判断线段 seg (N, 2, 2) 与三角形 tri (N, 3, 2) 是否相交(闭集意义下)
+        """
+        edge = tri[:, [1, 2, 0]] - tri # (N, 3, 2)
+        axis = bm.concat([(seg[:, 1:] - seg[:, :1]), edge], axis=1) # (N, 4, 2)
+        axis = bm.stack([-axis[..., 1], axis[..., 0]], axis=-1)
+        axis = axis/bm.sqrt(bm.sum(axis**2, axis=-1, keepdims=True))
+        ps = bm.einsum('nid, njd -> nji', seg, axis) # (N, 4, 2)
+        pt = bm.einsum('nid, njd -> nji', tri, axis) # (N, 4, 3)
+        eps = tol*bm.sum(bm.sqrt(bm.sum(edge**2, axis=-1)), axis=-1) # (N, )
+        separated = (bm.max(ps, axis=-1) < bm.min(pt, axis=-1) - eps[:, None]) | \
+                    (bm.max(pt, axis=-1) < bm.min(ps, axis=-1) - eps[:, None])
+        return ~bm.any(separated, axis=-1)
+    
     def circumcenter(self, index: Index=_S, returnradius=False):
         """
         @brief 计算三角形外接圆的圆心和半径
@@ -453,6 +497,108 @@ class TriangleMesh(SimplexMesh, Plotable):
         }
         return options
 
+    def _update_topology(self, cell, isTouchedCell, cell2edge, edge, edge2cell,
+                         candEdge, candIndex):
+        """Update the edge topology for the touched cells only.
+
+        Edges of untouched cells keep their indices. Edges of touched cells are
+        matched to the candidate edges by node pairs, and the unmatched ones
+        are appended as new edges. Candidate edges no longer used by any cell
+        are removed by moving the last edges into their slots.
+
+        Parameters:
+            cell (Tensor): The new cells, shaped (NC, 3).
+            isTouchedCell (Tensor): The flag of cells which are new or modified, shaped (NC, ).
+            cell2edge (Tensor): The cell-to-edge relation, shaped (NC, 3), only\
+                valid for untouched cells.
+            edge (Tensor): The edges, shaped (NE, 2), in the new node numbering.
+            edge2cell (Tensor): The edge-to-cell relation, shaped (NE, 4), in\
+                the new cell numbering. Negative cell indices are ignored.
+            candEdge (Tensor): Node pairs of the edges that may be used by the\
+                touched cells, shaped (K, 2). Pairs with negative nodes never match.
+            candIndex (Tensor): Indices of the candidate edges, shaped (K, ).
+        """
+        NC = cell.shape[0]
+        NE = edge.shape[0]
+        NN = self.node.shape[0]
+        kwargs = bm.context(cell)
+        localEdge = self.localEdge
+
+        def edge_key(e):
+            e = bm.astype(bm.sort(e, axis=-1), bm.int64)
+            return e[:, 0] * NN + e[:, 1]
+
+        # 1. 匹配受影响单元的边与候选边, 未匹配的边为新边
+        touched = bm.astype(bm.nonzero(isTouchedCell)[0], cell.dtype)
+        candIndex = bm.astype(candIndex, cell.dtype)
+        NT = touched.shape[0]
+        K = candIndex.shape[0]
+        ckey = edge_key(candEdge)
+        ckey = bm.where(bm.any(candEdge < 0, axis=-1),
+                        -1 - bm.arange(K, dtype=bm.int64, device=bm.get_device(ckey)), ckey)
+        tkey = edge_key(cell[touched][:, localEdge].reshape(-1, 2))
+        _, inv = bm.unique(bm.concat([ckey, tkey]), return_inverse=True)
+        cinv, tinv = inv[:K], inv[K:]
+        NU = int(bm.max(inv)) + 1 if inv.shape[0] > 0 else 0
+
+        uid2edge = bm.full((NU, ), -1, **kwargs)
+        uid2edge = bm.set_at(uid2edge, cinv, candIndex)
+        isUsed = bm.zeros((NU, ), dtype=bm.bool, device=bm.get_device(cell))
+        isUsed = bm.set_at(isUsed, tinv, True)
+        isNew = isUsed & (uid2edge < 0)
+        nNew = int(bm.sum(isNew))
+        uid2edge = bm.set_at(uid2edge, isNew, bm.arange(NE, NE + nNew, **kwargs))
+        isDead = ~(isUsed[cinv] & (uid2edge[cinv] == candIndex))
+        dead = bm.unique(candIndex[isDead])
+
+        eid = uid2edge[tinv]
+        cell2edge = bm.set_at(cell2edge, touched, eid.reshape(NT, 3))
+        edge = bm.concat([edge, bm.zeros((nNew, 2), **kwargs)], axis=0)
+        edge2cell = bm.concat([edge2cell, bm.full((nNew, 4), -1, **kwargs)], axis=0)
+
+        # 2. 收集使用这些边的单元, 包括未受影响的相邻单元
+        used = uid2edge[isUsed]
+        e2c = edge2cell[used]
+        flag0 = (e2c[:, 0] >= 0) & (e2c[:, 0] < NC)
+        flag0 = flag0 & ~isTouchedCell[bm.where(flag0, e2c[:, 0], 0)]
+        flag1 = (e2c[:, 1] >= 0) & (e2c[:, 1] < NC) & (e2c[:, 0] != e2c[:, 1])
+        flag1 = flag1 & ~isTouchedCell[bm.where(flag1, e2c[:, 1], 0)]
+        I = bm.concat([eid, used[flag0], used[flag1]])
+        C = bm.concat([bm.repeat(touched, 3), e2c[flag0, 0], e2c[flag1, 1]])
+        L = bm.concat([bm.tile(bm.arange(3, **kwargs), (NT, )), e2c[flag0, 2], e2c[flag1, 3]])
+
+        # 与 construct 一致, 第一个单元是 (单元, 局部编号) 最小的单元
+        key = bm.astype(I, bm.int64) * (3 * NC) + bm.astype(C * 3 + L, bm.int64)
+        order = bm.argsort(key)
+        I, C, L = I[order], C[order], L[order]
+        TRUE = bm.ones((1, ), dtype=bm.bool, device=bm.get_device(I))
+        changed = I[1:] != I[:-1]
+        first = bm.concat([TRUE, changed])
+        last = bm.concat([changed, TRUE])
+        e = I[first]
+        edge2cell = bm.set_at(edge2cell, e, bm.stack([C[first], C[last], L[first], L[last]], axis=-1))
+        edge = bm.set_at(edge, e, cell[C[first][:, None], localEdge[L[first]]])
+
+        # 3. 用末尾的边填充被删除的边
+        NE = edge.shape[0] - dead.shape[0]
+        hole = dead[dead < NE]
+        isMoved = bm.ones((edge.shape[0] - NE, ), dtype=bm.bool, device=bm.get_device(cell))
+        isMoved = bm.set_at(isMoved, dead[dead >= NE] - NE, False)
+        moved = bm.astype(bm.nonzero(isMoved)[0], cell.dtype) + NE
+        edge = bm.set_at(edge, hole, edge[moved])
+        edge2cell = bm.set_at(edge2cell, hole, edge2cell[moved])
+        e2c = edge2cell[hole]
+        cell2edge = bm.set_at(cell2edge, (e2c[:, 0], e2c[:, 2]), hole)
+        cell2edge = bm.set_at(cell2edge, (e2c[:, 1], e2c[:, 3]), hole)
+
+        self.cell = cell
+        self.edge = edge[:NE]
+        self.face2cell = edge2cell[:NE]
+        self.edge2cell = self.face2cell
+        self.cell2face = cell2edge
+        self.cell2edge = self.cell2face
+        self._locator = None
+
     def bisect(self, isMarkedCell=None, options={'disp': True}): #TODO
         if options['disp']:
             print('Bisection begining......')
@@ -535,6 +681,8 @@ class TriangleMesh(SimplexMesh, Plotable):
         if 'HB' in options:
             options['HB'] = bm.arange(NC)
 
+        NC0 = NC
+        touched = []
         for k in range(2):
             idx, = bm.nonzero(edge2newNode[cell2edge0] > 0)
             nc = len(idx)
@@ -547,6 +695,7 @@ class TriangleMesh(SimplexMesh, Plotable):
 
             L = idx
             R = bm.arange(NC, NC + nc)
+            touched.append(idx)
             if ('data' in options) and (options['data'] is not None):
                 for key, value in options['data'].items():
                     if value.shape == (NC,):  # 分片常数
@@ -605,8 +754,28 @@ class TriangleMesh(SimplexMesh, Plotable):
             NC = NC + nc
 
         self.NN = self.node.shape[0]
-        self.cell = cell
-        self.construct()
+
+        # 只更新被加密单元的拓扑: 被二分的边保留前一半, 后一半和内部新边追加在后面
+        isTouchedCell = bm.zeros((NC, ), dtype=bm.bool, device=self.device)
+        for idx in touched:
+            isTouchedCell = bm.set_at(isTouchedCell, idx, True)
+        isTouchedCell = bm.set_at(isTouchedCell, slice(NC0, None), True)
+        oldCell, = bm.nonzero(isTouchedCell[:NC0])
+        candIndex = cell2edge[oldCell].reshape(-1)
+        candIndex = candIndex[~isCutEdge[candIndex]]
+        cutEdge, = bm.nonzero(isCutEdge)
+        ncut = cutEdge.shape[0]
+        newIndex = bm.arange(NE, NE + ncut, dtype=self.itype, device=self.device)
+        midNode = edge2newNode[cutEdge]
+        candEdge = bm.concat([
+            edge[candIndex],
+            bm.stack([edge[cutEdge, 0], midNode], axis=-1),
+            bm.stack([midNode, edge[cutEdge, 1]], axis=-1)], axis=0)
+        candIndex = bm.concat([candIndex, cutEdge, newIndex])
+        edge = bm.concat([edge, bm.zeros((ncut, 2), dtype=self.itype, device=self.device)], axis=0)
+        edge2cell = bm.concat([self.edge2cell, bm.full((ncut, 4), -1, dtype=self.itype, device=self.device)], axis=0)
+        cell2edge = bm.concat([cell2edge, bm.zeros((NC - NC0, 3), dtype=self.itype, device=self.device)], axis=0)
+        self._update_topology(cell, isTouchedCell, cell2edge, edge, edge2cell, candEdge, candIndex)
 
     def coarsen(self, isMarkedCell=None, options={}):
         """
@@ -710,18 +879,29 @@ class TriangleMesh(SimplexMesh, Plotable):
                 value = bm.set_at(value , lidx , 0.5 * value[lidx])
                 options['data'] = bm.set_at(options['data'],key , value[isKeepCell])
 
+        NC0 = NC
         cell = cell[isKeepCell]
         isGoodNode = (isIGoodNode | isBGoodNode)
 
-        idxMap = bm.zeros(NN, dtype=self.itype, device=self.device)
+        idxMap = bm.full((NN, ), -1, dtype=self.itype, device=self.device)
         self.node = node[~isGoodNode]
 
         NN = self.node.shape[0]
-        idxMap = bm.set_at(idxMap , ~isGoodNode , bm.arange(NN))
+        idxMap = bm.set_at(idxMap , ~isGoodNode , bm.arange(NN, dtype=self.itype, device=self.device))
         cell = idxMap[cell]
 
-        self.cell = cell
-        self.construct()
+        # 只更新合并单元的拓扑, 删除的边由末尾的边填充
+        NC = cell.shape[0]
+        cellMap = bm.full((NC0, ), -1, dtype=self.itype, device=self.device)
+        cellMap = bm.set_at(cellMap, isKeepCell, bm.arange(NC, dtype=self.itype, device=self.device))
+        isTouchedCell = bm.zeros((NC, ), dtype=bm.bool, device=self.device)
+        isTouchedCell = bm.set_at(isTouchedCell, cellMap[bm.concat([t0, t2, t4])], True)
+        cell2edge = self.cell_to_edge()
+        candIndex = cell2edge[bm.concat([t0, t1, t2, t3, t4, t5])].reshape(-1)
+        edge = idxMap[self.entity('edge')]
+        edge2cell = bm.concat([cellMap[self.edge2cell[:, :2]], self.edge2cell[:, 2:]], axis=-1)
+        self._update_topology(cell, isTouchedCell, cell2edge[isKeepCell], edge,
+                              edge2cell, edge[candIndex], candIndex)
 
     def label(self, node=None, cell=None, cellidx=None):
         """
@@ -1063,12 +1243,6 @@ class TriangleMesh(SimplexMesh, Plotable):
 
         return J
 
-    def point_to_bc(self, point):
-        """
-        @brief 找到定点 point 所在的单元，并计算其重心坐标 
-        """
-        pass
-
     def mark_interface_cell(self, phi):
         """
         @brief 标记穿过界面的单元
@@ -1,6 +1,8 @@
 
-from typing import Dict, Callable, TypeVar, Tuple, Any
+from typing import Dict, Callable, TypeVar, Tuple, Any, Optional, List
+from collections import OrderedDict
 from math import comb
+import threading
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike
@@ -78,9 +80,98 @@ def inverse_relation(entity: TensorLike, size: int, index=None, *, sorted=True):
     return row, col, (size, entity.shape[0])
 
 
-def flocc(array: TensorLike, /):
+_INT64_MAX = 2**63 - 1
+
+
+def pack_rows(array: TensorLike, /) -> Optional[List[TensorLike]]:
+    """Pack the rows of a 2D array of non-negative integers into int64 keys,
+    taking the columns as digits in base `max + 1`. As many columns as possible
+    are packed into each key, so that sorting the keys lexicographically, most
+    significant first, sorts the rows lexicographically.
+
+    Returns:
+        List[TensorLike] | None: Keys shaped (N, ), most significant first, or\
+            None if the array is empty or has negative entries.
+    """
+    N, K = array.shape
+    if (N == 0) or (K == 0):
+        return None
+    if int(bm.min(array)) < 0:
+        return None
+    base = int(bm.max(array)) + 1
+    per_key = 1
+    while base ** (per_key + 1) <= _INT64_MAX:
+        per_key += 1
+
+    keys = []
+    for start in range(0, K, per_key):
+        key = bm.astype(array[:, start], bm.int64)
+        for i in range(start + 1, min(start + per_key, K)):
+            key = key * base + bm.astype(array[:, i], bm.int64)
+        keys.append(key)
+    return keys
+
+
+# Optimal sorting networks of short rows.
+_SORTING_NETWORKS = {
+    2: ((0, 1), ),
+    3: ((0, 1), (1, 2), (0, 1)),
+    4: ((0, 1), (2, 3), (0, 2), (1, 3), (1, 2)),
+}
+
+
+def sort_rows(array: TensorLike, /) -> TensorLike:
+    """Sort each row of a 2D array in ascending order, the same as
+    `bm.sort(array, axis=1)`. Rows of 2 to 4 columns, such as edges and faces,
+    are sorted by element-wise minimum and maximum of columns."""
+    network = _SORTING_NETWORKS.get(array.shape[-1], None)
+    if (array.ndim != 2) or (network is None):
+        return bm.sort(array, axis=1)
+
+    cols = [array[:, i] for i in range(array.shape[-1])]
+    for i, j in network:
+        cols[i], cols[j] = bm.minimum(cols[i], cols[j]), bm.maximum(cols[i], cols[j])
+    return bm.stack(cols, axis=1)
+
+
+def _argsort_threaded(key: TensorLike, workers: int) -> TensorLike:
+    # Stable argsort of non-negative int64 keys in NumPy threads. The keys are
+    # distributed to buckets of consecutive ranges by a radix sort of the bucket
+    # numbers, and then the buckets are sorted concurrently (NumPy releases
+    # the GIL in sorting).
+    from concurrent.futures import ThreadPoolExecutor
+    import numpy as np
+
+    NB = min(4 * workers, 2**16)
+    width = int(key.max()) // NB + 1
+    bucket = (key // width).astype(np.uint16)
+    order = np.argsort(bucket, kind='stable')
+    location = np.zeros(NB + 1, dtype=np.int64)
+    np.cumsum(np.bincount(bucket, minlength=NB), out=location[1:])
+
+    def sort_bucket(b: int):
+        start, stop = location[b], location[b+1]
+        seg = order[start:stop]
+        order[start:stop] = seg[np.argsort(key[seg], kind='stable')]
+
+    with ThreadPoolExecutor(workers) as executor:
+        list(executor.map(sort_bucket, range(NB)))
+    return order
+
+
+def flocc(array: TensorLike, /, *, workers: Optional[int]=None):
     """Find the first and last occurrence of each unique row in a 2D array.
 
+    Rows are packed into int64 keys (see `pack_rows`), so that they are sorted
+    by a single argsort if one key holds a row, or by a lexicographic sort of
+    fewer keys than columns otherwise.
+
+    Parameters:
+        array (TensorLike): A 2D array of non-negative integers.
+        workers (int | None, optional): Number of threads sorting the keys in
+            the NumPy backend. Sort in one thread if None or less than 2.
+            Defaults to None.
+
     Returns:
         out (TensorLike, TensorLike, TensorLike):
         - The first occurrence index of each unique row.
@@ -90,12 +181,28 @@ def flocc(array: TensorLike, /):
     if array.ndim != 2:
         raise ValueError("total_face must be a 2D array.")
 
-    indices = bm.lexsort(tuple(reversed(array.T)), axis=0)
-    sorted_array = array[indices]
-    diff_flag = bm.any(
-        sorted_array[1:] != sorted_array[:-1],
-        axis=1,
-    )
+    keys = pack_rows(array)
+
+    if keys is None:
+        indices = bm.lexsort(tuple(reversed(array.T)), axis=0)
+        sorted_array = array[indices]
+        diff_flag = bm.any(
+            sorted_array[1:] != sorted_array[:-1],
+            axis=1,
+        )
+    else:
+        if len(keys) > 1:
+            indices = bm.lexsort(tuple(reversed(keys)), axis=0)
+        elif (workers is not None) and (workers >= 2) and (bm.backend_name == 'numpy'):
+            indices = _argsort_threaded(keys[0], workers)
+        else:
+            indices = bm.argsort(keys[0], stable=True)
+        diff_flag = None
+        for key in keys:
+            sorted_key = key[indices]
+            flag = sorted_key[1:] != sorted_key[:-1]
+            diff_flag = flag if diff_flag is None else (diff_flag | flag)
+
     TRUE = bm.ones((1,), dtype=bm.bool, device=bm.get_device(diff_flag))
     diff_flag = bm.concat([TRUE, diff_flag, TRUE])
     group_index = bm.cumsum(diff_flag[:-1], axis=0) - 1
@@ -104,8 +211,7 @@ def flocc(array: TensorLike, /):
     i1 = indices[diff_flag[1:]] # last occurrence index: unique -> original
     j = bm.empty_like(indices)
     # NOTE: This will hardly cause thread conflicts because it is a one-to-one correspondence.
-    j = bm.set_at(j, indices, bm.arange(len(indices), dtype=j.dtype, device=bm.get_device(j))) # original <> sorted
-    j = group_index[j] # original >> unique
+    j = bm.set_at(j, indices, bm.astype(group_index, j.dtype)) # original >> unique
 
     return i0, i1, j
 
@@ -186,3 +292,113 @@ def tensor_gdof(p: int, nums: Tuple[int, ...]) -> int:
         coef *= (p-1)
         count += coef * nums[i]
     return count
+
+
+##################################################
+### Reference tabulation
+##################################################
+
+_TABULATION_MAXSIZE = 256
+_TABULATION_MAXPOINTS = 512
+_tabulation: OrderedDict = OrderedDict()
+_tabulation_lock = threading.Lock()
+
+
+def _readonly(table: TensorLike) -> TensorLike:
+    flags = getattr(table, 'flags', None)
+    if flags is not None: # numpy
+        flags.writeable = False
+    return table
+
+
+def _cached_table(key: Optional[Tuple], factory: Callable[[], TensorLike],
+                  anchor: Any=None) -> TensorLike:
+    """Get the table from the cache, or make and cache it.
+
+    The `anchor` (e.g. the points whose identity is in the key) is kept with the
+    table, so its id is not reused while the entry lives. Tables are read-only
+    on numpy, and are cloned on backends that can not mark tensors read-only.
+    """
+    if key is None:
+        return factory()
+    with _tabulation_lock:
+        entry = _tabulation.get(key, None)
+        if (entry is not None) and (entry[0] is anchor):
+            _tabulation.move_to_end(key)
+            table = entry[1]
+        else:
+            table = None
+    if table is None:
+        table = _readonly(factory())
+        with _tabulation_lock:
+            _tabulation[key] = (anchor, table)
+            if len(_tabulation) > _TABULATION_MAXSIZE:
+                _tabulation.popitem(last=False)
+    return table if (getattr(table, 'flags', None) is not None) else bm.copy(table)
+
+
+def _points_key(points: TensorLike) -> Optional[Tuple]:
+    """Key the points by identity, shape, dtype and device. Quadrature rules
+    share their points among formula objects, so the identity is stable."""
+    if (points.ndim != 2) or (points.shape[0] > _TABULATION_MAXPOINTS):
+        return None # arbitrary point sets are not worth caching
+    if getattr(points, 'requires_grad', False):
+        return None
+    if bm.backend_name == 'jax':
+        return None # traced arrays can not be kept
+    return (bm.backend_name, id(points), str(points.dtype),
+            str(bm.get_device(points)), tuple(points.shape))
+
+
+def clear_tabulation_cache() -> None:
+    """Clear the process-wide cache of reference tables."""
+    with _tabulation_lock:
+        _tabulation.clear()
+
+
+def multi_index_matrix(p: int, etype: int, *, dtype=None, device=None) -> TensorLike:
+    """The cached multi-index matrix of degree `p` on the `etype`-simplex.
+
+    The returned tensor is shared and read-only on numpy, and a clone on
+    other backends.
+    """
+    key = ('multi_index', bm.backend_name, p, etype, str(dtype), str(device))
+    def factory():
+        mi = bm.multi_index_matrix(p, etype, dtype=dtype)
+        return mi if device is None else bm.device_put(mi, device=device)
+    return _cached_table(key, factory)
+
+
+def simplex_tabulation(bcs: TensorLike, p: int, order: int=0) -> TensorLike:
+    """Tabulate the Lagrange shape functions of degree `p` on a reference simplex.
+
+    The tables are cached process-wide, keyed by (simplex dimension, p,
+    quadrature points, derivative order). The points are keyed by identity,
+    which is shared by formula objects of the same quadrature rule. Cached
+    tables are shared and read-only on numpy, and cloned on other backends.
+
+    Parameters:
+        bcs (Tensor): Barycentric coordinates of points, shaped (NQ, TD+1).
+        p (int): Degree of the shape functions.
+        order (int, optional): 0 for values shaped (NQ, ldof), and 1 for gradients\
+            with respect to barycentric coordinates shaped (NQ, ldof, TD+1).\
+            Defaults to 0.
+
+    Returns:
+        Tensor: The reference table.
+    """
+    TD = bcs.shape[-1] - 1
+    points = _points_key(bcs)
+    key = None if points is None else ('simplex', TD, p, order) + points
+
+    def factory():
+        mi = bm.multi_index_matrix(p, TD)
+        if order == 0:
+            phi = bm.simplex_shape_function(bcs, p, mi)
+            return bm.copy(phi) if phi is bcs else phi # p = 1 returns bcs itself
+        elif order == 1:
+            return bm.simplex_grad_shape_function(bcs, p, mi)
+        else:
+            raise ValueError(f"Unsupported derivative order {order}.")
+
+    return _cached_table(key, factory, anchor=bcs)
@@ -1,16 +1,36 @@
 
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 
 from ..backend import TensorLike
 from ..backend import backend_manager as bm
 
 
+def _readonly(table: TensorLike) -> TensorLike:
+    flags = getattr(table, 'flags', None)
+    if flags is not None: # numpy
+        flags.writeable = False
+    return table
+
+
+_rules: Dict[Tuple, Tuple[TensorLike, TensorLike]] = {}
+
+
 class Quadrature():
-    r"""Base class for quadrature generators."""
+    r"""Base class for quadrature generators.
+
+    Points and weights of a rule are made once per (type, index, dtype, device)
+    and shared by all formula objects of the rule, so that tables keyed by the
+    quadrature points can be reused. They must not be modified in place.
+    """
     def __init__(self, index: Optional[int]=None, *, dtype=None, device=None) -> None:
         self.dtype = dtype if dtype else bm.float64
         self.device = device
-        self.quadpts, self.weights = self.make(index)
+        key = (type(self), index, bm.backend_name, str(self.dtype), str(device))
+        rule = _rules.get(key, None)
+        if rule is None:
+            rule = tuple(_readonly(t) for t in self.make(index))
+            rule = _rules.setdefault(key, rule)
+        self.quadpts, self.weights = rule
 
     def __len__(self) -> int:
         return self.number_of_quadrature_points()
@@ -25,6 +25,8 @@ class TensorProductQuadrature(Quadrature):
             self.quadpts = TD*(bcs, ) 
             weights = TD*(ws, )
 
+        self.factor_weights = weights
+
         # 构造 einsum 运算字符串
         s0 = 'abcdef'
         s = ''
@@ -38,3 +40,9 @@ class TensorProductQuadrature(Quadrature):
     def number_of_quadrature_points(self):
         n = self.weights.shape[0]
         return n 
+
+    def get_factor_quadrature_points_and_weights(self):
+        """
+        @brief 获取各个方向上的一维积分点和积分权重，用于和因子分解
+        """
+        return self.quadpts, self.factor_weights
@@ -1,5 +1,22 @@
 
-from .conjugate_gradient import cg
-from .direct_solver import spsolve, spsolve_triangular
-from .gmres_solver import gmres
-from .gamg_solver import GAMGSolver
+# NOTE: Solvers are imported on first access (PEP 562), so that importing
+# this package does not load every solver and their dependencies.
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'conjugate_gradient': ['cg'],
+    'direct_solver': ['spsolve', 'spsolve_triangular', 'DirectSolver', 'factorize'],
+    'gmres_solver': ['gmres'],
+    'gamg_solver': ['GAMGSolver'],
+    'preconditioner': [
+        'TriangularSolver',
+        'JacobiPreconditioner',
+        'BlockJacobiPreconditioner',
+        'SSORPreconditioner'
+    ],
+    'smoother': [
+        'JacobiSmoother',
+        'GaussSeidelSmoother',
+        'ChebyshevSmoother'
+    ],
+})
@@ -0,0 +1,99 @@
+
+from typing import Tuple
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import CSRTensor
+
+
+def _index_noise(N: int, device=None) -> TensorLike:
+    """Deterministic pseudo-random numbers in [0, 1) from a multiplicative hash
+    of the node indices, used to break the ties of degrees reproducibly."""
+    i = bm.arange(N, dtype=bm.int64, device=device)
+    h = (i * 2654435761) % 4294967296
+    return bm.astype(h, bm.float64) / 4294967296.
+
+
+def strength_of_connection(A: CSRTensor, theta: float=0.025) -> CSRTensor:
+    """Strong connections of a symmetric positive definite matrix.
+
+    The entry a_ij (i != j) is strong if -a_ij / sqrt(a_ii * a_jj) > theta.
+
+    Parameters:
+        A (CSRTensor): The symmetric positive definite matrix.
+        theta (float, optional): The threshold of strong connections. Defaults to 0.025.
+
+    Returns:
+        CSRTensor: The strong part of the diagonally scaled matrix, with the\
+        diagonal removed.
+    """
+    d = bm.sqrt(bm.abs(A.diagonal()))
+    row, col = A.row, A.col
+    sm = A.values / (d[row] * d[col])
+    flag = (-sm > theta) # 对角线元素为 1，也会被过滤掉
+    G = A.partial(flag)
+    return CSRTensor(G.crow, G.col, sm[flag], A.sparse_shape)
+
+
+def ruge_stuben_chen_coarsen(A: CSRTensor, theta: float=0.025) -> Tuple[TensorLike, CSRTensor]:
+    """Ruge-Stuben coarsening modified by Long Chen.
+
+    Coarse nodes are chosen as an approximate maximal independent set of the
+    strong connection graph, in which the node of larger degree wins. Ties
+    are broken by a fixed hash of the node indices, so the splitting is
+    reproducible. Each round selects all local maxima at once.
+
+    Parameters:
+        A (CSRTensor): The symmetric positive definite matrix.
+        theta (float, optional): The threshold of strong connections. Defaults to 0.025.
+
+    Returns:
+        Tensor: The boolean flag of coarse nodes, shaped (N, ).
+        CSRTensor: The strong connection matrix.
+    """
+    # 1. 初始化参数
+    N = A.shape[0]
+    isC = bm.zeros((N, ), dtype=bm.bool, device=bm.get_device(A.col))
+    N0 = min(int(N**0.5), 25)
+
+    # 2. 生成强连通矩阵
+    G = strength_of_connection(A, theta)
+    row, col = G.row, G.col
+
+    # 3. 计算顶点的度，孤立点过多时按节点编号的哈希值选择粗点
+    deg = bm.zeros((N, ), **A.values_context())
+    deg = bm.index_add(deg, row, bm.ones(row.shape, **A.values_context()))
+    noise = _index_noise(N, device=bm.get_device(A.col))
+    if int(bm.sum(deg > 0)) < 0.25 * N**0.5:
+        isC = bm.set_at(isC, bm.argsort(noise)[:N0], True)
+        return isC, G
+
+    noise = bm.astype(noise, deg.dtype)
+    deg = bm.where(deg > 0, deg + 0.1 * noise, deg)
+
+    # 4. 寻找最大独立集
+    isF = (deg == 0) # 孤立点为细节点
+    isU = ~isF # 未决定的集合
+    upper = row < col
+
+    while int(bm.sum(isC)) < N/2 and int(bm.sum(isU)) > N0:
+        isS = deg > 0 # 从未决定的非孤立点选择
+        flag = upper & isS[row] & isS[col]
+        i, j = row[flag], col[flag]
+        # 把度小的节点从选择集移除
+        flag = deg[i] >= deg[j]
+        isS = bm.set_at(isS, j[flag], False)
+        isS = bm.set_at(isS, i[~flag], False)
+        isC = isC | isS
+
+        # 粗点的相邻点是细点
+        isF = bm.set_at(isF, row[isC[col]], True)
+        isU = ~(isF | isC)
+        deg = bm.where(isU, deg, 0.)
+
+        if int(bm.sum(isU)) <= N0:
+            # 如果未决定点的数量小于等于 N0，把未决定点设为粗点
+            isC = isC | isU
+            break
+
+    return isC, G
@@ -0,0 +1,97 @@
+
+from typing import Tuple
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+
+
+def _coarse_index(isC: TensorLike) -> Tuple[TensorLike, TensorLike]:
+    """Return the fine indices of coarse nodes and the fine-to-coarse map."""
+    coarse = bm.nonzero(isC)[0]
+    NC = coarse.shape[0]
+    f2c = bm.full(isC.shape, -1, **bm.context(coarse))
+    f2c = bm.set_at(f2c, coarse, bm.arange(NC, **bm.context(coarse)))
+    return coarse, f2c
+
+
+def _build_prolongation(N: int, coarse: TensorLike, I: TensorLike, J: TensorLike,
+                        w: TensorLike) -> Tuple[CSRTensor, CSRTensor]:
+    NC = coarse.shape[0]
+    kwargs = bm.context(coarse)
+    I = bm.concat([coarse, I])
+    J = bm.concat([bm.arange(NC, **kwargs), J])
+    val = bm.concat([bm.ones((NC, ), **bm.context(w)), w])
+    P = COOTensor(bm.stack([I, J], axis=0), val, (N, NC)).coalesce().tocsr()
+    R = P.T
+    return P, R
+
+
+def standard_interpolation(A: CSRTensor, isC: TensorLike) -> Tuple[CSRTensor, CSRTensor]:
+    """Prolongation and restriction matrices by the standard interpolation.
+
+    Each fine node is interpolated from all its coarse neighbors, weighted by
+    the matrix entries and normalized to sum one.
+
+    Parameters:
+        A (CSRTensor): The symmetric positive definite matrix.
+        isC (Tensor): The boolean flag of coarse nodes.
+
+    Returns:
+        CSRTensor: The prolongation matrix, shaped (N, NC).
+        CSRTensor: The restriction matrix, shaped (NC, N).
+    """
+    N = A.shape[0]
+    coarse, f2c = _coarse_index(isC)
+
+    row, col, val = A.row, A.col, A.values
+    flag = ~isC[row] & isC[col] # 细-->粗矩阵块
+    row, col, val = row[flag], col[flag], val[flag]
+    Dsum = bm.zeros((N, ), **A.values_context())
+    Dsum = bm.index_add(Dsum, row, val) # 每个细点对应粗点值的和
+    flag = Dsum[row] != 0
+    row, col, val = row[flag], col[flag], val[flag]
+
+    return _build_prolongation(N, coarse, row, f2c[col], val / Dsum[row])
+
+
+def two_points_interpolation(A: CSRTensor, isC: TensorLike) -> Tuple[CSRTensor, CSRTensor]:
+    """Prolongation and restriction matrices, in which each fine node is
+    interpolated from at most two coarse neighbors.
+
+    The two coarse neighbors are the first and the last one in the row of A.
+
+    Parameters:
+        A (CSRTensor): The symmetric positive definite matrix.
+        isC (Tensor): The boolean flag of coarse nodes.
+
+    Returns:
+        CSRTensor: The prolongation matrix, shaped (N, NC).
+        CSRTensor: The restriction matrix, shaped (NC, N).
+    """
+    N = A.shape[0]
+    coarse, f2c = _coarse_index(isC)
+
+    row, col, val = A.row, A.col, A.values
+    flag = ~isC[row] & isC[col] # 细-->粗矩阵块
+    row, col, val = row[flag], col[flag], val[flag]
+
+    if row.shape[0] == 0:
+        return _build_prolongation(N, coarse, row, col, val)
+
+    # CSR entries are ordered by rows, so the first and the last entries of
+    # each row are at where the row index changes.
+    changed = row[1:] != row[:-1]
+    TRUE = bm.ones((1, ), dtype=bm.bool, device=bm.get_device(row))
+    first = bm.nonzero(bm.concat([TRUE, changed]))[0]
+    last = bm.nonzero(bm.concat([changed, TRUE]))[0]
+
+    fine = row[first]
+    Dsum = val[first] + val[last]
+    flag = Dsum != 0
+    fine, first, last, Dsum = fine[flag], first[flag], last[flag], Dsum[flag]
+    I = bm.concat([fine, fine])
+    J = f2c[bm.concat([col[last], col[first]])]
+    w = bm.concat([val[last], val[first]]) / bm.concat([Dsum, Dsum])
+
+    return _build_prolongation(N, coarse, I, J, w)
@@ -1,5 +1,5 @@
 
-from typing import Optional, Protocol
+from typing import Optional, Protocol, Union, Tuple, Dict, Any
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike
@@ -14,8 +14,10 @@ class SupportsMatmul(Protocol):
 def cg(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
        batch_first: bool=False,
        atol: float=1e-12, rtol: float=1e-8,
-       maxiter: Optional[int]=10000) -> TensorLike:
-    """Solve a linear system Ax = b using the Conjugate Gradient (CG) method.
+       maxiter: Optional[int]=10000,
+       M: Optional[SupportsMatmul]=None,
+       returninfo: bool=False) -> Union[TensorLike, Tuple[TensorLike, Dict[str, Any]]]:
+    """Solve a linear system Ax = b using the (preconditioned) Conjugate Gradient (CG) method.
 
     Parameters:
         A (SupportsMatmul): The coefficient matrix of the linear system.
@@ -28,16 +30,24 @@ def cg(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
         rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
         maxiter (int, optional): Maximum number of iterations allowed. Default is 10000.\
         If not provided, the method will continue until convergence based on the given tolerances.
+        M (SupportsMatmul, optional): The preconditioner, approximating the inverse of A.\
+        `M @ r` is applied to residuals in the same layout as `A @ x`. Default is None.
+        returninfo (bool, optional): Whether to return the convergence information. Default is False.
 
     Returns:
         Tensor: The approximate solution to the system Ax = b.
+        dict: The convergence information, only returned if `returninfo` is True.\
+        Contains `niter` (int), `residual` (list of residual norms of each column\
+        in every iteration) and `converged` (bool tensor of each column).
 
     Raises:
         ValueError: If inputs do not meet the specified conditions (e.g., A is not sparse, dimensions mismatch).
 
     Note:
-        This implementation assumes that A is a symmetric positive-definite matrix,
+        This implementation assumes that A (and M if given) is a symmetric positive-definite matrix,
         which is a common requirement for the Conjugate Gradient method to work correctly.
+        Columns of a batched right-hand side converge separately: each column
+        is checked against its own tolerance, and is frozen once converged.
     """
     assert isinstance(b, TensorLike), "b must be a Tensor"
     if x0 is not None:
@@ -57,55 +67,86 @@ def cg(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
         b = bm.swapaxes(b, 0, 1)
         x0 = bm.swapaxes(x0, 0, 1)
 
-    sol = _cg_impl(A, b, x0, atol, rtol, maxiter)
+    sol, info = _cg_impl(A, b, bm.copy(x0), atol, rtol, maxiter, M)
 
     if (not single_vector) and batch_first:
         sol = bm.swapaxes(sol, 0, 1)
 
+    if returninfo:
+        return sol, info
+
     return sol
 
 
-def _cg_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, atol, rtol, maxiter):
+# NOTE: Backends whose elementwise functions accept the `out` argument.
+_OUT_BACKENDS = {'numpy', 'pytorch'}
+
+
+def _cg_impl(A: SupportsMatmul, b: TensorLike, x: TensorLike, atol, rtol, maxiter,
+             M: Optional[SupportsMatmul]=None):
+    """The CG iteration. The iterate x, the residual r and the direction p are
+    updated in place, and the elementwise products (the axpy updates and the
+    dot products) are written into one temporary allocated per solve, on
+    backends supporting `out`. Only `A @ p` and `M @ r` allocate new tensors
+    in every iteration."""
     # initialize
-    x = x0              # (dof, batch)
-    r = b - A @ x       # (dof, batch)
-    p = r               # (dof, batch)
-    n_iter = 0
-    b_norm = bm.linalg.norm(b)
     sum_func = bm.sum
     sqrt_func = bm.sqrt
+    where_func = bm.where
+
+    r = b - A @ x       # (dof, batch)
+    z = r if M is None else M @ r
+    p = bm.copy(z)      # (dof, batch)
+    use_out = (bm.backend_name in _OUT_BACKENDS) and \
+        not any(getattr(t, 'requires_grad', False) for t in (b, x, r))
+    tmp = bm.empty_like(r) if use_out else None
+
+    def mul(u, v):
+        return bm.multiply(u, v, out=tmp) if use_out else u * v
+
+    rTz = sum_func(mul(r, z), axis=0)  # (batch,)
+    r_norm = sqrt_func(sum_func(mul(r, r), axis=0))
+    b_norm = sqrt_func(sum_func(b**2, axis=0))
+    tol = where_func(rtol * b_norm > atol, rtol * b_norm, atol)
+    converged = r_norm < tol
+    residual = [r_norm]
+    n_iter = 0
 
     # iterate
-    while True:
-        Ap = A @ p      # (dof, batch)
-        rTr = sum_func(r**2, axis=0)
-        alpha = rTr / sum_func(p*Ap, axis=0)  # r @ r / (p @ Ap) # (batch,)
-        x = x + alpha[None, ...] * p  # (dof, batch)
-        r_new = r - alpha[None, ...] * Ap
-        rTr_new = sum_func(r_new**2, axis=0)  # (batch,)
-        r_norm_new = sqrt_func(sum_func(rTr_new))
+    while not bm.all(converged):
+        if (maxiter is not None) and (n_iter >= maxiter):
+            logger.info(f"CG: failed, stopped by maxiter ({maxiter}).")
+            break
 
+        Ap = A @ p      # (dof, batch)
+        pAp = sum_func(mul(p, Ap), axis=0)
+        # Converged columns are frozen by a zero step size.
+        active = ~converged
+        alpha = where_func(active, rTz / where_func(active, pAp, 1.0), 0.0)  # (batch,)
+        x += mul(p, alpha[None, ...])
+        r -= mul(Ap, alpha[None, ...])
+
+        if M is None:
+            z = r
+        else:
+            z = M @ r
+        rTz_new = sum_func(mul(r, z), axis=0)  # (batch,)
+        r_norm = sqrt_func(sum_func(mul(r, r), axis=0))
+        residual.append(r_norm)
         n_iter += 1
+        converged = converged | (r_norm < tol)
 
-        if r_norm_new < atol:
-            logger.info(f"CG: converged in {n_iter} iterations, "
-                        "stopped by absolute tolerance.")
-            break
-
-        if r_norm_new < rtol * b_norm:
-            logger.info(f"CG: converged in {n_iter} iterations, "
-                        "stopped by relative tolerance.")
-            break
+        beta = where_func(active, rTz_new / where_func(active, rTz, 1.0), 0.0)  # (batch,)
+        p *= beta[None, ...]
+        p += z
+        rTz = rTz_new
 
-        if (maxiter is not None) and (n_iter >= maxiter):
-            logger.info(f"CG: failed, stopped by maxiter ({maxiter}).")
-            break
+    else:
+        logger.info(f"CG: converged in {n_iter} iterations.")
 
-        beta = rTr_new / rTr # (batch,)
-        p = r_new + beta[None, ...] * p
-        r = r_new
+    info = {'niter': n_iter, 'residual': residual, 'converged': converged}
 
-    return x
+    return x, info
 
     # @staticmethod
     # def setup_context(ctx, inputs, output):
@@ -125,6 +125,214 @@ def spsolve(A:[COOTensor, CSRTensor], b, solver:str="mumps"):
     else:
         raise ValueError(f"Unknown solver: {solver}")
 
+class DirectSolver():
+    """Sparse direct solver which keeps the factorization between solves.
+
+    The symbolic analysis and the numerical factorization are done once in
+    `factorize`. After that, `solve` only runs the forward and backward
+    substitutions, and `refactor` reuses the analysis of the same pattern
+    with new values.
+
+    Parameters:
+        A(COOTensor | CSRTensor | None): The matrix to factorize. Defaults to None.
+        solver(str): The backend solver, "mumps" or "scipy". Defaults to "mumps".
+
+    Note:
+        The factorization lives on the CPU. Right-hand sides of other backends
+        are converted to numpy, and the solutions are converted back.
+        Real matrices are factorized in float64, and complex matrices in
+        complex128 (ZMumpsContext for MUMPS).
+    """
+    def __init__(self, A=None, solver: str="mumps"):
+        if solver not in {"mumps", "scipy"}:
+            raise ValueError(f"Unknown solver: {solver}")
+        self.solver = solver
+        self._ctx = None
+        self._lu = None
+        self._values = None
+        if A is not None:
+            self.factorize(A)
+
+    def __del__(self):
+        self.release()
+
+    @property
+    def is_factorized(self):
+        return self._values is not None
+
+    def factorize(self, A):
+        """Analyse and factorize the matrix A, releasing the previous factors."""
+        self.release()
+        A = A.tocoo()
+        if A.nnz == 0 or A.shape[0] != A.shape[1]:
+            raise ValueError(f"A must be a non-empty square matrix, but got shape {A.shape}.")
+        self._shape = tuple(A.shape)
+        self._row = bm.to_numpy(A.row).astype(np.int64)
+        self._col = bm.to_numpy(A.col).astype(np.int64)
+        values = bm.to_numpy(A.values)
+        self._dtype = np.result_type(values.dtype, np.float64)
+
+        if self.solver == "mumps":
+            self._mumps_analyse()
+        else:
+            self._scipy_analyse()
+        return self._factorize_numeric(values)
+
+    def _mumps_analyse(self):
+        import mumps
+        if np.issubdtype(self._dtype, np.complexfloating):
+            MumpsContext = getattr(mumps, 'ZMumpsContext', None)
+            if MumpsContext is None:
+                raise TypeError("Complex matrices require ZMumpsContext, which is "
+                                "not provided by the installed PyMUMPS.")
+        else:
+            MumpsContext = mumps.DMumpsContext
+        ctx = MumpsContext()
+        ctx.set_silent()
+        ctx.set_shape(self._shape[0])
+        # MUMPS uses 1-based indices and sums duplicated entries.
+        self._irn = self._row + 1
+        self._jcn = self._col + 1
+        ctx.set_centralized_assembled_rows_cols(self._irn, self._jcn)
+        ctx.run(job=1)
+        self._ctx = ctx
+
+    def _scipy_analyse(self):
+        # Merge duplicated entries into the sorted CSC pattern once, and keep
+        # the map from entries to CSC slots for refactoring.
+        N = self._shape[0]
+        key = self._col * N + self._row
+        key, self._slot = np.unique(key, return_inverse=True)
+        counts = np.bincount(key // N, minlength=N)
+        self._indptr = np.concatenate([[0], np.cumsum(counts)])
+        self._indices = key % N
+
+    def refactor(self, values):
+        """Factorize again with new values, reusing the analysis of the pattern.
+
+        Parameters:
+            values(Tensor): The new values in the order of entries of the factorized\
+                matrix, shaped (nnz, ).
+        """
+        if not self.is_factorized:
+            raise RuntimeError("DirectSolver.refactor called before factorize.")
+        values = bm.to_numpy(values).reshape(-1)
+        if values.shape[0] != self._row.shape[0]:
+            raise ValueError(f"Expected {self._row.shape[0]} values, but got {values.shape[0]}.")
+        return self._factorize_numeric(values)
+
+    def _factorize_numeric(self, values):
+        dtype = np.result_type(values.dtype, np.float64)
+        if dtype != self._dtype:
+            # Real values becoming complex or the other way around.
+            self._dtype = dtype
+            if self.solver == "mumps":
+                self._ctx.destroy()
+                self._mumps_analyse()
+        values = values.astype(self._dtype)
+
+        if self.solver == "mumps":
+            self._a = values
+            self._ctx.set_centralized_assembled_values(self._a)
+            self._ctx.run(job=2)
+        else:
+            from scipy.sparse import csc_matrix
+            from scipy.sparse.linalg import splu
+            NNZ = self._indices.shape[0]
+            data = np.bincount(self._slot, weights=values.real, minlength=NNZ)
+            if np.issubdtype(self._dtype, np.complexfloating):
+                data = data + 1j * np.bincount(self._slot, weights=values.imag, minlength=NNZ)
+            A = csc_matrix((data, self._indices, self._indptr), shape=self._shape)
+            self._lu = splu(A)
+
+        self._values = values
+        return self
+
+    def update(self, A):
+        """Make the factors match A. Nothing is done if A equals the factorized
+        matrix, only the numerical factorization is redone if the pattern is
+        the same, otherwise A is factorized from scratch.
+        """
+        if self.is_factorized and tuple(A.shape) == self._shape:
+            A = A.tocoo()
+            row = bm.to_numpy(A.row)
+            col = bm.to_numpy(A.col)
+            if np.array_equal(row, self._row) and np.array_equal(col, self._col):
+                values = bm.to_numpy(A.values)
+                if not np.array_equal(values, self._values):
+                    self._factorize_numeric(values)
+                return self
+        return self.factorize(A)
+
+    def solve(self, b):
+        """Solve Ax = b with the kept factors.
+
+        Parameters:
+            b(Tensor): The right-hand side, shaped (N, ) or (N, nrhs).
+
+        Returns:
+            Tensor: The solution with the same shape as b.
+        """
+        if not self.is_factorized:
+            raise RuntimeError("DirectSolver.solve called before factorize.")
+        rhs = bm.to_numpy(b)
+        complex_rhs = np.issubdtype(rhs.dtype, np.complexfloating)
+
+        if complex_rhs and not np.issubdtype(self._dtype, np.complexfloating):
+            # Real factors: solve the real and imaginary parts together.
+            parts = np.stack([rhs.real, rhs.imag], axis=-1).reshape(rhs.shape[0], -1)
+            x = self._solve_numpy(parts).reshape(rhs.shape + (2, ))
+            x = x[..., 0] + 1j * x[..., 1]
+        else:
+            x = self._solve_numpy(rhs)
+
+        kwargs = bm.context(b)
+        if np.issubdtype(x.dtype, np.complexfloating) and not complex_rhs:
+            kwargs.pop('dtype') # complex solutions of real right-hand sides
+        return bm.tensor(x, **kwargs)
+
+    def _solve_numpy(self, rhs: np.ndarray) -> np.ndarray:
+        if self.solver == "scipy":
+            return self._lu.solve(rhs.astype(self._dtype))
+
+        # MUMPS overwrites the right-hand sides with the solutions, given as
+        # one (N, nrhs) array in column-major order.
+        N = self._shape[0]
+        x = np.array(rhs.reshape(N, -1), dtype=self._dtype, order='F')
+        ctx = self._ctx
+        # NOTE: set_rhs of PyMUMPS only accepts one column.
+        ctx.id.nrhs = x.shape[1]
+        ctx.id.lrhs = N
+        ctx.id.rhs = ctx.cast_array(x)
+        self._rhs = x # keep the buffer alive during the solve
+        ctx.run(job=3)
+        self._rhs = None
+        return x.reshape(rhs.shape)
+
+    def __matmul__(self, b):
+        return self.solve(b)
+
+    def release(self):
+        """Free the factors. The solver can be factorized again later."""
+        if getattr(self, '_ctx', None) is not None:
+            self._ctx.destroy()
+        self._ctx = None
+        self._lu = None
+        self._values = None
+
+
+def factorize(A:[COOTensor, CSRTensor], solver:str="mumps"):
+    """Factorize a sparse matrix once for repeated solves.
+
+    Parameters:
+        A(COOTensor | CSRTensor): The matrix of the linear system.
+        solver(str): The solver to use. It can be "mumps" or "scipy".
+
+    Returns:
+        DirectSolver: The factorized solver, see `DirectSolver.solve`.
+    """
+    return DirectSolver(A, solver=solver)
+
 def _cupy_spsolve_triangular(A, b, lower=True):
     """Solve a linear system using cupy.
 
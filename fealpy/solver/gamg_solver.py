@@ -1,7 +1,10 @@
+import math
 
 from ..backend import backend_manager as bm
 from .conjugate_gradient import cg
-from .direct_solver import spsolve
+from .smoother import JacobiSmoother, GaussSeidelSmoother, ChebyshevSmoother
+from .amg_coarsen import ruge_stuben_chen_coarsen
+from .amg_interpolation import standard_interpolation, two_points_interpolation
 from ..mesh.triangle_mesh import TriangleMesh
 from ..sparse.coo_tensor import COOTensor
 from ..sparse.csr_tensor import CSRTensor
@@ -32,6 +35,7 @@ class GAMGSolver():
             csolver: str = 'direct', # 默认粗网格解法器
             rtol: float = 1e-8,      # 相对误差收敛阈值
             atol: float = 1e-8,      # 绝对误差收敛阈值
+            stype: str = 'J', # 默认光滑子类型
             ):
         self.csize = csize 
         self.theta = theta
@@ -44,43 +48,129 @@ class GAMGSolver():
         self.csolver = csolver
         self.rtol = rtol
         self.atol = atol
-
-    # def setup(self, A):
-    #     """
-    #     @brief 给定离散矩阵 A, 构造从细空间到粗空间的插值算子
-
-    #     @param[in] A 矩阵
-    #     @param[in] space 离散空间
-    #     @param[in] cdegree 粗空间的次数
-
-    #     @note 注意这里假定第 0 层为最细层，第 1、2、3 ... 层变的越来越粗
-    #     """
-
-    #     # 1. 建立初步的算子存储结构
-    #     self.A = [A]
-    #     self.L = [ ] # 下三角 
-    #     self.U = [ ] # 上三角
-    #     self.D = [ ] # 对角线
-    #     self.P = [ ] # 延拓算子
-    #     self.R = [ ] # 限制矩阵
+        self.stype = stype
 
     def setup(self, A, L=None, U=None, D=None, P=None, R=None):
         """
         @brief 给定离散矩阵 A, 构造从细空间到粗空间的插值算子
-        @param[in] A 矩阵
+
+        @param[in] A 矩阵，或者各层矩阵组成的列表
         @param[in] L 下三角矩阵，默认值为 None
         @param[in] U 上三角矩阵，默认值为 None
         @param[in] D 对角线矩阵，默认值为 None
         @param[in] P 延拓算子，默认值为 None
         @param[in] R 限制矩阵，默认值为 None
+
         @note 注意这里假定第 0 层为最细层，第 1、2、3 ... 层变的越来越粗
+        @note 如果没有传入延拓算子 P，则由矩阵 A 代数地构造各层的算子：
+              1. ctype 为 'C' 时用 Ruge-Stuben-Chen 方法选择粗点
+              2. itype 为 'T' 时用两点插值，为 'S' 时用标准插值
+              3. 粗矩阵由 Galerkin 乘积 R @ A @ P 得到
+        @note 光滑子和最粗层解法器在这里构造一次，之后的每个循环都重复使用：
+              1. stype 为 'GS' 时用分层调度的 Gauss-Seidel 光滑子，'J' 时用加权 Jacobi
+                 光滑子，'C' 时用 Chebyshev 多项式光滑子
+              2. csolver 为 'direct' 时预先计算最粗层矩阵的（伪）逆，为 'CG' 时用
+                 迭代次数有限的共轭梯度法
+        """
+        if P is None:
+            self._amg_setup(A[0] if isinstance(A, (list, tuple)) else A)
+        else:
+            self.A = A
+            self.L = L if L is not None else []  # 如果未传入L，默认使用空列表
+            self.U = U if U is not None else []  # 如果未传入U，默认使用空列表
+            self.D = D if D is not None else []  # 如果未传入D，默认使用空列表
+            self.P = P if P is not None else []  # 如果未传入P，默认使用空列表
+            self.R = R if R is not None else []  # 如果未传入R，默认使用空列表
+
+        # 预先构造光滑子和最粗层解法器
+        NL = len(self.A)
+        self.smoothers = [self._get_smoother(self.A[l]) for l in range(NL - 1)]
+        self._setup_coarse_solver(self.A[-1])
+
+    def _get_smoother(self, A):
+        """
+        @brief 构造一层上的光滑子
+        """
+        if self.stype == 'GS':
+            return GaussSeidelSmoother(A)
+        elif self.stype == 'J':
+            return JacobiSmoother(A)
+        elif self.stype == 'C':
+            return ChebyshevSmoother(A)
+        else:
+            raise ValueError(f"Unsupported smoother type '{self.stype}'.")
+
+    def _setup_coarse_solver(self, A):
+        """
+        @brief 构造最粗层解法器，直接法只在这里分解一次
+        """
+        if self.csolver == 'direct':
+            # 最粗层矩阵规模很小，用稠密的伪逆，可以处理奇异（如纯 Neumann）的情形
+            self.Ainv = bm.linalg.pinv(A.to_dense(), hermitian=True)
+        elif self.csolver == 'CG':
+            self.Ainv = None
+        else:
+            raise ValueError(f"Unsupported coarse solver '{self.csolver}'.")
+
+    def _amg_setup(self, A):
         """
-        self.A = A
-        self.L = L if L is not None else []  # 如果未传入L，默认使用空列表
-        self.U = U if U is not None else []  # 如果未传入U，默认使用空列表
-        self.D = D if D is not None else []  # 如果未传入D，默认使用空列表
-        self.P = P if P is not None else []  # 如果未传入P，默认使用空列表
-        self.R = R if R is not None else []  # 如果未传入R，默认使用空列表
+        @brief 代数地构造各层的矩阵、延拓和限制算子
+        """
+        if self.ctype != 'C':
+            raise ValueError(f"Unsupported coarsening type '{self.ctype}'.")
+
+        if self.itype == 'T':
+            interpolation = two_points_interpolation
+        elif self.itype == 'S':
+            interpolation = standard_interpolation
+        else:
+            raise ValueError(f"Unsupported interpolation type '{self.itype}'.")
+
+        # 1. 建立初步的算子存储结构
+        # 光滑子自己保存所需的三角部分和对角线，这里不再保存 L、U、D 的副本
+        self.A = [A.tocsr()]
+        self.L = [ ] # 下三角，只由用户传入
+        self.U = [ ] # 上三角，只由用户传入
+        self.D = [ ] # 对角线，只由用户传入
+        self.P = [ ] # 延拓算子
+        self.R = [ ] # 限制矩阵
+
+        # 2. 基于矩阵的代数粗化
+        NN = math.ceil(math.log2(self.A[-1].shape[0])/2-4)
+        NL = max(min(int(NN), 8), 2) # 估计粗化的层数
+        for l in range(NL):
+            A = self.A[-1]
+            isC, _ = ruge_stuben_chen_coarsen(A, self.theta)
+            P, R = interpolation(A, isC)
+            self.P.append(P)
+            self.R.append(R)
+            self.A.append(R.matmul(A).matmul(P))
+
+            if self.A[-1].shape[0] < self.csize:
+                break
+
+    def solve(self, b):
+        """
+        @brief 用多重网格预条件的迭代法求解 Ax = b
+        """
+        if self.isolver == 'CG':
+            return cg(self.A[0], b, M=self, atol=self.atol, rtol=self.rtol,
+                      maxiter=self.maxit)
+        else:
+            raise ValueError(f"Unsupported iterative solver '{self.isolver}'.")
+
+    def __matmul__(self, r):
+        """
+        @brief 作为预条件子作用在残量 r 上，即 M @ r
+        """
+        if self.ptype == 'V':
+            return self.vcycle(r)
+        elif self.ptype == 'W':
+            return self.wcycle(r)
+        elif self.ptype == 'F':
+            return self.fcycle(r)
+        else:
+            raise ValueError(f"Unsupported preconditioner type '{self.ptype}'.")
 
     def construct_coarse_equation(self, A, F, level=1):
         """
@@ -120,9 +210,13 @@ class GAMGSolver():
             print(l, "-th level:")
             print("A.shape = ", self.A[l].shape)
             if l < NL-1:
-                print("L.shape = ", self.L[l].shape) 
-                print("U.shape = ", self.U[l].shape) 
-                print("D.shape = ", self.D[l].shape)
+                print("smoother = ", type(self.smoothers[l]).__name__)
+                if l < len(self.L):
+                    print("L.shape = ", self.L[l].shape) 
+                if l < len(self.U):
+                    print("U.shape = ", self.U[l].shape) 
+                if l < len(self.D):
+                    print("D.shape = ", self.D[l].shape)
                 print("P.shape = ", self.P[l].shape) 
                 print("R.shape = ", self.R[l].shape) 
 
@@ -148,6 +242,57 @@ class GAMGSolver():
     #     return x
 
 
+    def coarse_solve(self, r):
+        """
+        @brief 在最粗层上求解 Ae=r
+        """
+        if self.Ainv is not None:
+            return self.Ainv @ r
+        # 最粗层的规模很小，迭代次数不超过其规模
+        return cg(self.A[-1], r, atol=self.atol, rtol=self.rtol,
+                  maxiter=self.A[-1].shape[0])
+
+    def presmooth(self, r, level):
+        """
+        @brief 前磨光，共光滑 sstep + 1 次
+        """
+        S = self.smoothers[level]
+        e = S.smooth(r, pre=True)
+        for i in range(self.sstep):
+            e = S.smooth(r, e, pre=True)
+        return e
+
+    def postsmooth(self, r, e, level):
+        """
+        @brief 后磨光，共光滑 sstep + 1 次
+        """
+        S = self.smoothers[level]
+        for i in range(self.sstep + 1):
+            e = S.smooth(r, e, pre=False)
+        return e
+
+    def _cycle(self, r, level, ctype):
+        """
+        @brief 从第 level 层开始的多重网格循环
+
+        @param ctype 'V'、'W' 或 'F'，决定在粗一层上递归的次数和方式
+        """
+        NL = len(self.A)
+        if level == NL - 1: # 如果是最粗层
+            return self.coarse_solve(r)
+
+        e = self.presmooth(r, level)
+        rc = self.R[level] @ (r - self.A[level] @ e)
+
+        ec = self._cycle(rc, level + 1, ctype)
+        if ctype != 'V':
+            # W 循环在粗一层上再做一次 W 循环，F 循环再做一次 V 循环
+            ctype_next = 'W' if ctype == 'W' else 'V'
+            ec = ec + self._cycle(rc - self.A[level + 1] @ ec, level + 1, ctype_next)
+
+        e = e + self.P[level] @ ec
+        return self.postsmooth(r, e, level)
+
     def vcycle(self, r, level=0):
         """
         @brief V-Cycle 方法求解 Ae=r  
@@ -161,30 +306,7 @@ class GAMGSolver():
         6. 在每个更细的空间中，先进行后磨光（即再次迭代求解），然后再将解延拓到下一个更细的空间中
         7. 重复步骤6，直到达到最细的网格。
         """
-
-        NL = len(self.A)
-        r = [None]*level + [r] # 残量列表
-        e = [None]*level       # 求解列表 
-
-        # 前磨光
-        for l in range(level, NL - 1, 1):
-            el = spsolve(self.L[l],r[l])
-            for i in range(self.sstep):
-                el += spsolve(self.L[l], r[l] - self.A[l] @ el)
-            e.append(el)
-            r.append(self.R[l] @ (r[l] - self.A[l] @ el))
-
-        el = cg(self.A[-1], r[-1])
-        e.append(el)
-
-        # 后磨光
-        for l in range(NL - 2, level - 1, -1):
-            e[l] += self.P[l] @ e[l + 1]
-            e[l] +=spsolve(self.U[l], r[l] - self.A[l] @ e[l])
-            for i in range(self.sstep): # 后磨光
-                e[l] += spsolve(self.U[l], r[l] - self.A[l] @ e[l])
-
-        return e[level]
+        return self._cycle(r, level, 'V')
 
     def wcycle(self, r, level=0):
         """
@@ -192,58 +314,22 @@ class GAMGSolver():
 
         @param r 第 level 空间层的残量
         @param level 空间层编号
-        """
-
-        NL = len(self.A)
-        if level == (NL - 1): # 如果是最粗层
-            e = cg(self.A[-1], r)
-            return e
-
-        e = cg(self.A[level], r)
-        for s in range(self.sstep):
-            e += cg(self.A[level], r - self.A[level] @ e) 
-
-        rc = self.R[level] @ ( r - self.A[level] @ e) 
-
-        ec = self.wcycle(rc, level=level+1)
-        ec += self.wcycle( rc - self.A[level+1] @ ec, level=level+1)
-        
-        e += self.P[level] @ ec
-        e += cg(self.A[level], r - self.A[level] @ e)
-        for s in range(self.sstep):
-            e += cg(self.A[level], r - self.A[level] @ e)
-        return e
 
+        @note 每一层上对粗一层递归两次 W 循环
+        """
+        return self._cycle(r, level, 'W')
 
-    def fcycle(self, r):
+    def fcycle(self, r, level=0):
         """
         @brief F-Cycle 方法求解 Ae=r
+
+        @param r 第 level 空间层的残量
+        @param level 空间层编号
+
+        @note 每一层上对粗一层先递归一次 F 循环，再做一次 V 循环。F 循环不是对称的，
+              作为共轭梯度法的预条件子时收敛性没有保证
         """
-        NL = len(self.A)
-        r = [r] 
-        e = [ ]
-
-        # 从最细层到次最粗层
-        for l in range(0, NL - 1, 1):
-            el = self.vcycle(r[l], level=l)
-            for s in range(self.sstep):
-                el += self.vcycle(r[l] - self.A[l] @ el, level=l)
-
-            e.append(el)
-            r.append(self.R[l] @ (r[l] - self.A[l] @ e[l]))
-
-        # 最粗层直接求解 
-        ec = cg(self.A[-1], r[-1])
-        e.append(ec)
-
-        # 从次最粗层到最细层
-        for l in range(NL - 2, -1, -1):
-            e[l] += self.P[l] @ e[l+1]
-            e[l] += self.vcycle(r[l] - self.A[l] @ e[l], level=l)
-            for s in range(self.sstep):
-                e[l] += self.vcycle(r[l] - self.A[l] @ e[l], level=l)
-
-        return e[0]
+        return self._cycle(r, level, 'F')
 
 
     # def bpx(self, r):
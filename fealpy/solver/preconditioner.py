@@ -0,0 +1,189 @@
+
+from typing import Optional, Union
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+from ..sparse.utils import segment_arange
+
+__all__ = [
+    'TriangularSolver',
+    'JacobiPreconditioner',
+    'BlockJacobiPreconditioner',
+    'SSORPreconditioner',
+]
+
+_SparseMatrix = Union[COOTensor, CSRTensor]
+
+
+class TriangularSolver():
+    """Level-scheduled solver for sparse triangular systems.
+
+    Solves (D/omega + L) x = b if `lower` else (D/omega + U) x = b, where D, L
+    and U are the diagonal, the strictly lower and the strictly upper parts of A.
+    Rows are grouped into levels in the setup, such that rows in a level only
+    depend on rows in the previous levels. Each level is then solved at once
+    with vectorized operations, instead of a loop over rows.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The square sparse matrix.
+        lower (bool, optional): Use the lower or the upper part. Defaults to True.
+        omega (float, optional): Relaxation factor scaling the diagonal. Defaults to 1.0.
+    """
+    def __init__(self, A: _SparseMatrix, lower: bool=True, omega: float=1.0):
+        A = A.tocsr()
+        N = A.shape[0]
+        row, col, val = A.row, A.col, A.values
+        self.diag = A.diagonal() / omega
+        self.lower = lower
+
+        mask = (col < row) if lower else (col > row)
+        row, col, val = row[mask], col[mask], val[mask]
+        level = self._levels(N, row, col)
+
+        # Group rows and the off-diagonal entries by levels.
+        kwargs = bm.context(row)
+        NL = int(bm.max(level)) + 1 if N > 0 else 0
+        row_order = bm.argsort(level, stable=True)
+        lptr = bm.zeros((NL + 1, ), **kwargs)
+        lptr = bm.astype(bm.cumsum(bm.index_add(lptr, level + 1, bm.ones((N, ), **kwargs)), axis=0), row.dtype)
+        local = bm.zeros((N, ), **kwargs)
+        local = bm.set_at(local, row_order, bm.arange(N, **kwargs) - bm.repeat(lptr[:-1], lptr[1:] - lptr[:-1]))
+        entry_order = bm.argsort(level[row], stable=True)
+        eptr = bm.zeros((NL + 1, ), **kwargs)
+        eptr = bm.astype(bm.cumsum(bm.index_add(eptr, level[row] + 1, bm.ones(row.shape, **kwargs)), axis=0), row.dtype)
+
+        lptr, eptr = bm.tolist(lptr), bm.tolist(eptr)
+        self.levels = []
+        for k in range(NL):
+            rows = row_order[lptr[k]:lptr[k+1]]
+            entries = entry_order[eptr[k]:eptr[k+1]]
+            self.levels.append((rows, local[row[entries]], col[entries], val[entries],
+                                1.0 / self.diag[rows]))
+
+    @staticmethod
+    def _levels(N: int, row: TensorLike, col: TensorLike) -> TensorLike:
+        """Level of each row in the dependency graph, by topological sorting."""
+        kwargs = bm.context(row)
+        indeg = bm.zeros((N, ), **kwargs)
+        indeg = bm.index_add(indeg, row, bm.ones(row.shape, **kwargs))
+        order = bm.argsort(col, stable=True)
+        dependent = row[order]
+        cptr = bm.zeros((N + 1, ), **kwargs)
+        cptr = bm.cumsum(bm.index_add(cptr, col + 1, bm.ones(col.shape, **kwargs)), axis=0)
+
+        level = bm.full((N, ), -1, **kwargs)
+        frontier = bm.nonzero(indeg == 0)[0]
+        k = 0
+
+        while frontier.shape[0] > 0:
+            level = bm.set_at(level, frontier, k)
+            counts = cptr[frontier + 1] - cptr[frontier]
+            targets = dependent[segment_arange(counts, cptr[frontier])]
+            indeg = bm.index_add(indeg, targets, -bm.ones(targets.shape, **kwargs))
+            targets = bm.unique(targets)
+            frontier = targets[indeg[targets] == 0]
+            k += 1
+
+        return level
+
+    def solve(self, b: TensorLike) -> TensorLike:
+        """Solve the triangular system for b shaped (N, ) or (N, n)."""
+        x = bm.zeros_like(b)
+        for rows, local, col, val, dinv in self.levels:
+            s = b[rows]
+            if col.shape[0] > 0:
+                contrib = val * x[col] if b.ndim == 1 else val[:, None] * x[col]
+                s = bm.index_add(s, local, -contrib)
+            s = s * dinv if b.ndim == 1 else s * dinv[:, None]
+            x = bm.set_at(x, rows, s)
+        return x
+
+    def __matmul__(self, b: TensorLike) -> TensorLike:
+        return self.solve(b)
+
+
+class JacobiPreconditioner():
+    """Jacobi (diagonal) preconditioner, applying D^{-1} to vectors.
+
+    Parameters:
+        A (COOTensor | CSRTensor | BilinearForm): The square sparse matrix, or\
+            an operator providing the `diagonal` method such as a matrix-free BilinearForm.
+    """
+    def __init__(self, A: _SparseMatrix):
+        if isinstance(A, COOTensor):
+            A = A.tocsr()
+        self.dinv = 1.0 / A.diagonal()
+
+    def __matmul__(self, r: TensorLike) -> TensorLike:
+        if r.ndim == 1:
+            return self.dinv * r
+        return self.dinv[:, None] * r
+
+
+class BlockJacobiPreconditioner():
+    """Block Jacobi preconditioner, applying inverses of the diagonal blocks.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The square sparse matrix.
+        block_size (int, optional): Size of contiguous blocks. Ignored when
+            `blocks` is given. Defaults to 1.
+        blocks (Tensor | None, optional): Indices of DoFs in each block, shaped
+            (NB, bs). Blocks must not overlap. DoFs not in any block are left
+            unchanged. Defaults to None.
+    """
+    def __init__(self, A: _SparseMatrix, block_size: int=1, *,
+                 blocks: Optional[TensorLike]=None):
+        A = A.tocsr()
+        N = A.shape[0]
+        kwargs = bm.context(A.col)
+
+        if blocks is None:
+            if N % block_size != 0:
+                raise ValueError(f"The size of matrix ({N}) is not divisible "
+                                 f"by the block size ({block_size}).")
+            blocks = bm.reshape(bm.arange(N, **kwargs), (-1, block_size))
+
+        NB, bs = blocks.shape
+        bid = bm.full((N, ), -1, **kwargs)
+        bid = bm.set_at(bid, blocks, bm.broadcast_to(bm.arange(NB, **kwargs)[:, None], (NB, bs)))
+        loc = bm.zeros((N, ), **kwargs)
+        loc = bm.set_at(loc, blocks, bm.broadcast_to(bm.arange(bs, **kwargs)[None, :], (NB, bs)))
+
+        row, col, val = A.row, A.col, A.values
+        mask = (bid[row] == bid[col]) & (bid[row] >= 0)
+        row, col, val = row[mask], col[mask], val[mask]
+        flat = (bid[row] * bs + loc[row]) * bs + loc[col]
+        D = bm.zeros((NB * bs * bs, ), **A.values_context())
+        D = bm.index_add(D, flat, val)
+
+        self.blocks = blocks
+        self.Dinv = bm.linalg.inv(bm.reshape(D, (NB, bs, bs)))
+
+    def __matmul__(self, r: TensorLike) -> TensorLike:
+        rb = r[self.blocks] # (NB, bs, ...)
+        z = bm.copy(r)
+        return bm.set_at(z, self.blocks, bm.einsum('bij, bj... -> bi...', self.Dinv, rb))
+
+
+class SSORPreconditioner():
+    """Symmetric successive over-relaxation (SSOR) preconditioner.
+
+    Applies M^{-1} = (2 - omega) (D/omega + U)^{-1} (D/omega) (D/omega + L)^{-1},
+    which is the symmetric Gauss-Seidel preconditioner when omega = 1.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The square sparse matrix.
+        omega (float, optional): Relaxation factor in (0, 2). Defaults to 1.0.
+    """
+    def __init__(self, A: _SparseMatrix, omega: float=1.0):
+        if not (0.0 < omega < 2.0):
+            raise ValueError(f"omega must be in (0, 2), but got {omega}.")
+        self.omega = omega
+        self.forward = TriangularSolver(A, lower=True, omega=omega)
+        self.backward = TriangularSolver(A, lower=False, omega=omega)
+
+    def __matmul__(self, r: TensorLike) -> TensorLike:
+        d = self.forward.diag if r.ndim == 1 else self.forward.diag[:, None]
+        y = self.forward.solve(r) * d
+        return self.backward.solve(y) * (2.0 - self.omega)
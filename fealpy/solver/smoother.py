@@ -0,0 +1,131 @@
+
+from typing import Optional, Union
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+from .preconditioner import TriangularSolver
+from .amg_coarsen import _index_noise
+
+__all__ = [
+    'JacobiSmoother',
+    'GaussSeidelSmoother',
+    'ChebyshevSmoother',
+]
+
+_SparseMatrix = Union[COOTensor, CSRTensor]
+
+
+def _scale_rows(d: TensorLike, r: TensorLike) -> TensorLike:
+    return d * r if r.ndim == 1 else d[:, None] * r
+
+
+class JacobiSmoother():
+    """Weighted Jacobi smoother, e <- e + omega D^{-1} (r - A e).
+
+    Parameters:
+        A (COOTensor | CSRTensor): The square sparse matrix.
+        omega (float, optional): The weight. Defaults to 2/3.
+    """
+    def __init__(self, A: _SparseMatrix, omega: float=2/3):
+        self.A = A.tocsr()
+        self.dinv = omega / self.A.diagonal()
+
+    def smooth(self, r: TensorLike, e: Optional[TensorLike]=None, *,
+               pre: bool=True) -> TensorLike:
+        """Apply one sweep to A e = r. Start from zero if `e` is None."""
+        if e is None:
+            return _scale_rows(self.dinv, r)
+        return e + _scale_rows(self.dinv, r - self.A @ e)
+
+
+class GaussSeidelSmoother():
+    """Gauss-Seidel smoother, sweeping forward in pre-smoothing and backward
+    in post-smoothing, so that the multigrid cycle stays symmetric.
+
+    The triangular solves are level-scheduled, see `TriangularSolver`.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The square sparse matrix.
+        omega (float, optional): The relaxation factor. Defaults to 1.0.
+    """
+    def __init__(self, A: _SparseMatrix, omega: float=1.0):
+        self.A = A.tocsr()
+        self.forward = TriangularSolver(self.A, lower=True, omega=omega)
+        self.backward = TriangularSolver(self.A, lower=False, omega=omega)
+
+    def smooth(self, r: TensorLike, e: Optional[TensorLike]=None, *,
+               pre: bool=True) -> TensorLike:
+        """Apply one sweep to A e = r. Start from zero if `e` is None."""
+        solver = self.forward if pre else self.backward
+        if e is None:
+            return solver.solve(r)
+        return e + solver.solve(r - self.A @ e)
+
+
+class ChebyshevSmoother():
+    """Chebyshev polynomial smoother on the Jacobi-scaled matrix D^{-1} A.
+
+    The polynomial damps the eigenvalues of D^{-1} A in
+    [lower * lmax, upper * lmax], where lmax is estimated by power iterations
+    in the setup. One sweep costs `degree` sparse matrix-vector products.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The square sparse matrix.
+        degree (int, optional): The degree of the polynomial. Defaults to 3.
+        lower (float, optional): Lower bound of the damped interval relative to lmax.\
+            Defaults to 1/30.
+        upper (float, optional): Upper bound of the damped interval relative to lmax.\
+            Defaults to 1.1.
+        maxit (int, optional): Number of power iterations. Defaults to 10.
+    """
+    def __init__(self, A: _SparseMatrix, degree: int=3, *,
+                 lower: float=1/30, upper: float=1.1, maxit: int=10):
+        self.A = A.tocsr()
+        self.degree = degree
+        self.dinv = 1.0 / self.A.diagonal()
+        lmax = self.estimate_lmax(maxit)
+        self.theta = (upper + lower) * lmax / 2
+        self.delta = (upper - lower) * lmax / 2
+
+    def estimate_lmax(self, maxit: int=10) -> float:
+        """Estimate the largest eigenvalue of D^{-1} A by power iterations.
+
+        The start vector is a fixed hash of the row indices, so the estimate
+        and the Chebyshev bounds are reproducible.
+        """
+        N = self.A.shape[0]
+        noise = _index_noise(N, device=bm.get_device(self.dinv))
+        v = bm.astype(noise, self.dinv.dtype) + 0.5
+        lmax = 0.0
+        for _ in range(maxit):
+            v = v / bm.sqrt(bm.sum(v**2))
+            w = self.dinv * (self.A @ v)
+            lmax = float(bm.sum(v * w) / bm.sum(v * v))
+            v = w
+        return lmax
+
+    def smooth(self, r: TensorLike, e: Optional[TensorLike]=None, *,
+               pre: bool=True) -> TensorLike:
+        """Apply one polynomial sweep to A e = r. Start from zero if `e` is None."""
+        theta, delta = self.theta, self.delta
+        sigma = theta / delta
+        rho = 1.0 / sigma
+
+        if e is None:
+            e = bm.zeros_like(r)
+            res = r
+        else:
+            res = r - self.A @ e
+        d = _scale_rows(self.dinv, res) / theta
+
+        for k in range(self.degree):
+            e = e + d
+            if k == self.degree - 1:
+                break
+            res = res - self.A @ d
+            rho_new = 1.0 / (2 * sigma - rho)
+            d = (rho_new * rho) * d + (2 * rho_new / delta) * _scale_rows(self.dinv, res)
+            rho = rho_new
+
+        return e
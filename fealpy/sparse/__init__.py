@@ -9,6 +9,7 @@ from .coo_tensor import COOTensor
 from .csr_tensor import CSRTensor
 
 from .ops import spdiags
+from .out_of_core import MemmapCSRBuilder
 
 
 
@@ -27,45 +27,34 @@ def _shape_check(spshape: _Size, xshape: _Size):
                          "sparse-dense multiplication")
 
 
-def spmm_coo(indices: _DT, values: _DT, spshape: _Size, x: _DT) -> _DT:
-    _shape_check(spshape, x.shape)
-    row = indices[0]
-    col = indices[1]
+def _spmm_rows(row: _DT, col: _DT, values: _DT, nrow: int, x: _DT) -> _DT:
+    """Sum the products of entries and x into rows, by index_add."""
+    kwargs = {'dtype': x.dtype, 'device': bm.get_device(x)}
 
     if x.ndim == 1:
         new_vals = values * x[col]
-        shape = new_vals.shape[:-1] + (spshape[0], )
-        result = bm.zeros(shape, dtype=x.dtype)
+        shape = new_vals.shape[:-1] + (nrow, )
+        result = bm.zeros(shape, **kwargs)
         result = bm.index_add(result, row, new_vals, axis=-1)
         return result
 
     else: # x.ndim >= 2
         new_vals = values[..., None] * x[..., col, :] # (*batch, nnz, x_col)
-        shape = new_vals.shape[:-2] + (spshape[0], x.shape[-1])
-        result = bm.zeros(shape, dtype=x.dtype)
+        shape = new_vals.shape[:-2] + (nrow, x.shape[-1])
+        result = bm.zeros(shape, **kwargs)
         result = bm.index_add(result, row, new_vals, axis=-2)
         return result
 
 
-def spmm_csr(crow: _DT, col: _DT, values: _DT, spshape: _Size, x: _DT) -> _DT:
+def spmm_coo(indices: _DT, values: _DT, spshape: _Size, x: _DT) -> _DT:
     _shape_check(spshape, x.shape)
-    nrow = spshape[0]
-    unsqueezed = False
-
-    if x.ndim == 1:
-        x = x[:, None]
-        unsqueezed = True
-
-    shape = x.shape[:-2] + (nrow, x.shape[-1])
-    result = bm.zeros(shape, dtype=x.dtype)
-
-    for i in range(nrow):
-        start = crow[i]
-        end = crow[i + 1]
-        r = bm.einsum('...i, ...ij -> ...j', values[..., start:end], x[..., col[start:end], :])
-        result[..., i, :] = r
+    return _spmm_rows(indices[0], indices[1], values, spshape[0], x)
 
-    if unsqueezed:
-        result = result[..., 0]
 
-    return result
+def spmm_csr(crow: _DT, col: _DT, values: _DT, spshape: _Size, x: _DT) -> _DT:
+    _shape_check(spshape, x.shape)
+    nrow = spshape[0]
+    # Expand the compressed rows to the row index of each entry, and then
+    # sum the segments with index_add, without looping over rows.
+    row = bm.repeat(bm.arange(nrow, **bm.context(crow)), crow[1:] - crow[:-1])
+    return _spmm_rows(row, col, values, nrow, x)
@@ -3,6 +3,7 @@ from typing import Tuple
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike as _DT
+from .utils import segment_arange
 
 _Size = Tuple[int, ...]
 
@@ -17,6 +18,26 @@ def _shape_check(spshape1: _Size, spshape2: _Size):
                         f"got shape {spshape1} and {spshape2}.")
 
 
+def _expand(row1: _DT, col1: _DT, values1: _DT,
+            crow2: _DT, col2: _DT, values2: _DT) -> Tuple[_DT, _DT, _DT]:
+    """Expand the products of every entry (i, k) of the left matrix and all
+    entries (k, j) in the k-th row of the right matrix."""
+    counts = crow2[col1 + 1] - crow2[col1]
+    left = bm.repeat(bm.arange(col1.shape[0], **bm.context(col1)), counts)
+    right = segment_arange(counts, crow2[col1])
+    row = row1[left]
+    col = col2[right]
+    values = values1[..., left] * values2[..., right]
+    return row, col, values
+
+
+def _compress_rows(row: _DT, nrow: int) -> _DT:
+    kwargs = bm.context(row)
+    crow = bm.zeros((nrow + 1, ), **kwargs)
+    crow = bm.index_add(crow, row + 1, bm.ones(row.shape, **kwargs))
+    return bm.cumsum(crow, axis=0)
+
+
 def spspmm_coo(indices1: _DT, values1: _DT, spshape1: _Size,
                indices2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _Size]:
     _shape_check(spshape1, spshape2)
@@ -26,40 +47,18 @@ def spspmm_coo(indices1: _DT, values1: _DT, spshape1: _Size,
         raise ValueError(f"the dense shape of matrix2 ({values2.shape[:-1]}) "
                          f"must match that of matrix1 {structure}")
 
-    size = spshape1[1]
-    indices_list = []
-    values_list = []
-
-    for i in range(size):
-        left_col_flag = (indices1[1, :] == i)
-
-        if not bm.any(left_col_flag, axis=0):
-            continue
-
-        right_row_flag = (indices2[0, :] == i)
-
-        if not bm.any(right_row_flag, axis=0):
-            continue
-
-        row = indices1[0, left_col_flag]
-        col = indices2[1, right_row_flag]
-        nnz = col.shape[0] * row.shape[0]
-        idx = bm.meshgrid(row, col, indexing='ij')
-        idx = bm.reshape(bm.stack(idx, axis=0), (2, nnz))
-        val1 = values1[..., left_col_flag]
-        val2 = values2[..., right_row_flag]
-
-        val = bm.einsum('...i, ...j -> ...ij', val1, val2).reshape(*structure, nnz)
-        indices_list.append(idx)
-        values_list.append(val)
-
-    indices = bm.concat(indices_list, axis=1)
-    values = bm.concat(values_list, axis=-1)
+    # Sort the right matrix by rows to find the entries of each row, then
+    # expand all products at once. The output is not coalesced.
+    order = bm.argsort(indices2[0], stable=True)
+    crow2 = _compress_rows(indices2[0], spshape2[0])
+    row, col, values = _expand(indices1[0], indices1[1], values1,
+                               crow2, indices2[1, order], values2[..., order])
+    indices = bm.stack([row, col], axis=0)
     return indices, values, (spshape1[0], spshape2[1])
 
 
 def spspmm_csr(crow1: _DT, col1: _DT, values1: _DT, spshape1: _Size,
-               crow2: _DT, col2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _Size]:
+               crow2: _DT, col2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _DT, _Size]:
     _shape_check(spshape1, spshape2)
 
     structure = values1.shape[:-1]
@@ -67,48 +66,27 @@ def spspmm_csr(crow1: _DT, col1: _DT, values1: _DT, spshape1: _Size,
         raise ValueError(f"the dense shape of matrix2 ({values2.shape[:-1]}) "
                          f"must match that of matrix1 {structure}")
 
-    size = spshape1[0]
-    indices_list = []
-    values_list = []
-    kargs = bm.context(crow1)
-    new_crow = bm.zeros(size+1, **kargs)
-
-    for i in range(size):
-        row = bm.array([], **kargs)
-        left_col_flag = (col1 == i)
-
-        for x in bm.where(left_col_flag == True)[0]+1:
-            flag = ~(x>crow1[:-1])^(x<=crow1[1:])
-            row = bm.concat((row,(bm.where(flag == True))[0]))
-
-        col = col2[crow2[i]:crow2[i+1]]
-
-        if not bm.any(row, axis=0):
-            continue
-
-        if not bm.any(col, axis=0):
-            continue
-
-        idx = bm.meshgrid(row, col, indexing='ij')
-        nnz = col.shape[0] * row.shape[0]
-        idx = bm.reshape(bm.stack(idx, axis=0), (2, nnz))
-        val1 = values1[..., left_col_flag]
-        val2 = values2[..., crow2[i]:crow2[i+1]]
-        val = bm.einsum('...i, ...j -> ...ij', val1, val2).reshape(*structure, nnz)
-
-        indices_list.append(idx)
-        values_list.append(val)
-
-    indices = bm.concat(indices_list, axis=1)
-    values = bm.concat(values_list, axis=-1)
-
-    unique_indices, inverse_indices = bm.unique(indices, return_inverse=True, axis=1)
-    new_values = bm.zeros(unique_indices.shape[1])
-    new_values = bm.index_add(new_values, inverse_indices, values, axis=-1)
-
-    for x in unique_indices[0,:]:
-        new_crow[x+1]+=1
-
-    new_crow=bm.cumsum(new_crow, axis =-1)
-
-    return new_crow, unique_indices[1,:], new_values,(spshape1[0], spshape2[1])
+    nrow, ncol = spshape1[0], spshape2[1]
+    kwargs = bm.context(crow1)
+
+    # 1. Expand: all products a_ik * b_kj.
+    row1 = bm.repeat(bm.arange(nrow, **kwargs), crow1[1:] - crow1[:-1])
+    row, col, values = _expand(row1, col1, values1, crow2, col2, values2)
+
+    # 2. Sort and compress: sum the products with the same (i, j).
+    key = bm.astype(row, bm.int64) * ncol + bm.astype(col, bm.int64)
+    order = bm.argsort(key)
+    key = key[order]
+    flag = bm.ones(key.shape, dtype=bm.bool, device=bm.get_device(key))
+    flag = bm.set_at(flag, slice(1, None), key[1:] != key[:-1])
+    inverse = bm.cumsum(bm.astype(flag, bm.int64), axis=0) - 1
+    key = key[flag]
+    new_values = bm.zeros(structure + (key.shape[0], ),
+                          dtype=values.dtype, device=bm.get_device(values))
+    new_values = bm.index_add(new_values, inverse, values[..., order], axis=-1)
+
+    new_row = bm.astype(key // ncol, crow1.dtype)
+    new_col = bm.astype(key % ncol, col1.dtype)
+    new_crow = _compress_rows(new_row, nrow)
+
+    return new_crow, new_col, new_values, (nrow, ncol)
@@ -238,6 +238,15 @@ class CSRTensor(SparseTensor):
         tril_loc = (self.col - k) >= self.row
         return self.partial(tril_loc)
 
+    def diagonal(self) -> TensorLike:
+        """Return the main diagonal, shaped (*dense_shape, min(M, N)).
+        Duplicated entries on the diagonal are summed."""
+        row = self.row
+        is_diag = (row == self._col)
+        size = min(self._spshape)
+        diag = bm.zeros(self.dense_shape + (size, ), **self.values_context())
+        return bm.index_add(diag, row[is_diag], self._values[..., is_diag], axis=-1)
+
     def sum(self, axis=0):
         """
         """
@@ -0,0 +1,200 @@
+
+import os
+from typing import Optional, Tuple, List
+
+import numpy as np
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from .csr_tensor import CSRTensor
+
+__all__ = ['MemmapCSRBuilder']
+
+
+def _coalesce(row, col, values, ncol: int):
+    """Sort the triplets by (row, col) and sum the duplicated entries."""
+    key = row.astype(np.int64) * ncol + col
+    order = np.argsort(key, kind='stable')
+    key = key[order]
+    flag = np.empty(key.shape, dtype=np.bool_)
+    if key.shape[0] > 0:
+        flag[0] = True
+        np.not_equal(key[1:], key[:-1], out=flag[1:])
+    start = np.flatnonzero(flag)
+    values = np.add.reduceat(values[order], start) if start.shape[0] > 0 else values[:0]
+    return row[order][start], col[order][start], values
+
+
+class MemmapCSRBuilder():
+    """Build a CSR matrix in memory-mapped files from blocks of COO triplets,
+    for matrices larger than the memory.
+
+    Each block is coalesced in memory and appended to run files on disk as
+    a run sorted by rows. `finalize` merges the runs band by band, where
+    a band is a range of rows holding about `block_size` run entries, and
+    writes the merged columns and values sequentially. Only one band is held
+    in memory at a time, besides the number of run entries of each row.
+
+    The result is a `CSRTensor` of NumPy memory maps, which supports the
+    matrix-vector products used by iterative solvers such as `cg`.
+
+    Parameters:
+        directory (str): Directory of the files. Created if not existing.
+        shape (Tuple[int, int]): Shape of the matrix.
+        itype (dtype, optional): Data type of the indices. Defaults to int64.
+        block_size (int, optional): Number of entries merged in memory at a time.\
+            Defaults to 2**24.
+        prefix (str, optional): Prefix of the file names. Defaults to 'matrix'.
+
+    Example:
+    ```
+        builder = MemmapCSRBuilder('/scratch/A', (gdof, gdof))
+        for row, col, values in blocks:
+            builder.add(row, col, values)
+        A = builder.finalize() # files: /scratch/A/matrix.{crow,col,values}
+    ```
+    """
+    def __init__(self, directory: str, shape: Tuple[int, int], *,
+                 itype=np.int64, block_size: int=2**24, prefix: str='matrix'):
+        if len(shape) != 2:
+            raise ValueError(f"shape must be a 2-tuple, but got {shape}.")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.itype = np.dtype(itype)
+        self.dtype: Optional[np.dtype] = None
+        self.block_size = int(block_size)
+        self.prefix = prefix
+
+        self._row_nnz = np.zeros((self.shape[0], ), dtype=np.int64)
+        self._runs: List[Tuple[int, int]] = [] # (start, stop) in the run files
+        self._run_size = 0
+        self._files = None
+        self._finalized = False
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f'{self.prefix}.{name}')
+
+    def _open_runs(self):
+        if self._files is None:
+            self._files = tuple(open(self._path(f'run.{name}'), 'wb')
+                                for name in ('row', 'col', 'values'))
+        return self._files
+
+    def add(self, row: TensorLike, col: TensorLike, values: TensorLike) -> None:
+        """Add a block of triplets. Duplicated entries are summed.
+
+        Parameters:
+            row (Tensor): Row indices, shaped (nnz, ).
+            col (Tensor): Column indices, shaped (nnz, ).
+            values (Tensor): Values of the entries, shaped (nnz, ).
+        """
+        if self._finalized:
+            raise RuntimeError("Can not add blocks to a finalized builder.")
+        row = np.asarray(bm.to_numpy(row)).reshape(-1).astype(self.itype, copy=False)
+        col = np.asarray(bm.to_numpy(col)).reshape(-1).astype(self.itype, copy=False)
+        values = np.asarray(bm.to_numpy(values)).reshape(-1)
+        if not (row.shape == col.shape == values.shape):
+            raise ValueError("row, col and values must have the same number of entries, "
+                             f"but got {row.shape[0]}, {col.shape[0]} and {values.shape[0]}.")
+        if self.dtype is None:
+            self.dtype = values.dtype
+        values = values.astype(self.dtype, copy=False)
+
+        row, col, values = _coalesce(row, col, values, self.shape[1])
+        uniq_row, counts = np.unique(row, return_counts=True)
+        self._row_nnz[uniq_row] += counts
+
+        for f, data in zip(self._open_runs(), (row, col, values)):
+            data.tofile(f)
+        self._runs.append((self._run_size, self._run_size + row.shape[0]))
+        self._run_size += row.shape[0]
+
+    def finalize(self) -> CSRTensor:
+        """Merge the runs into the final CSR matrix and remove the run files.
+
+        Returns:
+            CSRTensor: The matrix, whose crow, col and values are read-only memory maps.
+        """
+        if self._finalized:
+            raise RuntimeError("The builder has been finalized.")
+        self._finalized = True
+        dtype = np.float64 if self.dtype is None else self.dtype
+        nrow, ncol = self.shape
+        for f in self._open_runs():
+            f.close()
+        run_row, run_col, run_values = (
+            np.memmap(self._path(f'run.{name}'), dtype=dt, mode='r', shape=(self._run_size, ))
+            if self._run_size > 0 else np.empty((0, ), dtype=dt)
+            for name, dt in (('row', self.itype), ('col', self.itype), ('values', dtype))
+        )
+
+        crow = np.zeros((nrow + 1, ), dtype=self.itype)
+        bounds = self._band_bounds()
+        nnz = 0
+
+        with open(self._path('col'), 'wb') as fcol, open(self._path('values'), 'wb') as fval:
+            for r0, r1 in zip(bounds[:-1], bounds[1:]):
+                slices = []
+                for start, stop in self._runs:
+                    rows = run_row[start:stop]
+                    lo, hi = np.searchsorted(rows, (r0, r1))
+                    if hi > lo:
+                        slices.append(slice(start + lo, start + hi))
+                if len(slices) == 0:
+                    continue
+                row = np.concatenate([run_row[s] for s in slices])
+                col = np.concatenate([run_col[s] for s in slices])
+                values = np.concatenate([run_values[s] for s in slices])
+                row, col, values = _coalesce(row, col, values, ncol)
+                col.tofile(fcol)
+                values.tofile(fval)
+                crow[r0+1:r1+1] = np.bincount(row - r0, minlength=r1 - r0)
+                nnz += row.shape[0]
+
+        del run_row, run_col, run_values
+        for name in ('row', 'col', 'values'):
+            os.remove(self._path(f'run.{name}'))
+
+        np.cumsum(crow, out=crow)
+        crow.tofile(self._path('crow'))
+        self._row_nnz = None
+
+        return self.load(self.directory, self.shape, itype=self.itype,
+                         dtype=dtype, prefix=self.prefix)
+
+    def _band_bounds(self):
+        """Row bounds of bands with about `block_size` run entries."""
+        nrow = self.shape[0]
+        cum = np.cumsum(self._row_nnz)
+        total = int(cum[-1]) if nrow > 0 else 0
+        targets = np.arange(self.block_size, total, self.block_size)
+        bounds = np.searchsorted(cum, targets, side='right')
+        bounds = np.unique(np.concatenate([[0], bounds, [nrow]]))
+        return bounds.tolist()
+
+    @staticmethod
+    def load(directory: str, shape: Tuple[int, int], *, itype=np.int64,
+             dtype=np.float64, prefix: str='matrix') -> CSRTensor:
+        """Load a CSR matrix written by `finalize` as memory maps.
+
+        Parameters:
+            directory (str): Directory of the files.
+            shape (Tuple[int, int]): Shape of the matrix.
+            itype (dtype, optional): Data type of the indices. Defaults to int64.
+            dtype (dtype, optional): Data type of the values. Defaults to float64.
+            prefix (str, optional): Prefix of the file names. Defaults to 'matrix'.
+
+        Returns:
+            CSRTensor: The matrix, whose crow, col and values are read-only memory maps.
+        """
+        path = lambda name: os.path.join(directory, f'{prefix}.{name}')
+        crow = np.memmap(path('crow'), dtype=itype, mode='r', shape=(shape[0] + 1, ))
+        nnz = int(crow[-1])
+        if nnz > 0:
+            col = np.memmap(path('col'), dtype=itype, mode='r', shape=(nnz, ))
+            values = np.memmap(path('values'), dtype=dtype, mode='r', shape=(nnz, ))
+        else:
+            col = np.empty((0, ), dtype=itype)
+            values = np.empty((0, ), dtype=dtype)
+        return CSRTensor(crow, col, values, shape)
@@ -29,6 +29,25 @@ def _dense_ndim(values: Optional[TensorLike]):
         return values.ndim - 1
 
 
+def segment_arange(counts: TensorLike, starts: Optional[TensorLike]=None) -> TensorLike:
+    """Concatenate the ranges [starts[i], starts[i] + counts[i]) of all segments.
+
+    Parameters:
+        counts (Tensor): Lengths of the segments, shaped (N, ).
+        starts (Tensor | None, optional): The first value of each segment, shaped (N, ).
+            Defaults to None, giving the local index [0, counts[i]) in each segment.
+
+    Returns:
+        Tensor: The concatenated ranges, shaped (sum(counts), ).
+    """
+    kwargs = bm.context(counts)
+    total = int(bm.sum(counts))
+    offset = bm.cumsum(counts, axis=0) - counts
+    if starts is not None:
+        offset = offset - starts
+    return bm.arange(total, **kwargs) - bm.repeat(offset, counts)
+
+
 def shape_to_strides(shape: Size, item_size: int):
     strides = [item_size, ]
 
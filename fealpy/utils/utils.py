@@ -24,9 +24,11 @@ def process_coef_func(
     mesh: Optional[HomogeneousMesh]=None,
     etype: Optional[Union[int, str]]=None,
     index: Optional[TensorLike]=None,
-    n: Optional[TensorLike]=None
+    n: Optional[TensorLike]=None,
+    ps: Optional[TensorLike]=None
 ):
-    r"""Fetch the result Tensor if `coef` is a function."""
+    r"""Fetch the result Tensor if `coef` is a function.
+    The cartesian points `ps` of `bcs` are computed by the mesh if not given."""
     if callable(coef):
         if index is None:
             raise RuntimeError('The index should be provided for coef functions.')
@@ -41,7 +43,8 @@ def process_coef_func(
 
             coef_val = coef(bcs, index=index)
         else:
-            ps = mesh.bc_to_point(bcs, index=index)
+            if ps is None:
+                ps = mesh.bc_to_point(bcs, index=index)
             ##TODO:适应不同情况的coef, coef的接口应该是coef(ps, n)或者coef(ps)
             import inspect
             if (n is not None) & (len(inspect.signature(coef).parameters) == 2):
@@ -883,12 +883,32 @@ class TestBackendInterfaces:
         '''
         pass
 
-    @pytest.mark.parametrize("backend", ['numpy'])
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
     def test_einsum(self, backend):
         '''
         Evaluates the Einstein summation convention on the operands.
         '''
-        pass
+        from fealpy.backend.einsum_cache import einsum_path
+        bm.set_backend(backend)
+        rng = np.random.default_rng(0)
+        a = rng.random((5, 4, 3, 2))
+        M = rng.random((4, 3, 3, 2, 2))
+        w = rng.random((5, ))
+        expected = np.einsum('cqin, qijmn, cqjm, c -> cij', a, M, a, w)
+        args = [bm.from_numpy(x) for x in (a, M, a, w)]
+
+        einsum_path.cache_clear()
+        for _ in range(3):
+            result = bm.einsum('cqin, qijmn, cqjm, c -> cij', *args)
+            np.testing.assert_allclose(bm.to_numpy(result), expected)
+        if backend == 'numpy':
+            info = einsum_path.cache_info()
+            assert (info.misses, info.hits) == (1, 2)
+
+        # Broadcasting with ellipsis and explicit paths.
+        result = bm.einsum('...i, ...ij, j, ... -> ...', args[0], args[1][None, :, 0], args[3][:2], args[0][..., 0])
+        expected = np.einsum('...i, ...ij, j, ... -> ...', a, M[None, :, 0], w[:2], a[..., 0])
+        np.testing.assert_allclose(bm.to_numpy(result), expected)
 
     @pytest.mark.parametrize("backend", ['numpy'])
     def test_einsum_path(self, backend):
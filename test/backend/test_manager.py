@@ -0,0 +1,52 @@
+import threading
+
+import numpy as np
+import pytest
+from fealpy.backend import backend_manager as bm
+from fealpy.backend.manager import BackendManager
+
+
+def _run_in_thread(func):
+    result = {}
+    def target():
+        result['value'] = func()
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    return result['value']
+
+
+class TestBackendManager:
+    def test_dispatch(self):
+        bm.set_backend('numpy')
+        assert isinstance(BackendManager.__dict__['add'], property)
+        assert bm.add is bm.get_current_backend().add
+        assert bm.pi == np.pi
+        a = bm.arange(3)
+        np.testing.assert_array_equal(bm.add(a, a), np.arange(3) * 2)
+
+        with pytest.raises(AttributeError):
+            bm.this_attribute_does_not_exist
+
+    def test_thread_local(self):
+        torch = pytest.importorskip('torch')
+        bm.set_backend('pytorch')
+        # Threads without a backend use the default one.
+        assert _run_in_thread(lambda: bm.backend_name) == 'numpy'
+        assert isinstance(_run_in_thread(lambda: bm.arange(3)), np.ndarray)
+        assert isinstance(bm.arange(3), torch.Tensor)
+
+        def switch():
+            bm.set_backend('pytorch')
+            return bm.backend_name, type(bm.zeros(2))
+        bm.set_backend('numpy')
+        assert _run_in_thread(switch) == ('pytorch', torch.Tensor)
+        assert bm.backend_name == 'numpy'
+        assert isinstance(bm.zeros(2), np.ndarray)
+
+    def test_no_default_backend(self):
+        manager = BackendManager()
+        with pytest.raises(RuntimeError):
+            manager.add
+        manager.set_backend('numpy')
+        assert manager.add is bm.get_current_backend().add
@@ -2,11 +2,14 @@ import numpy as np
 import pytest
 from fealpy.backend import backend_manager as bm
 
-from fealpy.mesh import TriangleMesh
+from fealpy.mesh import TriangleMesh, HexahedronMesh
 from fealpy.functionspace import LagrangeFESpace
 from fealpy.fem import (
-        BilinearForm, ScalarDiffusionIntegrator
+        BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator,
+        SumFactorizedOperator
     )
+from fealpy.sparse import COOTensor
+from fealpy.solver import cg, JacobiPreconditioner
 
 from bilinear_form_data import *
 
@@ -43,6 +46,175 @@ class TestBilinearFormInterface:
         z = bm.to_numpy(bform @ x)
         assert np.linalg.norm(y-z) < 1e-12 
 
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("data", mesh_data)
+    @pytest.mark.parametrize("p", range(1, 4))
+    def test_keep_pattern(self, backend, data, p):
+        bm.set_backend(backend)
+
+        Mesh = mesh_map[data["class"]]
+        node = bm.from_numpy(data['node'])
+        cell = bm.from_numpy(data['cell'])
+        mesh = Mesh(node, cell)
+        mesh.uniform_refine(2)
+        space = LagrangeFESpace(mesh, p)
+
+        integrator = ScalarDiffusionIntegrator(coef=1.0)
+        bform = BilinearForm(space)
+        bform.add_integrator(integrator, splitter=5)
+        bform.keep_pattern()
+        A0 = bform.assembly()
+        assert bform._pattern is not None
+
+        integrator.coef = 2.0
+        A1 = bform.assembly()
+        A2 = bform.assembly(format='coo')
+
+        expected = BilinearForm(space)
+        expected.add_integrator(ScalarDiffusionIntegrator(coef=2.0))
+        B = expected.assembly()
+
+        np.testing.assert_allclose(bm.to_numpy(A0.to_dense())*2, bm.to_numpy(B.to_dense()), atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(A1.to_dense()), bm.to_numpy(B.to_dense()), atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(A2.to_dense()), bm.to_numpy(B.to_dense()), atol=1e-12)
+        assert A1.nnz == B.nnz
+
+        bform.add_integrator(ScalarDiffusionIntegrator(coef=1.0))
+        assert bform._pattern is None
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("data", mesh_data)
+    @pytest.mark.parametrize("splitter", [None, 5])
+    def test_scalar_assembly(self, backend, data, splitter):
+        bm.set_backend(backend)
+
+        Mesh = mesh_map[data["class"]]
+        node = bm.from_numpy(data['node'])
+        cell = bm.from_numpy(data['cell'])
+        mesh = Mesh(node, cell)
+        mesh.uniform_refine(2)
+        space = LagrangeFESpace(mesh, 2)
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(), splitter=splitter)
+        bform.add_integrator(ScalarDiffusionIntegrator(coef=2.0, q=4), group='g2', splitter=splitter)
+        M = bform._scalar_assembly()
+
+        # Concatenate the triplets chunk by chunk as the COO tensor grows.
+        gdof = space.number_of_global_dofs()
+        expected = COOTensor(bm.empty((2, 0), dtype=space.itype),
+                             bm.empty((0, ), dtype=space.ftype), (gdof, gdof))
+        for group_tensor, (e2dof, ) in bform.assembly_local_iterative():
+            local_shape = group_tensor.shape
+            I = bm.broadcast_to(e2dof[:, :, None], local_shape).ravel()
+            J = bm.broadcast_to(e2dof[:, None, :], local_shape).ravel()
+            expected = expected.add(COOTensor(bm.stack([I, J], axis=0),
+                                              group_tensor.ravel(), (gdof, gdof)))
+
+        np.testing.assert_array_equal(bm.to_numpy(M.indices), bm.to_numpy(expected.indices))
+        np.testing.assert_allclose(bm.to_numpy(M.values), bm.to_numpy(expected.values), atol=1e-14)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("data", mesh_data)
+    def test_assembly_workers(self, backend, data):
+        bm.set_backend(backend)
+
+        Mesh = mesh_map[data["class"]]
+        node = bm.from_numpy(data['node'])
+        cell = bm.from_numpy(data['cell'])
+        mesh = Mesh(node, cell)
+        mesh.uniform_refine(3)
+        space = LagrangeFESpace(mesh, 2)
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(), splitter=7)
+        A = bform.assembly()
+        B = bform.assembly(workers=4)
+
+        np.testing.assert_allclose(bm.to_numpy(A.to_dense()), bm.to_numpy(B.to_dense()), atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("data", mesh_data)
+    def test_matrix_free(self, backend, data):
+        bm.set_backend(backend)
+
+        Mesh = mesh_map[data["class"]]
+        node = bm.from_numpy(data['node'])
+        cell = bm.from_numpy(data['cell'])
+        mesh = Mesh(node, cell)
+        mesh.uniform_refine(2)
+        space = LagrangeFESpace(mesh, 2)
+        gdof = space.number_of_global_dofs()
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(), splitter=3)
+        bform.add_integrator(ScalarMassIntegrator())
+        x = bm.tensor(np.random.rand(gdof, 2), dtype=bm.float64)
+        y = bm.to_numpy(bform @ x)
+        assert bform._M is None
+        assert bform._local is not None
+
+        A = bform.assembly()
+        np.testing.assert_allclose(y, bm.to_numpy(A @ x), atol=1e-12)
+
+        b = bm.tensor(np.random.rand(gdof), dtype=bm.float64)
+        bform.clear()
+        u = cg(bform, b, atol=1e-14, rtol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(A @ u), bm.to_numpy(b), atol=1e-10)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_sumfac_matrix_free(self, backend):
+        bm.set_backend(backend)
+
+        mesh = HexahedronMesh.from_box([0, 1, 0, 1, 0, 1], 2, 2, 2)
+        space = LagrangeFESpace(mesh, 3)
+        gdof = space.number_of_global_dofs()
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(method='sumfac'), splitter=3)
+        bform.add_integrator(ScalarMassIntegrator(2.0, method='sumfac'))
+        x = bm.tensor(np.random.rand(gdof, 2), dtype=bm.float64)
+        y = bm.to_numpy(bform @ x)
+        d = bm.to_numpy(bform.diagonal())
+        assert all(isinstance(t[0], SumFactorizedOperator) for t in bform.local_tensors())
+
+        expected = BilinearForm(space)
+        expected.add_integrator(ScalarDiffusionIntegrator())
+        expected.add_integrator(ScalarMassIntegrator(2.0))
+        A = expected.assembly()
+        np.testing.assert_allclose(y, bm.to_numpy(A @ x), atol=1e-12)
+        np.testing.assert_allclose(d, bm.to_numpy(A.diagonal()), atol=1e-12)
+
+        b = bm.tensor(np.random.rand(gdof), dtype=bm.float64)
+        u = cg(bform, b, atol=1e-14, rtol=1e-12, M=JacobiPreconditioner(bform))
+        np.testing.assert_allclose(bm.to_numpy(A @ u), bm.to_numpy(b), atol=1e-10)
+
+    @pytest.mark.parametrize("data", mesh_data)
+    def test_assembly_out_of_core(self, data, tmp_path):
+        bm.set_backend('numpy')
+
+        Mesh = mesh_map[data["class"]]
+        mesh = Mesh(bm.from_numpy(data['node']), bm.from_numpy(data['cell']))
+        mesh.uniform_refine(3)
+        space = LagrangeFESpace(mesh, 2)
+        gdof = space.number_of_global_dofs()
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(), splitter=5)
+        bform.add_integrator(ScalarMassIntegrator())
+        A = bform.assembly()
+        B = bform.assembly_out_of_core(str(tmp_path), block_size=200)
+
+        assert isinstance(B.values, np.memmap)
+        np.testing.assert_array_equal(B.crow, A.crow)
+        np.testing.assert_array_equal(B.col, A.col)
+        np.testing.assert_allclose(B.values, A.values, atol=1e-12)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['matrix.col', 'matrix.crow', 'matrix.values']
+
+        b = bm.tensor(np.random.rand(gdof), dtype=bm.float64)
+        u = cg(B, b, atol=1e-14, rtol=1e-12)
+        np.testing.assert_allclose(A @ u, b, atol=1e-10)
+
 
 if __name__ == "__main__":
     pytest.main(['./test_bilinear_form.py', '-k', 'test_matmul'])
@@ -29,3 +29,39 @@ def test_apply_csr_matrix(backend):
     assert isinstance(coo_result, COOTensor)
     assert isinstance(csr_result, CSRTensor)
     assert bm.allclose(A_COO.toarray(), A_CSR.toarray())
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_apply_matrix_pattern(backend):
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box([-1, 1, -1, 1], nx=2, ny=2)
+    space = LagrangeFESpace(mesh, p=2)
+    gdof = space.number_of_global_dofs()
+    dbc = DirichletBC(space)
+    isDDof = dbc.is_boundary_dof
+
+    A = bm.random.rand(gdof, gdof) + gdof * bm.eye(gdof)
+    A = bm.astype(A, space.ftype)
+    expected = bm.where(isDDof[:, None] | isDDof[None, :], 0., A)
+    expected = bm.where(bm.eye(gdof, dtype=bm.bool) & isDDof[:, None], 1., expected)
+
+    A_COO = coo_matrix(A)
+    A_CSR = A_COO.tocsr()
+    for mat in (A_COO, A_CSR):
+        result = dbc.apply_matrix(mat)
+        assert type(result) is type(mat)
+        assert result.nnz == mat.nnz
+        assert bm.allclose(result.to_dense(), expected)
+    assert bm.allclose(A_CSR.to_dense(), A) # The input is not modified.
+
+    # Duplicated diagonal entries.
+    indices = bm.concat([A_COO.indices, A_COO.indices], axis=1)
+    values = bm.concat([A_COO.values, A_COO.values], axis=0) / 2
+    duplicated = COOTensor(indices, values, A_COO.sparse_shape)
+    assert bm.allclose(dbc.apply_matrix(duplicated).to_dense(), expected)
+
+    # Boundary rows without diagonal entries change the pattern.
+    A = bm.where(bm.eye(gdof, dtype=bm.bool), 0., A)
+    result = dbc.apply_matrix(coo_matrix(A).tocsr())
+    expected = bm.where(bm.eye(gdof, dtype=bm.bool) & ~isDDof[:, None], 0., expected)
+    assert bm.allclose(result.to_dense(), expected)
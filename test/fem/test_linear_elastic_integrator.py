@@ -0,0 +1,52 @@
+import os
+
+import numpy as np
+import pytest
+from fealpy.backend import backend_manager as bm
+
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+from fealpy.fem import LinearElasticIntegrator
+from fealpy.fem.utils import reference_integral, clear_reference_cache
+from fealpy.material.elastic_material import LinearElasticMaterial
+
+
+class TestReferenceIntegral:
+
+    @pytest.mark.parametrize("kind", ['phi_phi', 'gphi_phi', 'gphi_gphi'])
+    def test_quadrature_and_symbolic(self, kind, tmp_path, monkeypatch):
+        monkeypatch.setenv('FEALPY_CACHE_DIR', str(tmp_path))
+        clear_reference_cache()
+        M = reference_integral(kind, 2, 1, TD=2)
+        S = reference_integral(kind, 2, 1, TD=2, exact=True)
+        np.testing.assert_allclose(M, S, atol=1e-14)
+        assert reference_integral(kind, 2, 1, TD=2) is M
+        assert not M.flags.writeable
+
+        # The symbolic results are served from the disk in new processes.
+        files = os.listdir(tmp_path)
+        assert len(files) == 1 and files[0].startswith(kind)
+        clear_reference_cache()
+        np.testing.assert_array_equal(reference_integral(kind, 2, 1, TD=2, exact=True), S)
+        clear_reference_cache(disk=True)
+        assert os.listdir(tmp_path) == []
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            reference_integral('phi_gphi', 1)
+
+
+class TestLinearElasticIntegrator:
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("p", [1, 3])
+    @pytest.mark.parametrize("shape", [(2, -1), (-1, 2)])
+    def test_symbolic_assembly(self, backend, p, shape):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=2, ny=2)
+        space = TensorFunctionSpace(LagrangeFESpace(mesh, p), shape=shape)
+        material = LinearElasticMaterial('material', elastic_modulus=1.0,
+                                         poisson_ratio=0.3, hypo='plane_stress')
+        KK = LinearElasticIntegrator(material, q=p+2, method='symbolic')(space)
+        expected = LinearElasticIntegrator(material, q=p+2)(space)
+        np.testing.assert_allclose(bm.to_numpy(KK), bm.to_numpy(expected), atol=1e-13)
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from fealpy.backend import backend_manager as bm
+
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import LinearForm, ScalarSourceIntegrator
+from fealpy.decorator import cartesian
+
+
+class TestLinearFormInterface:
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_assembly(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=8, ny=8)
+        space = LagrangeFESpace(mesh, 2)
+
+        @cartesian
+        def source(p):
+            return bm.sin(p[..., 0]) * p[..., 1]
+
+        lform = LinearForm(space)
+        lform.add_integrator(ScalarSourceIntegrator(source), splitter=30)
+        lform.add_integrator(ScalarSourceIntegrator(2.0) + ScalarSourceIntegrator(source))
+        F = lform.assembly()
+        F_coo = lform.assembly(format='coo')
+
+        assert F.shape == (space.number_of_global_dofs(), )
+        np.testing.assert_allclose(bm.to_numpy(F), bm.to_numpy(F_coo.to_dense()), atol=1e-14)
+        np.testing.assert_allclose(float(bm.sum(F)), 2.0 + 2 * (1 - np.cos(1)) / 2, rtol=1e-10)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_keep_data(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=8, ny=8)
+        space = LagrangeFESpace(mesh, 2)
+        t = [0.0]
+
+        @cartesian
+        def source(p):
+            return bm.sin(p[..., 0] + t[0]) * p[..., 1]
+
+        lform = LinearForm(space).keep_data()
+        integrator = ScalarSourceIntegrator(source)
+        lform.add_integrator(integrator)
+        lform.add_integrator(ScalarSourceIntegrator(1.0), splitter=50)
+        lform.assembly()
+        assert lform._scatter is not None
+        assert integrator._keep_data
+
+        # Only the source is evaluated again for a new time step.
+        t[0] = 1.0
+        F = lform.assembly()
+        expected = LinearForm(space)
+        expected.add_integrator(ScalarSourceIntegrator(source))
+        expected.add_integrator(ScalarSourceIntegrator(1.0), splitter=50)
+        np.testing.assert_allclose(bm.to_numpy(F), bm.to_numpy(expected.assembly()), atol=1e-14)
+
+        lform.keep_data(False)
+        assert lform._scatter is None
+        assert not integrator._keep_data
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_keep_data_mismatch(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=8, ny=8)
+        space = LagrangeFESpace(mesh, 1)
+        lform = LinearForm(space).keep_data()
+        lform.add_integrator(ScalarSourceIntegrator(1.0), splitter=50)
+        lform.assembly()
+        scatter = lform._scatter
+        assert len(scatter) == 3
+
+        # Kept relationships for fewer or more chunks than the tasks.
+        for wrong in (scatter[:-1], scatter + scatter[:1]):
+            lform._scatter = wrong
+            with pytest.raises(RuntimeError):
+                lform.assembly()
@@ -4,6 +4,7 @@ import pytest
 
 from fealpy.backend import backend_manager as bm
 from fealpy.mesh.triangle_mesh import TriangleMesh
+from fealpy.mesh import QuadrangleMesh, HexahedronMesh
 from fealpy.functionspace import LagrangeFESpace
 from fealpy.fem.scalar_diffusion_integrator import ScalarDiffusionIntegrator
 
@@ -22,6 +23,64 @@ class TestScalarDiffusionIntegrator:
         assembly_cell_matrix = integrator.assembly(space)
         np.testing.assert_array_almost_equal(assembly_cell_matrix ,data["assembly_cell_matrix"], 
                                      err_msg=f" `assembly_cell_matrix` function is not equal to real result in backend {backend}")
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_fast_assembly(self, backend):
+        bm.set_backend(backend)
+
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], 3, 3)
+        space = LagrangeFESpace(mesh, 3)
+        NC = mesh.number_of_cells()
+        coef = bm.arange(1, NC+1, dtype=bm.float64)
+        for c in [None, 2.0, coef]:
+            expected = ScalarDiffusionIntegrator(c, 5).assembly(space)
+            result = ScalarDiffusionIntegrator(c, 5, method='fast')(space)
+            np.testing.assert_allclose(bm.to_numpy(result), bm.to_numpy(expected), atol=1e-12)
+
+        # Coefficients varying in cells fall back to the general assembly.
+        def func(p):
+            return 1 + p[..., 0]**2
+        func.coordtype = 'cartesian'
+        expected = ScalarDiffusionIntegrator(func, 5).assembly(space)
+        result = ScalarDiffusionIntegrator(func, 5, method='fast')(space)
+        np.testing.assert_allclose(bm.to_numpy(result), bm.to_numpy(expected), atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_sumfac_assembly(self, backend):
+        bm.set_backend(backend)
+
+        def func(p):
+            return 1 + p[..., 0]**2
+        func.coordtype = 'cartesian'
+
+        for mesh in [QuadrangleMesh.from_box([0, 1, 0, 2], 3, 2),
+                     HexahedronMesh.from_box([0, 1, 0, 1, 0, 2], 2, 2, 2)]:
+            space = LagrangeFESpace(mesh, 3)
+            NC = mesh.number_of_cells()
+            coef = bm.arange(1, NC+1, dtype=bm.float64)
+            for c in [None, 2.0, coef, func]:
+                expected = ScalarDiffusionIntegrator(c, 5).assembly(space)
+                integrator = ScalarDiffusionIntegrator(c, 5, method='sumfac')
+                result = integrator(space)
+                np.testing.assert_allclose(bm.to_numpy(result), bm.to_numpy(expected), atol=1e-12)
+
+                op = integrator.local_operator(space)
+                u = bm.asarray(np.random.rand(NC, result.shape[-1]))
+                np.testing.assert_allclose(bm.to_numpy(op(u)),
+                                           bm.to_numpy(bm.einsum('cij, cj -> ci', expected, u)),
+                                           atol=1e-12)
+                np.testing.assert_allclose(bm.to_numpy(op.diagonal()),
+                                           bm.to_numpy(bm.einsum('cii -> ci', expected)),
+                                           atol=1e-12)
+
+        # Simplex meshes fall back to the general assembly.
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], 3, 3)
+        space = LagrangeFESpace(mesh, 2)
+        integrator = ScalarDiffusionIntegrator(2.0, method='sumfac')
+        assert integrator.local_operator(space) is None
+        np.testing.assert_allclose(bm.to_numpy(integrator(space)),
+                                   bm.to_numpy(ScalarDiffusionIntegrator(2.0).assembly(space)), atol=1e-12)
+
 if __name__ == "__main__":
     #pytest.main(['test_lagrange_fe_space.py', "-q", "-k","test_basis", "-s"])
     pytest.main(['test_scalar_diffusion_integrator.py', "-q"])   
\ No newline at end of file
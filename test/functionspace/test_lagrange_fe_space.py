@@ -103,6 +103,35 @@ class TestLagrangeFiniteElementSpace:
                                      err_msg=f" `b` function is not equal to real result in backend {backend}")
 
 
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_dof_cache(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], 2, 2)
+        space = LagrangeFESpace(mesh, 2)
+
+        cell2dof = space.cell_to_dof()
+        assert space.cell_to_dof() is cell2dof
+        if backend == 'numpy':
+            assert not cell2dof.flags.writeable
+        index = bm.arange(3, 6)
+        np.testing.assert_array_equal(bm.to_numpy(space.cell_to_dof(index)),
+                                      bm.to_numpy(mesh.cell_to_ipoint(2, index=index)))
+        np.testing.assert_array_equal(bm.to_numpy(space.face_to_dof()),
+                                      bm.to_numpy(mesh.face_to_ipoint(2)))
+
+        isBdDof = space.is_boundary_dof()
+        isBdDof[:] = False # the cached flag is not affected
+        assert bm.sum(space.is_boundary_dof()) == 16
+        isLeftDof = space.is_boundary_dof(threshold=lambda p: p[..., 0] < 1e-12)
+        assert bm.sum(isLeftDof) == 5
+        assert len(space.dof._cache()) == 3 # the maps and the whole boundary
+
+        # The maps are rebuilt after the topology changes.
+        mesh.uniform_refine()
+        np.testing.assert_array_equal(bm.to_numpy(space.cell_to_dof()),
+                                      bm.to_numpy(mesh.cell_to_ipoint(2)))
+        assert space.is_boundary_dof().shape == (space.number_of_global_dofs(), )
+        assert bm.sum(space.is_boundary_dof()) == 32
 
 
 
@@ -0,0 +1,115 @@
+"""Tests of ParallelMesh, run by `mpirun -n 4 python test_parallel_mesh.py <backend>`
+in subprocesses."""
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+NPROCS = 4
+
+
+def _partitioned_mesh(comm, backend):
+    from fealpy.backend import backend_manager as bm
+    from fealpy.mesh import QuadrangleMesh
+    from fealpy.mesh.parallel import ParallelMesh, split_homogeneous_mesh
+
+    bm.set_backend(backend)
+    RANK, SIZE = comm.Get_rank(), comm.Get_size()
+    full_mesh = QuadrangleMesh.from_box([-1, 1, -1, 1], nx=12, ny=10)
+
+    if RANK == 0:
+        NC = full_mesh.number_of_cells()
+        step = NC // SIZE + 1
+        ranges = [bm.arange(i*step, min((i+1)*step, NC), dtype=full_mesh.itype)
+                  for i in range(SIZE)]
+        data_list = list(split_homogeneous_mesh(full_mesh, masks=ranges))
+    else:
+        data_list = None
+
+    data = comm.scatter(data_list, root=0)
+    return full_mesh, ParallelMesh(RANK, *data, comm=comm)
+
+
+def _node_integral(mesh):
+    from fealpy.backend import backend_manager as bm
+
+    val = mesh.entity_measure('cell')
+    integral_on_node = bm.zeros((mesh.number_of_nodes(), ), dtype=mesh.ftype)
+    for local_node in range(mesh.cell.shape[1]):
+        integral_on_node = bm.index_add(integral_on_node, mesh.cell[:, local_node], val)
+    return integral_on_node
+
+
+def run(backend):
+    from mpi4py import MPI
+    from fealpy.backend import backend_manager as bm
+
+    comm = MPI.COMM_WORLD
+    full_mesh, pmesh = _partitioned_mesh(comm, backend)
+    gidx = pmesh.global_indices('node')
+    real = pmesh.real_flag('node')
+    expected = _node_integral(full_mesh)[gidx]
+    halo = pmesh.Make_halo('node')
+    assert pmesh.Make_halo('node') is halo
+    assert halo.number_of_ghosts() == int(bm.sum(~real))
+    assert comm.Get_rank() not in halo.neighbors()
+
+    # Update: ghosts get the values of their owners.
+    data = bm.where(real, gidx, -1)
+    data = pmesh.Update_ghost('node', data)
+    assert bm.all(data == gidx)
+    vec = bm.stack([gidx, 2*gidx], axis=-1) * bm.astype(real, gidx.dtype)[:, None]
+    assert bm.all(pmesh.Update_ghost('node', vec) == bm.stack([gidx, 2*gidx], axis=-1))
+
+    # Accumulate, then update with the communication overlapped.
+    local = _node_integral(pmesh)
+    result = pmesh.Accumulate_ghost('node', bm.copy(local))
+    assert bm.allclose(result[real], expected[real])
+    halo.update_begin(result)
+    doubled = 2 * result[real] # local work
+    result = halo.update_end(result)
+    assert bm.allclose(result, expected)
+    assert bm.allclose(doubled, 2 * expected[real])
+    with pytest.raises(RuntimeError):
+        halo.update_end(result)
+
+    # Received values of an accumulation, not added yet.
+    halo.accumulate_begin(local)
+    recv = bm.copy(halo.accumulate_recv())
+    added = bm.index_add(bm.copy(local), halo.shared_index, recv)
+    assert bm.allclose(added[real], expected[real])
+
+    # Converge and Broadcast on boundary data.
+    bdry = pmesh.boundary_node_flag()
+    converged = local
+    for i, message in enumerate(pmesh.Converge('node', local[bdry])):
+        if message is None:
+            assert i == pmesh._id
+            continue
+        value, index = message
+        converged = bm.index_add(converged, index, value)
+    assert bm.allclose(converged[real], expected[real])
+    on_bdry = pmesh.Broadcast('node', bm.copy(converged[bdry]))
+    assert bm.allclose(on_bdry, expected[bdry])
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_halo_exchange(backend):
+    pytest.importorskip('mpi4py')
+    mpirun = shutil.which('mpirun')
+    if mpirun is None:
+        pytest.skip('mpirun is not found.')
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    args = [mpirun, '-n', str(NPROCS)]
+    if hasattr(os, 'geteuid') and os.geteuid() == 0:
+        args.append('--allow-run-as-root')
+    args += ['--oversubscribe', sys.executable, __file__, backend]
+    result = subprocess.run(args, env=env, capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stderr
+
+
+if __name__ == '__main__':
+    run(sys.argv[1])
@@ -186,6 +186,60 @@ class TestTetrahedronMeshInterfaces:
         face2cell = mesh.face_to_cell()
         np.testing.assert_array_equal(bm.to_numpy(face2cell), data["face2cell"])
 
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_shape_function_tabulation(self, backend):
+        bm.set_backend(backend)
+        mesh = TetrahedronMesh.from_box(box=[0, 1, 0, 1, 0, 1], nx=1, ny=1, nz=1)
+        bcs, _ = mesh.quadrature_formula(4).get_quadrature_points_and_weights()
+        phi = mesh.shape_function(bcs, p=3)
+        gphi = mesh.grad_shape_function(bcs, p=3)
+        np.testing.assert_allclose(bm.to_numpy(phi), bm.to_numpy(bm.simplex_shape_function(bcs, 3)))
+        np.testing.assert_allclose(bm.to_numpy(gphi), bm.to_numpy(bm.simplex_grad_shape_function(bcs, 3)))
+
+        # The same quadrature rule from a new formula object hits the cache.
+        bcs2, _ = mesh.quadrature_formula(4).get_quadrature_points_and_weights()
+        assert bcs2 is bcs
+        if backend == 'numpy':
+            assert mesh.shape_function(bcs, p=3) is phi
+            assert mesh.grad_shape_function(bcs, p=3) is gphi
+            assert not phi.flags.writeable
+        else:
+            # Tables are cloned on backends without read-only tensors.
+            phi[:] = 0.
+            np.testing.assert_allclose(bm.to_numpy(mesh.shape_function(bcs, p=3)),
+                                       bm.to_numpy(bm.simplex_shape_function(bcs, 3)))
+        assert mesh.shape_function(bcs, p=2).shape != phi.shape
+
+        # Linear shape functions do not share memory with the points.
+        phi = mesh.shape_function(bcs, p=1)
+        np.testing.assert_allclose(bm.to_numpy(phi), bm.to_numpy(bcs))
+        assert phi is not bcs
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_point_to_bc(self, backend):
+        bm.set_backend(backend)
+        mesh = TetrahedronMesh.from_box(box=[0, 1, 0, 1, 0, 1], nx=2, ny=2, nz=2)
+        NC = mesh.number_of_cells()
+        bc = bm.tensor([0.1, 0.2, 0.3, 0.4], dtype=bm.float64)
+        points = mesh.bc_to_point(bc).reshape(NC, -1)
+        points = bm.concat([points, bm.tensor([[0.5, -0.5, 0.5]], dtype=bm.float64)], axis=0)
+
+        cell, bcs = mesh.point_to_bc(points)
+        np.testing.assert_array_equal(bm.to_numpy(cell[:NC]), np.arange(NC))
+        np.testing.assert_allclose(bm.to_numpy(bcs[:NC]), np.broadcast_to(bm.to_numpy(bc), (NC, bc.shape[-1])), atol=1e-12)
+        assert cell[-1] == -1
+
+        # Walking from neighboring cells gives the same results.
+        start = bm.astype((bm.arange(NC) + 1) % NC, cell.dtype)
+        cell2, _ = mesh.point_to_bc(points[:NC], start=start)
+        np.testing.assert_array_equal(bm.to_numpy(cell2), np.arange(NC))
+
+        # The index is rebuilt after refinement.
+        mesh.uniform_refine()
+        NC = mesh.number_of_cells()
+        points = mesh.bc_to_point(bc).reshape(NC, -1)
+        np.testing.assert_array_equal(bm.to_numpy(mesh.location(points)), np.arange(NC))
+
     @pytest.mark.parametrize("backend", ["numpy", "pytorch"])
     @pytest.mark.parametrize("data", circumcenter)
     def test_circumcenter(self, data, backend):
@@ -143,6 +143,52 @@ class TestTriangleMeshInterfaces:
         np.testing.assert_allclose(bm.to_numpy(face2cell), data["face2cell"], atol=1e-14)
         np.testing.assert_allclose(bm.to_numpy(cell2edge), data["cell2edge"], atol=1e-14)
 
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_point_to_bc(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=4, ny=4)
+        NC = mesh.number_of_cells()
+        bc = bm.tensor([0.2, 0.3, 0.5], dtype=bm.float64)
+        points = mesh.bc_to_point(bc).reshape(NC, -1)
+        points = bm.concat([points, bm.tensor([[1.5, 0.5]], dtype=bm.float64)], axis=0)
+
+        cell, bcs = mesh.point_to_bc(points)
+        np.testing.assert_array_equal(bm.to_numpy(cell[:NC]), np.arange(NC))
+        np.testing.assert_allclose(bm.to_numpy(bcs[:NC]), np.broadcast_to(bm.to_numpy(bc), (NC, bc.shape[-1])), atol=1e-12)
+        assert cell[-1] == -1
+
+        # Walking from neighboring cells gives the same results.
+        start = bm.astype((bm.arange(NC) + 1) % NC, cell.dtype)
+        cell2, _ = mesh.point_to_bc(points[:NC], start=start)
+        np.testing.assert_array_equal(bm.to_numpy(cell2), np.arange(NC))
+
+        # The index is rebuilt after refinement.
+        mesh.uniform_refine()
+        NC = mesh.number_of_cells()
+        points = mesh.bc_to_point(bc).reshape(NC, -1)
+        np.testing.assert_array_equal(bm.to_numpy(mesh.location(points)), np.arange(NC))
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_is_crossed_cell(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 10, 0, 10], nx=7, ny=9)
+        point = bm.tensor([[1.1, 1.3], [8.7, 6.2], [0.5, 9.5], [9.5, 0.5],
+                           [5.0, 0.0], [5.0, 10.0]], dtype=bm.float64)
+        segment = bm.tensor([[0, 1], [2, 3], [4, 5]], dtype=bm.int32)
+        flag = mesh.is_crossed_cell(point, segment)
+
+        # Test all pairs of segments and cells.
+        node, cell = mesh.entity('node'), mesh.entity('cell')
+        NS, NC = segment.shape[0], cell.shape[0]
+        sid = bm.repeat(bm.arange(NS), NC)
+        cid = bm.tile(bm.arange(NC), (NS, ))
+        expected = mesh._is_segment_crossing_cell(point[segment[sid]], node[cell[cid]])
+        expected = bm.any(expected.reshape(NS, NC), axis=0)
+        np.testing.assert_array_equal(bm.to_numpy(flag), bm.to_numpy(expected))
+
+        mesh.bisect(flag)
+        assert mesh.number_of_cells() > NC
+
     @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
     @pytest.mark.parametrize("data", jacobian_matrix_data)
     def test_jacobian_matrix(self, data, backend):
@@ -375,6 +421,46 @@ class TestTriangleMeshInterfaces:
         np.testing.assert_array_equal(bm.to_numpy(face2cell), data["face2cell"])
         np.testing.assert_allclose(u , data['u'])
 
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_bisect_topology(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+
+        def check(mesh):
+            cell = bm.to_numpy(mesh.entity('cell'))
+            edge = bm.to_numpy(mesh.entity('edge'))
+            cell2edge = bm.to_numpy(mesh.cell_to_edge())
+            edge2cell = bm.to_numpy(mesh.edge_to_cell())
+            localEdge = bm.to_numpy(mesh.localEdge)
+            # Edges are numbered differently, but the topology is the same as
+            # the one constructed from scratch.
+            ref = TriangleMesh(mesh.entity('node'), mesh.entity('cell'))
+            redge = bm.to_numpy(ref.entity('edge'))
+            key = {tuple(e): i for i, e in enumerate(np.sort(redge, axis=-1).tolist())}
+            perm = np.array([key[tuple(e)] for e in np.sort(edge, axis=-1).tolist()])
+            assert edge.shape == redge.shape
+            np.testing.assert_array_equal(edge, redge[perm])
+            np.testing.assert_array_equal(edge2cell, bm.to_numpy(ref.edge_to_cell())[perm])
+            np.testing.assert_array_equal(perm[cell2edge], bm.to_numpy(ref.cell_to_edge()))
+            np.testing.assert_array_equal(edge, cell[edge2cell[:, 0:1], localEdge[edge2cell[:, 2]]])
+
+        edge0 = bm.to_numpy(mesh.entity('edge'))
+        NC = mesh.number_of_cells()
+        isMarkedCell = bm.zeros(NC, dtype=bm.bool)
+        isMarkedCell = bm.set_at(isMarkedCell, slice(0, NC, 7), True)
+        mesh.bisect(isMarkedCell, options={'disp': False})
+        check(mesh)
+        # Edges of untouched cells keep their indices.
+        edge = bm.to_numpy(mesh.entity('edge'))
+        assert np.sum(np.all(edge[:len(edge0)] == edge0, axis=-1)) > len(edge0) // 2
+
+        mesh.bisect(None, options={'disp': False})
+        check(mesh)
+        NC = mesh.number_of_cells()
+        mesh.coarsen(bm.ones(NC, dtype=bm.bool))
+        check(mesh)
+        assert mesh.number_of_cells() < NC
+
     @pytest.mark.parametrize("backend", ['numpy', 'pytorch', 'jax'])
     @pytest.mark.parametrize("data", mesh_feom_domain_data)
     def test_mesh_feom_domain(self, data, backend):
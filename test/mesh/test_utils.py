@@ -3,7 +3,7 @@ import pytest
 
 import numpy as np
 from fealpy.backend import backend_manager as bm
-from fealpy.mesh.utils import inverse_relation
+from fealpy.mesh.utils import inverse_relation, flocc, pack_rows, sort_rows
 
 inverse_relation_with_index_data = [
     {
@@ -62,3 +62,31 @@ def test_inverse_relation_with_flag(data, backend):
     assert bm.all(bm.equal(row, bm.from_numpy(data['row'])))
     assert bm.all(bm.equal(col, bm.from_numpy(data['col'])))
     assert spshape == data['spshape']
+
+
+def _flocc_reference(array):
+    _, i0, j = np.unique(array, axis=0, return_index=True, return_inverse=True)
+    _, last = np.unique(array[::-1], axis=0, return_index=True)
+    return i0, array.shape[0] - 1 - last, j.reshape(-1)
+
+
+@pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+@pytest.mark.parametrize('ncols', [2, 3, 4])
+@pytest.mark.parametrize('workers', [None, 3])
+def test_flocc(backend, ncols, workers):
+    bm.set_backend(backend)
+    rng = np.random.default_rng(0)
+    data = np.sort(rng.integers(0, 12, (500, ncols)), axis=1)
+    expected = _flocc_reference(data)
+
+    array = bm.from_numpy(data)
+    assert bm.all(bm.equal(sort_rows(bm.from_numpy(data[:, ::-1].copy())), array))
+    for result, value in zip(flocc(array, workers=workers), expected):
+        np.testing.assert_array_equal(bm.to_numpy(result), value)
+
+    assert len(pack_rows(array)) == 1
+    # Rows not fitting in one int64 key are packed into several keys.
+    big = data.astype(np.int64) * 2**40
+    assert len(pack_rows(bm.from_numpy(big))) == ncols
+    for result, value in zip(flocc(bm.from_numpy(big), workers=workers), expected):
+        np.testing.assert_array_equal(bm.to_numpy(result), value)
@@ -0,0 +1,76 @@
+
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator
+from fealpy.solver import (
+    cg,
+    TriangularSolver,
+    JacobiPreconditioner,
+    BlockJacobiPreconditioner,
+    SSORPreconditioner
+)
+
+
+def _get_system(p=2, n=8):
+    mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=n, ny=n)
+    space = LagrangeFESpace(mesh, p=p)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator(q=p+2))
+    bform.add_integrator(ScalarMassIntegrator(q=p+2))
+    A = bform.assembly()
+    x = bm.sin(bm.arange(A.shape[0], dtype=bm.float64))
+    return A, x, A @ x
+
+
+class TestConjugateGradient:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_triangular_solver(self, backend):
+        bm.set_backend(backend)
+        A, x, _ = _get_system()
+        dense = A.to_dense()
+        D = bm.eye(A.shape[0], dtype=bm.float64) * A.diagonal()[None, :]
+
+        L = bm.tril(dense, k=-1) + D
+        solver = TriangularSolver(A, lower=True)
+        assert bm.allclose(L @ solver.solve(x), x)
+
+        U = bm.triu(dense, k=1) + D / 1.5
+        solver = TriangularSolver(A, lower=False, omega=1.5)
+        X = bm.stack([x, 2*x], axis=1)
+        assert bm.allclose(U @ solver.solve(X), X)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_preconditioned(self, backend):
+        bm.set_backend(backend)
+        A, x, b = _get_system()
+        x_cg, info = cg(A, b, rtol=1e-10, returninfo=True)
+        assert bm.allclose(x_cg, x, atol=1e-6)
+        assert info['niter'] == len(info['residual']) - 1
+
+        for M in [JacobiPreconditioner(A),
+                  BlockJacobiPreconditioner(A, blocks=bm.reshape(bm.arange(40), (10, 4))),
+                  SSORPreconditioner(A, omega=1.2)]:
+            x_pcg, pinfo = cg(A, b, rtol=1e-10, M=M, returninfo=True)
+            assert bm.allclose(x_pcg, x, atol=1e-6)
+            assert bool(pinfo['converged'])
+
+        _, pinfo = cg(A, b, rtol=1e-10, M=SSORPreconditioner(A), returninfo=True)
+        assert pinfo['niter'] < info['niter']
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_batched(self, backend):
+        bm.set_backend(backend)
+        A, x, b = _get_system(p=1)
+        # The zero column converges at once, and must stay unchanged.
+        B = bm.stack([b, 3*b, bm.zeros_like(b)], axis=0)
+        X, info = cg(A, B, batch_first=True, rtol=1e-10,
+                     M=JacobiPreconditioner(A), returninfo=True)
+        assert X.shape == B.shape
+        assert bm.allclose(X[0], x, atol=1e-6)
+        assert bm.allclose(X[1], 3*x, atol=1e-6)
+        assert bm.all(X[2] == 0.)
+        assert bm.all(info['converged'])
+        assert info['residual'][0].shape == (3, )
@@ -4,7 +4,7 @@ import pytest
 import scipy.sparse as sp
 
 from fealpy.backend import backend_manager as bm
-from fealpy.solver import spsolve
+from fealpy.solver import spsolve, factorize
 from fealpy.sparse import COOTensor, CSRTensor
 
 class TestDirectSolver:
@@ -50,6 +50,60 @@ class TestDirectSolver:
         assert self._check_solution(x0, x), "Pytorch GPU test failed!!!!!!!!!!!!!!!!!!!!!!!!"
         print("Pytorch GPU test passed!")
 
+
+class TestDirectSolverFactorize:
+    def _get_data(self):
+        A = sp.rand(10, 10, density=0.3) + 10*sp.eye(10)
+        A = COOTensor.from_scipy(A.tocoo())
+        X = bm.tensor(np.random.rand(10, 3))
+        return A, X
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('solver_type', ['scipy', 'mumps'])
+    def test_factorize(self, backend, solver_type):
+        bm.set_backend(backend)
+        A, X = self._get_data()
+        solver = factorize(A, solver=solver_type)
+
+        assert bm.allclose(solver.solve(A @ X[:, 0]), X[:, 0])
+        assert bm.allclose(solver.solve(A @ X), X)
+
+        # Same pattern with new values, and duplicated entries.
+        A2 = COOTensor(bm.concat([A.indices, A.indices], axis=1),
+                       bm.concat([A.values, 2*A.values]), A.shape)
+        solver.update(A2)
+        assert bm.allclose(solver @ (3 * (A @ X)), X)
+
+        solver.refactor(bm.concat([A.values, A.values]))
+        assert bm.allclose(solver @ (2 * (A @ X)), X)
+
+        solver.release()
+        assert not solver.is_factorized
+        with pytest.raises(RuntimeError):
+            solver.solve(A @ X)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('solver_type', ['scipy', 'mumps'])
+    def test_factorize_complex(self, backend, solver_type):
+        bm.set_backend(backend)
+        A = sp.rand(10, 10, density=0.3) + 10*sp.eye(10)
+        Ac = (A + 1j * sp.rand(10, 10, density=0.3)).tocoo()
+        X = np.random.rand(10, 3) + 1j * np.random.rand(10, 3)
+
+        solver = factorize(COOTensor.from_scipy(Ac), solver=solver_type)
+        x = solver.solve(bm.tensor(Ac @ X))
+        np.testing.assert_allclose(bm.to_numpy(x), X, atol=1e-12)
+        x = solver.solve(bm.tensor(Ac @ X.real))
+        np.testing.assert_allclose(bm.to_numpy(x), X.real, atol=1e-12)
+
+        # Complex right-hand sides of real matrices.
+        solver = factorize(COOTensor.from_scipy(A.tocoo()), solver=solver_type)
+        x = solver.solve(bm.tensor(A @ X))
+        np.testing.assert_allclose(bm.to_numpy(x), X, atol=1e-12)
+        x = solver.solve(bm.tensor((A @ X.real).astype(np.float32)))
+        assert x.dtype == bm.float32
+
+
 if __name__ == '__main__':
     test = TestDirectSolver()
     #test.test_cpu('numpy', 'scipy')
@@ -4,12 +4,15 @@ import numpy as np
 from fealpy.backend import backend_manager as bm
 from fealpy.mesh.triangle_mesh import TriangleMesh
 from fealpy.solver import GAMGSolver 
+from fealpy.solver.amg_coarsen import ruge_stuben_chen_coarsen
+from fealpy.solver.smoother import ChebyshevSmoother
 from fealpy.functionspace import LagrangeFESpace
 from fealpy.fem import (
-        BilinearForm, ScalarDiffusionIntegrator,LinearForm,DirichletBC
+        BilinearForm, ScalarDiffusionIntegrator,LinearForm,DirichletBC,
+        ScalarSourceIntegrator
     )
 from fealpy.sparse import csr_matrix
-from fealpy.solver import spsolve
+from fealpy.solver import spsolve, cg
 from gamg_solver_data import * 
 
 
@@ -122,6 +125,72 @@ class TestGAMGSolverInterfaces:
         assert solver is not None
 
 
+class TestGAMGSolverSetup:
+    def poisson_system(self, n=32):
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=n, ny=n)
+        space = LagrangeFESpace(mesh, p=1)
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(q=3))
+        lform = LinearForm(space)
+        lform.add_integrator(ScalarSourceIntegrator(1.0, q=3))
+        A, b = bform.assembly(), lform.assembly()
+        return DirichletBC(space, gd=0.).apply(A, b)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("itype", ['T', 'S'])
+    def test_setup(self, itype, backend):
+        bm.set_backend(backend)
+        A, b = self.poisson_system()
+        solver = GAMGSolver(itype=itype, csize=20)
+        solver.setup(A)
+
+        NL = len(solver.A)
+        assert NL >= 2
+        assert len(solver.P) == NL - 1
+        for l in range(NL - 1):
+            assert solver.P[l].shape == (solver.A[l].shape[0], solver.A[l+1].shape[0])
+            assert solver.A[l+1].shape[0] < solver.A[l].shape[0]
+
+        x, info = cg(A, b, rtol=1e-10, returninfo=True)
+        y, pinfo = cg(A, b, rtol=1e-10, M=solver, returninfo=True)
+        assert pinfo['niter'] < info['niter'] // 2
+        assert bm.allclose(x, y, atol=1e-8)
+        assert bm.allclose(solver.solve(b), x, atol=1e-6)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_coarsen_deterministic(self, backend):
+        bm.set_backend(backend)
+        A, _ = self.poisson_system(n=16)
+        A = A.tocsr()
+        isC, _ = ruge_stuben_chen_coarsen(A)
+        isC1, _ = ruge_stuben_chen_coarsen(A)
+        assert bm.all(isC == isC1)
+        assert 0 < int(bm.sum(isC)) < A.shape[0]
+
+        S0, S1 = ChebyshevSmoother(A), ChebyshevSmoother(A)
+        assert S0.theta == S1.theta and S0.delta == S1.delta
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("stype", ['GS', 'J', 'C'])
+    @pytest.mark.parametrize("ptype", ['V', 'W', 'F'])
+    @pytest.mark.parametrize("csolver", ['direct', 'CG'])
+    def test_cycles(self, csolver, ptype, stype, backend):
+        bm.set_backend(backend)
+        A, b = self.poisson_system(n=16)
+        solver = GAMGSolver(itype='S', stype=stype, ptype=ptype, csolver=csolver,
+                            csize=20, rtol=1e-10, atol=1e-14)
+        solver.setup(A)
+        x = cg(A, b, rtol=1e-10)
+
+        # Cycles as stationary iterations reduce the residual.
+        e = solver @ b
+        assert bm.sum((b - A @ e)**2) < 0.25 * bm.sum(b**2)
+
+        y, info = cg(A, b, rtol=1e-10, M=solver, returninfo=True)
+        assert bm.all(info['converged'])
+        assert bm.allclose(x, y, atol=1e-8)
+
+
 if __name__ == "__main__":
     # pytest.main(["./test_gamg_solver.py",'-k' ,"test_vcycle"])
     test = TestGAMGSolverInterfaces()
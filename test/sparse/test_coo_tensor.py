@@ -297,6 +297,26 @@ class TestCOOTensorMatmul():
         csr3 = csr1 @ csr2
         assert bm.allclose(csr3.toarray(), m3)
 
+    @pytest.mark.parametrize("backend", ['numpy'])
+    def test_matmul_batched(self, backend):
+        bm.set_backend(backend)
+        # Unsorted and duplicated entries, with an empty row 1.
+        indices = bm.tensor([[3, 0, 2, 0, 3, 2],
+                             [1, 2, 0, 2, 3, 1]])
+        values = bm.tensor([[1, 2, 3, 4, 5, 6],
+                            [-1, 0, 2, 1, 3, -2]], dtype=bm.float64)
+        coo = COOTensor(indices, values, (4, 4))
+        dense = coo.to_dense()
+        x = bm.tensor([[1, 2], [3, -1], [0, 2], [1, 1]], dtype=bm.float64)
+
+        assert bm.allclose(coo @ x[:, 0], bm.einsum('bij, j -> bi', dense, x[:, 0]))
+        assert bm.allclose(coo @ x, dense @ x)
+
+        csr = coo.tocsr()
+        assert bm.allclose(csr.crow, bm.tensor([0, 2, 2, 4, 6], dtype=csr.crow.dtype))
+        assert bm.allclose(csr.to_dense(), dense)
+        assert bm.allclose(csr @ x, dense @ x)
+
 
 class TestCOOTensorConcat:
     @pytest.mark.parametrize("backend", ALL_BACKENDS)
@@ -79,6 +79,19 @@ def create_csr_tensor(crow, col, values, shape):
     return CSRTensor(crow=crow, col=col, values=values, spshape=shape)
 
 # CSRTensor.add 测试用例
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_diagonal(backend):
+    bm.set_backend(backend)
+    crow = bm.tensor([0, 2, 3, 5])
+    col = bm.tensor([0, 2, 0, 2, 2])
+    values = bm.tensor([[1, 2, 3, 4, 5], [6, 7, 8, 9, 10]], dtype=bm.float64)
+    csr = CSRTensor(crow, col, values, (3, 3))
+
+    diag = csr.diagonal()
+    assert diag.shape == (2, 3)
+    assert bm.allclose(diag, bm.tensor([[1, 0, 9], [6, 0, 19]], dtype=bm.float64))
+
+
 class TestCSRTensorAdd:
     @pytest.mark.parametrize("backend", ALL_BACKENDS)
     def test_add_csr_tensor(self, backend):
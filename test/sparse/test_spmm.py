@@ -2,7 +2,7 @@
 import pytest
 
 from fealpy.backend import backend_manager as bm
-from fealpy.sparse._spmm import spmm_coo
+from fealpy.sparse._spmm import spmm_coo, spmm_csr
 
 ALL_BACKENDS = ['numpy', 'pytorch']
 
@@ -140,3 +140,27 @@ def test_spmm_coo_invalid_spshape(backend):
     # Expect a ValueError to be raised
     with pytest.raises(ValueError):
         spmm_coo(indices, values, spshape, x)
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spmm_csr(backend):
+    bm.set_backend(backend)
+    # The second row is empty.
+    crow = bm.tensor([0, 3, 3, 6, 8])
+    col = bm.tensor([0, 2, 3, 0, 1, 3, 1, 3])
+    values = bm.tensor([1, 2, 4, 3, 2, 5, 5, -2], dtype=bm.float32)
+    spshape = (4, 4)
+    x = bm.tensor([[-1, -1, -1, -1, -1],
+                   [6, 9, 1, 2, 7],
+                   [2, 2, 2, 2, 1],
+                   [1, 8, 2, 2, 5]], dtype=bm.float32)
+
+    expected = bm.tensor([[7, 35, 11, 11, 21],
+                          [0, 0, 0, 0, 0],
+                          [14, 55, 9, 11, 36],
+                          [28, 29, 1, 6, 25]], dtype=bm.float32)
+
+    output = spmm_csr(crow, col, values, spshape, x)
+    assert bm.allclose(output, expected), f"Expected {expected} but got {output}"
+    output = spmm_csr(crow, col, values, spshape, x[:, 0])
+    assert bm.allclose(output, expected[:, 0]), f"Expected {expected[:, 0]} but got {output}"
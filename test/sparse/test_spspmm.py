@@ -2,8 +2,8 @@
 import pytest
 
 from fealpy.backend import backend_manager as bm
-from fealpy.sparse._spspmm import spspmm_coo
-from fealpy.sparse import COOTensor
+from fealpy.sparse._spspmm import spspmm_coo, spspmm_csr
+from fealpy.sparse import COOTensor, CSRTensor
 
 ALL_BACKENDS = ['numpy', 'pytorch']
 
@@ -47,5 +47,50 @@ def test_spspmm_coo_valid_input(backend):
 
     assert bm.allclose(result, expected)
 
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spspmm_csr_valid_input(backend):
+    bm.set_backend(backend)
+    # The same matrices as above, with an empty row in the left one.
+    crow1 = bm.tensor([0, 2, 3, 4, 4])
+    col1 = bm.tensor([0, 1, 1, 2])
+    values1 = bm.tensor([1., 3., 4., 2.], dtype=bm.float64)
+    spshape1 = (4, 3)
+
+    crow2 = bm.tensor([0, 1, 2, 3])
+    col2 = bm.tensor([1, 0, 0])
+    values2 = bm.tensor([2., 9., 3.], dtype=bm.float64)
+    spshape2 = (3, 2)
+
+    crow, col, values, output_shape = spspmm_csr(crow1, col1, values1, spshape1,
+                                                 crow2, col2, values2, spshape2)
+    assert output_shape == (4, 2)
+    assert bm.allclose(crow, bm.tensor([0, 2, 3, 4, 4], dtype=crow.dtype))
+    result = CSRTensor(crow, col, values, output_shape).to_dense()
+
+    expected = bm.tensor([[27., 2.],
+                          [36., 0.],
+                          [6., 0.],
+                          [0., 0.]], dtype=bm.float64)
+
+    assert bm.allclose(result, expected)
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spspmm_csr_random(backend):
+    bm.set_backend(backend)
+    A = bm.random.rand(20, 30)
+    A = bm.where(A > 0.8, A, 0.)
+    B = bm.random.rand(30, 10)
+    B = bm.where(B > 0.7, B, 0.)
+    A = COOTensor(bm.stack(bm.nonzero(A), axis=0), A[A > 0], A.shape).tocsr()
+    B = COOTensor(bm.stack(bm.nonzero(B), axis=0), B[B > 0], B.shape).tocsr()
+
+    crow, col, values, output_shape = spspmm_csr(A.crow, A.col, A.values, A.sparse_shape,
+                                                 B.crow, B.col, B.values, B.sparse_shape)
+    result = CSRTensor(crow, col, values, output_shape).to_dense()
+
+    assert bm.allclose(result, A.to_dense() @ B.to_dense())
+
+
 # Additional tests can be added here to cover more edge cases, different shapes,
 # or to ensure consistency with other matrix multiplication methods under various conditions.
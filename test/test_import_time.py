@@ -0,0 +1,56 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ['sympy', 'matplotlib', 'scipy.spatial', 'jax', 'torch']
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {package}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'elapsed': elapsed,
+    'loaded': [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def _import_in_subprocess(package: str):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    script = IMPORT_SCRIPT.format(package=package, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', script], env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestImportTime:
+    @pytest.mark.parametrize("package", ['fealpy.mesh', 'fealpy.functionspace',
+                                         'fealpy.fem', 'fealpy.solver'])
+    def test_import_time(self, package):
+        result = _import_in_subprocess(package)
+        print(f"import {package}: {result['elapsed']:.3f} s")
+        assert result['loaded'] == []
+
+    def test_lazy_attributes(self):
+        import fealpy.mesh
+        import fealpy.fem
+        from fealpy.mesh.triangle_mesh import TriangleMesh
+        from fealpy.fem.cell_source_integrator import CellSourceIntegrator
+
+        assert 'TriangleMesh' in dir(fealpy.mesh)
+        assert fealpy.mesh.TriangleMesh is TriangleMesh
+        assert fealpy.fem.SourceIntegrator is CellSourceIntegrator
+        assert fealpy.mesh.utils.__name__ == 'fealpy.mesh.utils'
+        with pytest.raises(AttributeError):
+            fealpy.mesh.NotAMesh
+
+    def test_lazy_import(self):
+        from fealpy._lazy import lazy_import
+        module = lazy_import('fealpy_module_not_installed')
+        with pytest.raises(ImportError):
+            module.anything
+        assert lazy_import('json') is json